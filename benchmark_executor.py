@@ -0,0 +1,282 @@
+"""
+Benchmark jalur eksekusi dengan fake PowerFactory (tanpa lisensi, jalan di Linux)
+
+Mengukur throughput generate skrip, overhead compile/exec, biaya spawn
+subprocess dan throughput export, lalu menulis hasil sebagai JSON supaya
+regresi di jalur-jalur ini bisa dibandingkan antar commit. Dengan --compare
+hasil dibandingkan terhadap baseline tersimpan dan exit code 1 kalau ada
+benchmark yang lebih lambat dari threshold.
+
+Contoh:
+    python benchmark_executor.py --buses 1000 --iterations 50 --output results/benchmark.json
+    python benchmark_executor.py --attribute-latency 0.00001 --trace results/trace.json
+    python benchmark_executor.py --compare benchmark_baseline.json --threshold 0.5
+    python benchmark_executor.py --save-baseline benchmark_baseline.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+FAKE_PF_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake_powerfactory')
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+
+def measure(name, func, iterations, warmup=1, items=1):
+    """
+    Jalankan func berulang kali dan hitung statistik waktu
+
+    Args:
+        name: Nama benchmark
+        func: Callable tanpa argumen (output stdout disembunyikan)
+        iterations: Jumlah pengukuran
+        warmup: Jumlah run awal yang tidak diukur
+        items: Jumlah item yang diproses per panggilan (untuk per_second)
+
+    Returns:
+        Dict hasil benchmark
+    """
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        for _ in range(warmup):
+            func()
+
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+            sink.seek(0)
+            sink.truncate()
+
+    total = sum(timings)
+    result = {
+        'name': name,
+        'iterations': iterations,
+        'items': items,
+        'total': total,
+        'mean': total / iterations,
+        'median': statistics.median(timings),
+        'min': min(timings),
+        'max': max(timings),
+        'per_second': (items * iterations / total) if total > 0 else None,
+    }
+    print(f"  {name:<32} mean {result['mean'] * 1000:>9.3f} ms   "
+          f"{result['per_second'] or 0:>12.1f} items/s")
+    return result
+
+
+def run_benchmarks(args):
+    """Jalankan semua benchmark, return list hasil"""
+    # Fake module untuk in-process dan subprocess (via PYTHONPATH + env config)
+    os.environ['FAKE_PF_BUSES'] = str(args.buses)
+    os.environ['FAKE_PF_ATTRIBUTE_LATENCY'] = str(args.attribute_latency)
+    os.environ['FAKE_PF_EXECUTE_LATENCY'] = str(args.execute_latency)
+    pythonpath = os.environ.get('PYTHONPATH')
+    os.environ['PYTHONPATH'] = FAKE_PF_DIR + (os.pathsep + pythonpath if pythonpath else '')
+    if FAKE_PF_DIR not in sys.path:
+        sys.path.insert(0, FAKE_PF_DIR)
+
+    import powerfactory
+    from digsilent_tracing import Tracer
+
+    powerfactory.configure(buses=args.buses, attribute_latency=args.attribute_latency,
+                           execute_latency=args.execute_latency)
+
+    tracer = Tracer(enabled=bool(args.trace or args.profile_dir), profile_dir=args.profile_dir)
+    work_dir = tempfile.mkdtemp(prefix='digsilent_bench_')
+    try:
+        return _run(args, powerfactory, tracer, work_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _run(args, powerfactory, tracer, work_dir):
+    """Isi benchmark (work_dir dihapus oleh run_benchmarks)"""
+    from digsilent_bulk_reader import read_attributes
+    from digsilent_code_cache import CompiledScriptCache
+    from digsilent_executor import DIgSILENTExecutor
+    from digsilent_script_generator import DIgSILENTScriptGenerator
+    from digsilent_templates import default_registry
+
+    generator = DIgSILENTScriptGenerator(os.path.join(work_dir, 'scripts'), tracer=tracer)
+    executor = DIgSILENTExecutor(code_cache=CompiledScriptCache(use_disk=False), tracer=tracer)
+    iterations = args.iterations
+    results = []
+
+    print("Script generation:")
+    results.append(measure(
+        'render_load_flow',
+        lambda: default_registry.render('load_flow', generated_at='',
+                                        study_case_code="    # Using current active study case"),
+        iterations * 10
+    ))
+    results.append(measure('generate_load_flow_script', generator.generate_load_flow_script,
+                           iterations))
+
+    print("Compile/exec:")
+    load_flow_script = generator.generate_load_flow_script()
+    with open(load_flow_script) as f:
+        source = f.read()
+    counter = iter(range(10 ** 9))
+    cold_cache = CompiledScriptCache(use_disk=False)
+    results.append(measure(
+        'compile_cold',
+        lambda: cold_cache.compile(f"{source}\n# {next(counter)}\n", load_flow_script),
+        iterations
+    ))
+    results.append(measure('compile_cached', lambda: executor.code_cache.compile(source, load_flow_script),
+                           iterations * 10))
+    results.append(measure('execute_direct', lambda: executor.execute_script_direct(load_flow_script),
+                           iterations))
+    with executor.session(pf_module=powerfactory) as session:
+        results.append(measure('execute_session', lambda: session.execute(load_flow_script),
+                               iterations))
+
+    print("Subprocess:")
+    empty_script = os.path.join(work_dir, 'empty.py')
+    with open(empty_script, 'w') as f:
+        f.write("pass\n")
+    results.append(measure('subprocess_spawn',
+                           lambda: executor.execute_script_subprocess(empty_script),
+                           max(1, iterations // 5)))
+    results.append(measure('subprocess_load_flow',
+                           lambda: executor.execute_with_results(load_flow_script),
+                           max(1, iterations // 5)))
+
+    print("Export:")
+    app = powerfactory.GetApplication()
+    terminals = app.GetCalcRelevantObjects("*.ElmTerm")
+    export_script = generator.generate_export_results_script(os.path.join(work_dir, 'results.csv'))
+    results.append(measure('export_csv_direct',
+                           lambda: executor.execute_with_results(export_script, method='direct'),
+                           iterations, items=len(terminals)))
+    results.append(measure('bulk_read_attributes',
+                           lambda: read_attributes(terminals, ['m:u', 'm:phiu', 'iUsage']),
+                           iterations, items=len(terminals)))
+
+    if args.trace:
+        tracer.write_chrome_trace(args.trace)
+    if tracer.enabled:
+        tracer.print_summary()
+
+    return results
+
+
+def compare_to_baseline(report, baseline, threshold=0.5, metric='median'):
+    """
+    Bandingkan hasil benchmark dengan baseline tersimpan
+
+    Args:
+        report: Dict hasil (format output benchmark ini)
+        baseline: Dict baseline dengan format yang sama
+        threshold: Batas perlambatan relatif (0.5 = 50% lebih lambat)
+        metric: Statistik waktu yang dibandingkan ('median', 'mean' atau 'min')
+
+    Returns:
+        List dict regresi (name, baseline, current, ratio); kosong kalau tidak ada
+    """
+    if baseline.get('config') != report.get('config'):
+        print(f"⚠ Config berbeda dengan baseline: {baseline.get('config')} vs {report.get('config')}")
+
+    regressions = []
+    current_results = report.get('results', {})
+    for name, reference in sorted(baseline.get('results', {}).items()):
+        current = current_results.get(name)
+        if current is None:
+            print(f"  ⚠ {name:<32} tidak ada di hasil sekarang")
+            continue
+        before = reference.get(metric)
+        after = current.get(metric)
+        if not before or after is None:
+            continue
+        ratio = after / before
+        if ratio > 1 + threshold:
+            regressions.append({'name': name, 'baseline': before, 'current': after, 'ratio': ratio})
+            marker = '✗'
+        else:
+            marker = '✓'
+        print(f"  {marker} {name:<32} {metric} {before * 1000:>9.3f} ms -> "
+              f"{after * 1000:>9.3f} ms ({ratio - 1:+.1%})")
+    return regressions
+
+
+def _write_json(path, data):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--buses', type=int, default=100, help="Jumlah bus jaringan fake")
+    parser.add_argument('--attribute-latency', type=float, default=0.0,
+                        help="Latency per GetAttribute/SetAttribute (detik)")
+    parser.add_argument('--execute-latency', type=float, default=0.0,
+                        help="Latency per Execute() (detik)")
+    parser.add_argument('--iterations', type=int, default=20, help="Jumlah pengukuran per benchmark")
+    parser.add_argument('--output', default='benchmark_results.json', help="File JSON hasil")
+    parser.add_argument('--trace', help="Tulis Chrome trace-event JSON (optional)")
+    parser.add_argument('--profile-dir', help="Folder cProfile per job (optional)")
+    parser.add_argument('--compare', nargs='?', const=DEFAULT_BASELINE, metavar='BASELINE',
+                        help="Bandingkan dengan baseline JSON (default: benchmark_baseline.json)")
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help="Perlambatan relatif yang dianggap regresi (default 0.5 = 50%%)")
+    parser.add_argument('--metric', choices=('median', 'mean', 'min'), default='median',
+                        help="Statistik yang dibandingkan dengan baseline")
+    parser.add_argument('--save-baseline', metavar='BASELINE',
+                        help="Simpan hasil run ini sebagai baseline baru")
+    args = parser.parse_args()
+
+    print("="*60)
+    print(f"Benchmark: {args.buses} buses, attribute latency {args.attribute_latency} s, "
+          f"execute latency {args.execute_latency} s")
+    print("="*60)
+
+    results = run_benchmarks(args)
+
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'config': {
+            'buses': args.buses,
+            'attribute_latency': args.attribute_latency,
+            'execute_latency': args.execute_latency,
+            'iterations': args.iterations,
+        },
+        'results': {result['name']: result for result in results},
+    }
+
+    _write_json(args.output, report)
+    print(f"\n✓ Results written: {args.output}")
+
+    if args.save_baseline:
+        _write_json(args.save_baseline, report)
+        print(f"✓ Baseline written: {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\nCompare with {args.compare} ({args.metric}, threshold {args.threshold:.0%}):")
+        regressions = compare_to_baseline(report, baseline, args.threshold, args.metric)
+        if regressions:
+            print(f"\n✗ {len(regressions)} benchmark(s) regressed more than {args.threshold:.0%}")
+            return 1
+        print("\n✓ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
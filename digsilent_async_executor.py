@@ -0,0 +1,219 @@
+"""
+Module untuk eksekusi skrip DIgSILENT PowerFactory berbasis asyncio
+"""
+
+import asyncio
+import os
+import sys
+import time
+import weakref
+
+from digsilent_executor import DIgSILENTExecutor
+from digsilent_scheduler import ScriptJobResult
+
+
+class AsyncDIgSILENTExecutor:
+    """
+    Counterpart asyncio dari DIgSILENTExecutor
+
+    Skrip dijalankan dengan asyncio.create_subprocess_exec sehingga event
+    loop tidak pernah ter-block. Jumlah subprocess yang berjalan bersamaan
+    dibatasi dengan semaphore, dan task yang di-cancel otomatis meng-kill
+    subprocess-nya.
+
+    Satu executor bisa dipakai di beberapa event loop (misalnya beberapa
+    asyncio.run()); semaphore dibuat per event loop.
+
+    Contoh:
+        executor = AsyncDIgSILENTExecutor(max_concurrency=8)
+        async with executor.as_completed(script_paths) as jobs:
+            for next_done in jobs:
+                print(await next_done)
+    """
+
+    def __init__(self, executor=None, max_concurrency=4, python_executable=None,
+                 timeout=None):
+        """
+        Initialize async executor
+
+        Args:
+            executor: DIgSILENTExecutor untuk path dan environment (optional)
+            max_concurrency: Jumlah maksimal subprocess bersamaan
+            python_executable: Path ke Python executable (default sys.executable)
+            timeout: Batas waktu default per skrip dalam detik (optional)
+        """
+        self.executor = executor or DIgSILENTExecutor()
+        self.max_concurrency = max_concurrency
+        self.python_executable = python_executable or sys.executable
+        self.timeout = timeout
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    @property
+    def semaphore(self):
+        # Semaphore terikat ke event loop, jadi dibuat per loop yang sedang berjalan
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _kill(self, process):
+        """Kill subprocess dan tunggu sampai benar-benar selesai"""
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+
+    async def execute_script(self, script_path, timeout=None, index=0):
+        """
+        Eksekusi skrip di subprocess tanpa mem-block event loop
+
+        Args:
+            script_path: Path ke skrip yang akan dijalankan
+            timeout: Batas waktu dalam detik (optional, default self.timeout)
+            index: Index job untuk hasil (optional)
+
+        Returns:
+            ScriptJobResult
+        """
+        result = ScriptJobResult(index, script_path)
+        if not os.path.exists(script_path):
+            result.stderr = f"Script not found: {script_path}"
+            return result
+
+        if timeout is None:
+            timeout = self.timeout
+
+        async with self.semaphore:
+            start_time = time.perf_counter()
+            result.attempts = 1
+
+            process = await asyncio.create_subprocess_exec(
+                *self.executor.tracer.python_command(self.python_executable, script_path),
+                env=self.executor.build_subprocess_env(),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+                result.stdout = stdout.decode(errors='replace')
+                result.stderr = stderr.decode(errors='replace')
+                result.returncode = process.returncode
+                result.success = process.returncode == 0
+            except asyncio.TimeoutError:
+                result.timed_out = True
+                await self._kill(process)
+            except asyncio.CancelledError:
+                await self._kill(process)
+                raise
+            finally:
+                result.elapsed = time.perf_counter() - start_time
+                self.executor.tracer.add_span('job', start_time, result.elapsed, 'async',
+                                              script=script_path)
+
+        return result
+
+    async def execute_and_wait(self, script_path, wait_time=0, timeout=None):
+        """
+        Eksekusi skrip lalu (opsional) tunggu tanpa mem-block event loop
+
+        Args:
+            script_path: Path ke skrip yang akan dijalankan
+            wait_time: Waktu tunggu tambahan setelah eksekusi (detik)
+            timeout: Batas waktu dalam detik (optional)
+
+        Returns:
+            True jika sukses, False jika gagal
+        """
+        result = await self.execute_script(script_path, timeout=timeout)
+
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+        return result.success
+
+    async def execute_many(self, script_paths, timeout=None):
+        """
+        Eksekusi banyak skrip bersamaan (dibatasi max_concurrency)
+
+        Args:
+            script_paths: List path skrip
+            timeout: Batas waktu per skrip dalam detik (optional)
+
+        Returns:
+            List ScriptJobResult dengan urutan sama seperti script_paths
+        """
+        return await asyncio.gather(*[
+            self.execute_script(path, timeout=timeout, index=i)
+            for i, path in enumerate(script_paths)
+        ])
+
+    def as_completed(self, script_paths, timeout=None):
+        """
+        Jalankan banyak skrip dan iterasi hasilnya saat job selesai
+
+        Seperti asyncio.as_completed: iterator biasa berisi awaitable yang
+        menghasilkan ScriptJobResult. Pakai sebagai async context manager;
+        saat keluar dari blok (termasuk break/return/exception), job yang
+        belum selesai di-cancel, subprocess-nya di-kill dan ditunggu selagi
+        event loop masih berjalan. Tanpa context manager, iterasi yang
+        dihentikan lebih awal meninggalkan job yang di-cancel baru saat
+        asyncio.run() ditutup; asyncio bisa hang jika saat itu ada
+        subprocess yang sedang di-start.
+
+        Harus dipanggil dari dalam event loop yang berjalan.
+
+        Args:
+            script_paths: List path skrip
+            timeout: Batas waktu per skrip dalam detik (optional)
+
+        Returns:
+            CompletedJobs
+        """
+        loop = asyncio.get_running_loop()
+        tasks = [
+            loop.create_task(self.execute_script(path, timeout=timeout, index=i))
+            for i, path in enumerate(script_paths)
+        ]
+        return CompletedJobs(tasks)
+
+
+class CompletedJobs:
+    """
+    Iterator awaitable hasil job dalam urutan selesai (dari as_completed)
+
+    Contoh:
+        async with executor.as_completed(script_paths) as jobs:
+            for next_done in jobs:
+                result = await next_done
+                if not result.success:
+                    break       # job lain di-cancel saat keluar dari blok
+    """
+
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self._iterator = asyncio.as_completed(tasks)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._iterator)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+        return False
+
+    async def aclose(self):
+        """Cancel job yang belum selesai dan tunggu subprocess-nya di-kill"""
+        pending = [task for task in self.tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,179 @@
+"""
+Module untuk membaca attribute banyak objek PowerFactory sekaligus
+"""
+
+import time
+from array import array
+
+
+# Fill value untuk baris yang attribute-nya tidak ada (lihat mask)
+FILL_VALUES = {'d': float('nan'), 'q': 0}
+
+NUMPY_DTYPES = {'d': 'f8', 'q': 'i8'}
+
+
+# Tipe nilai yang muat di kolom tanpa konversi
+ACCEPTED_TYPES = {'q': (int, bool), 'd': (float, int, bool)}
+
+
+def _kind(value):
+    """Typecode untuk satu nilai: 'q' integer, 'd' float, 'O' lainnya"""
+    if isinstance(value, int):
+        return 'q'
+    if isinstance(value, float):
+        return 'd'
+    return 'O'
+
+
+def _promote(current, kind):
+    """Typecode kolom yang muat nilai lama dan nilai baru ('q' -> 'd' -> 'O')"""
+    if current is None or current == kind:
+        return kind
+    if {current, kind} == {'q', 'd'}:
+        return 'd'
+    return 'O'
+
+
+def _allocate(typecode, count, np):
+    """Kolom berisi fill value, dialokasikan sekali dengan ukuran final"""
+    if typecode not in FILL_VALUES:
+        return [None] * count
+    fill = FILL_VALUES[typecode]
+    if np is not None:
+        return np.full(count, fill, dtype=NUMPY_DTYPES[typecode])
+    return array(typecode, [fill]) * count
+
+
+def _convert(column, typecode, missing, filled, np):
+    """Salin baris [0, filled) ke kolom baru dengan typecode yang lebih umum"""
+    values = column[:filled]
+    values = values if isinstance(values, list) else values.tolist()
+    converted = _allocate(typecode, len(column), np)
+    for i, value in enumerate(values):
+        if not missing[i]:
+            converted[i] = value
+    return converted
+
+
+class AttributeColumns:
+    """
+    Hasil read_attributes: satu kolom typed per attribute + mask missing
+
+    Kolom numerik adalah array.array ('d' float, 'q' integer) atau numpy
+    array ('f8', 'i8'); attribute non-numerik (string, objek) disimpan
+    sebagai list. mask[attribute][i] bernilai True jika objek ke-i tidak
+    punya attribute tersebut (nilai kolom berisi fill value).
+    """
+
+    def __init__(self, count, columns, masks, elapsed):
+        self.count = count
+        self.columns = columns
+        self.masks = masks
+        self.elapsed = elapsed
+
+    @property
+    def objects_per_second(self):
+        """Throughput dalam objek per detik (semua attribute)"""
+        if self.elapsed <= 0:
+            return float('inf')
+        return self.count / self.elapsed
+
+    def __getitem__(self, attribute):
+        return self.columns[attribute]
+
+    def missing(self, attribute):
+        """Jumlah objek yang tidak punya attribute"""
+        return sum(1 for flag in self.masks[attribute] if flag)
+
+    def __repr__(self):
+        return (f"AttributeColumns(count={self.count}, attributes={list(self.columns)}, "
+                f"{self.objects_per_second:.0f} objects/s)")
+
+
+def _read_column(objects, attribute, typecode, np):
+    """
+    Baca satu attribute semua objek langsung ke kolom yang sudah dialokasikan
+
+    Tanpa typecode, tipe kolom ditebak dari nilai pertama yang ada dan
+    dinaikkan ('q' -> 'd' -> 'O') jika nilai berikutnya tidak muat. Objek
+    yang gagal dibaca (raise atau None) hanya menandai barisnya sendiri
+    di mask, objek lain tidak dibaca ulang.
+
+    Returns:
+        Tuple (kolom, mask)
+    """
+    count = len(objects)
+    fixed = typecode is not None
+    current = typecode
+    accepted = ()       # tipe belum diketahui sampai nilai pertama
+    column = _allocate(typecode or 'd', count, np)
+    missing = np.zeros(count, dtype=bool) if np is not None else [False] * count
+
+    for i, obj in enumerate(objects):
+        try:
+            value = obj.GetAttribute(attribute)
+        except Exception:
+            value = None
+        if value is None:
+            missing[i] = True
+            continue
+
+        if not fixed and accepted is not None and type(value) not in accepted:
+            promoted = _promote(current, _kind(value))
+            if promoted != current:
+                if current is not None or promoted != 'd':
+                    column = _convert(column, promoted, missing, i, np)
+                current = promoted
+                accepted = ACCEPTED_TYPES.get(current)
+        column[i] = value
+
+    return column, missing
+
+
+def read_attributes(objects, attributes, dtypes=None, use_numpy=None, verbose=True):
+    """
+    Baca banyak attribute dari banyak objek ke kolom typed
+
+    Setiap attribute dibaca dalam satu pass untuk semua objek, langsung
+    ke kolom yang dialokasikan sekali dengan ukuran final (tanpa list
+    perantara). Attribute yang tidak ada (GetAttribute raise atau None)
+    ditandai di mask per objek.
+
+    Args:
+        objects: List objek PowerFactory (misalnya index.objects("ElmTerm"))
+        attributes: List nama attribute, misalnya ["m:u", "m:phiu", "iUsage"]
+        dtypes: Dict {attribute: typecode} untuk memaksa tipe kolom
+                ('d' float, 'q' integer, 'O' list), default otomatis
+        use_numpy: True/False, default numpy jika ter-install
+        verbose: Cetak throughput
+
+    Returns:
+        AttributeColumns
+    """
+    objects = list(objects)
+    dtypes = dtypes or {}
+
+    np = None
+    if use_numpy is not False:
+        try:
+            import numpy as np
+        except ImportError:
+            if use_numpy:
+                raise
+
+    count = len(objects)
+    columns = {}
+    masks = {}
+    start_time = time.perf_counter()
+
+    for attribute in attributes:
+        columns[attribute], masks[attribute] = _read_column(objects, attribute,
+                                                            dtypes.get(attribute), np)
+
+    elapsed = time.perf_counter() - start_time
+    result = AttributeColumns(count, columns, masks, elapsed)
+
+    if verbose:
+        print(f"✓ Read {len(attributes)} attributes from {count} objects in {elapsed:.3f} s "
+              f"({result.objects_per_second:.0f} objects/s)")
+    return result
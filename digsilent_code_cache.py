@@ -0,0 +1,239 @@
+"""
+Module untuk cache code object hasil compile skrip DIgSILENT
+"""
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import re
+import sys
+import time
+import tokenize
+import types
+from collections import OrderedDict
+
+from digsilent_discovery import cache_root
+
+
+# Skrip mode non-deterministic berisi header timestamp: isinya unik per generate,
+# sehingga code object-nya tidak akan pernah di-hit lagi dari disk
+_GENERATED_AT = re.compile(r'^Generated at: ', re.MULTILINE)
+
+
+def _with_filename(code, filename):
+    """Code object dengan co_filename baru (termasuk fungsi/class di dalamnya)"""
+    if code.co_filename == filename:
+        return code
+    consts = tuple(_with_filename(const, filename) if isinstance(const, types.CodeType) else const
+                   for const in code.co_consts)
+    return code.replace(co_filename=filename, co_consts=consts)
+
+
+class CompiledScriptCache:
+    """
+    Cache code object skrip, di-key dengan SHA-256 dari source
+
+    Level 1 adalah LRU in-memory, level 2 adalah file marshal di disk
+    (dengan magic number interpreter, sehingga tidak dipakai oleh versi
+    Python lain). Skrip dengan isi yang sama tidak di-parse dan di-compile
+    ulang; co_filename code object yang diambil dari cache diganti ke file
+    yang sedang di-compile supaya traceback menunjuk file yang benar.
+
+    Skrip dengan header "Generated at:" (isi unik per generate) tidak
+    disimpan di disk. Folder disk dibatasi umur dan total ukuran file
+    (LRU berdasarkan mtime, di-update saat disk hit).
+    """
+
+    def __init__(self, max_entries=256, cache_dir=None, use_disk=True,
+                 max_disk_bytes=256 * 1024 * 1024, max_disk_age=30 * 24 * 3600, prune_every=50):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Jumlah maksimal code object di memori
+            cache_dir: Folder cache di disk (optional)
+            use_disk: Simpan code object di disk
+            max_disk_bytes: Total ukuran maksimal file cache di disk (None = tanpa batas)
+            max_disk_age: Umur maksimal file cache di disk dalam detik (None = tanpa batas)
+            prune_every: Cek batas disk setiap sejumlah file yang ditulis
+        """
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir or os.path.join(cache_root(), 'compiled_scripts')
+        self.use_disk = use_disk
+        self.max_disk_bytes = max_disk_bytes
+        self.max_disk_age = max_disk_age
+        self.prune_every = prune_every
+        self._entries = OrderedDict()
+        self._disk_writes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def source_key(source):
+        """SHA-256 hex dari source skrip"""
+        return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{sys.implementation.cache_tag}.bin")
+
+    def _load_disk(self, key):
+        path = self._disk_path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)    # tandai baru dipakai untuk LRU disk
+        except OSError:
+            return None
+
+        magic = importlib.util.MAGIC_NUMBER
+        if not data.startswith(magic):
+            return None
+
+        try:
+            return marshal.loads(data[len(magic):])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def _save_disk(self, key, code):
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(importlib.util.MAGIC_NUMBER)
+                f.write(marshal.dumps(code))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠ Cannot write compiled script cache: {str(e)}")
+            return
+
+        # Prune juga saat write pertama, supaya sisa run sebelumnya ikut dibatasi
+        if self._disk_writes % self.prune_every == 0:
+            self.prune_disk()
+        self._disk_writes += 1
+
+    def prune_disk(self):
+        """
+        Hapus file cache disk yang melewati max_disk_age, lalu file yang
+        paling lama tidak dipakai sampai total ukuran <= max_disk_bytes
+
+        Returns:
+            Jumlah file yang dihapus
+        """
+        files = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        now = time.time()
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for mtime, size, path in files:
+            expired = self.max_disk_age is not None and now - mtime > self.max_disk_age
+            oversize = self.max_disk_bytes is not None and total > self.max_disk_bytes
+            if not expired and not oversize:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def _remember(self, key, code):
+        self._entries[key] = code
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def compile(self, source, filename='<script>'):
+        """
+        Compile source, atau ambil code object dari cache
+
+        Args:
+            source: Source code skrip
+            filename: Nama file untuk traceback
+
+        Returns:
+            Code object
+        """
+        key = self.source_key(source)
+
+        code = self._entries.get(key)
+        if code is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._rename(key, code, filename)
+
+        use_disk = self.use_disk and not _GENERATED_AT.search(source)
+        if use_disk:
+            code = self._load_disk(key)
+            if code is not None:
+                self.disk_hits += 1
+                self._remember(key, code)
+                return self._rename(key, code, filename)
+
+        self.misses += 1
+        code = compile(source, filename, 'exec')
+        self._remember(key, code)
+        if use_disk:
+            self._save_disk(key, code)
+        return code
+
+    def _rename(self, key, code, filename):
+        """Code object dengan co_filename = filename (disimpan untuk hit berikutnya)"""
+        if code.co_filename != filename:
+            code = _with_filename(code, filename)
+            self._entries[key] = code
+        return code
+
+    def compile_file(self, script_path):
+        """
+        Baca dan compile file skrip (dengan cache)
+
+        File dibaca dengan tokenize.open (UTF-8 atau coding cookie di skrip),
+        bukan encoding locale, sama seperti interpreter membaca skrip.
+
+        Args:
+            script_path: Path ke skrip
+
+        Returns:
+            Code object
+        """
+        with tokenize.open(script_path) as f:
+            source = f.read()
+        return self.compile(source, script_path)
+
+    def stats(self):
+        """
+        Counter cache
+
+        Returns:
+            Dict hits (memori), disk_hits, misses dan entries
+        """
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+        }
+
+    def clear(self):
+        """Kosongkan cache memori dan reset counter"""
+        self._entries.clear()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+
+# Cache bersama untuk semua executor di process yang sama
+default_code_cache = CompiledScriptCache()
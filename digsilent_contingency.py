@@ -0,0 +1,214 @@
+"""
+Module untuk analisis kontingensi N-1 paralel di DIgSILENT PowerFactory
+"""
+
+import time
+
+from digsilent_executor import DIgSILENTExecutor
+from digsilent_functions import list_outages
+from digsilent_scheduler import ParallelScriptScheduler
+
+
+class ContingencyAnalysis:
+    """
+    Screening N-1 untuk semua saluran (ElmLne) dan trafo (ElmTr2)
+
+    Daftar outage diambil dari GetCalcRelevantObjects, dibagi menjadi
+    shard, dan setiap shard dijalankan sebagai skrip terpisah di
+    ParallelScriptScheduler (satu worker process per shard). Hasil per
+    outage dikirim lewat result channel, lalu digabung menjadi tabel
+    ringkas yang diurutkan berdasarkan severity.
+
+    Contoh:
+        analysis = ContingencyAnalysis(executor, shard_size=25, max_workers=4)
+        table, shards = analysis.run()
+        for row in table[:10]:
+            print(row["rank"], row["outage"], row["severity"], row["worst"])
+    """
+
+    def __init__(self, executor=None, generator=None, shard_size=50, max_workers=None,
+                 v_min=0.95, v_max=1.05, max_loading=100.0,
+                 outage_classes=("ElmLne", "ElmTr2"), ignore_base_violations=True,
+                 python_executable=None, timeout=None, retries=0, worker_env=None):
+        """
+        Initialize analysis
+
+        Args:
+            executor: DIgSILENTExecutor (optional, dibuat baru jika None)
+            generator: DIgSILENTScriptGenerator (optional, default mode deterministic)
+            shard_size: Jumlah outage per shard (per skrip)
+            max_workers: Jumlah worker process (default jumlah CPU)
+            v_min, v_max: Batas tegangan bus (p.u.)
+            max_loading: Batas loading cabang (%)
+            outage_classes: Class elemen yang di-outage
+            ignore_base_violations: Abaikan pelanggaran yang sudah ada di base case
+            python_executable: Interpreter worker (optional)
+            timeout: Batas waktu per shard dalam detik (optional)
+            retries: Jumlah retry shard yang gagal
+            worker_env: Callable worker_id -> dict environment tambahan (optional)
+        """
+        if generator is None:
+            from digsilent_script_generator import DIgSILENTScriptGenerator
+            generator = DIgSILENTScriptGenerator(deterministic=True)
+
+        self.executor = executor or DIgSILENTExecutor()
+        self.generator = generator
+        self.shard_size = max(1, int(shard_size))
+        self.v_min = v_min
+        self.v_max = v_max
+        self.max_loading = max_loading
+        self.outage_classes = tuple(outage_classes)
+        self.ignore_base_violations = ignore_base_violations
+        self.scheduler = ParallelScriptScheduler(
+            self.executor,
+            max_workers=max_workers,
+            python_executable=python_executable,
+            timeout=timeout,
+            retries=retries,
+            worker_env=worker_env,
+            structured=True
+        )
+
+    def enumerate_outages(self, session=None):
+        """
+        Ambil daftar outage dari model aktif
+
+        Args:
+            session: PowerFactorySession yang sudah terbuka (optional)
+
+        Returns:
+            List nama objek "<loc_name>.<class>"
+        """
+        outages = self.executor.execute_function(list_outages, self.outage_classes,
+                                                 session=session)
+        return outages or []
+
+    def shards(self, outages):
+        """Bagi daftar outage menjadi shard berukuran shard_size"""
+        return [outages[i:i + self.shard_size] for i in range(0, len(outages), self.shard_size)]
+
+    def severity(self, violations):
+        """
+        Severity satu kontingensi: pelanggaran terbesar dalam persen
+
+        Loading: persen di atas max_loading. Tegangan: deviasi di luar
+        batas dalam persen p.u.
+        """
+        worst = 0.0
+        for kind, _, value in violations:
+            if kind == "loading":
+                excess = value - self.max_loading
+            elif value < self.v_min:
+                excess = (self.v_min - value) * 100
+            else:
+                excess = (value - self.v_max) * 100
+            worst = max(worst, excess)
+        return worst
+
+    def _table_row(self, row, base_violations):
+        violations = row["violations"]
+        if self.ignore_base_violations:
+            violations = [v for v in violations if (v[0], v[1]) not in base_violations]
+
+        if row["error_code"] is None:
+            status = "not_run"
+        elif row["error_code"] != 0:
+            status = "diverged"
+        elif violations:
+            status = "violations"
+        else:
+            status = "ok"
+
+        severity = float("inf") if status == "diverged" else self.severity(violations)
+        worst = None
+        if violations:
+            worst = max(violations, key=lambda v: self.severity([v]))
+
+        return {
+            "outage": row["outage"],
+            "status": status,
+            "severity": severity,
+            "n_violations": len(violations),
+            "worst": worst,
+            "min_voltage": row.get("min_voltage"),
+            "max_loading": row.get("max_loading"),
+            "violations": violations,
+        }
+
+    def run(self, outages=None, session=None):
+        """
+        Jalankan screening N-1
+
+        Args:
+            outages: List nama objek (optional, default enumerate_outages())
+            session: PowerFactorySession untuk enumerasi outage (optional)
+
+        Returns:
+            Tuple (table, shards): table adalah list dict per outage yang
+            sudah di-rank (rank, outage, status, severity, n_violations,
+            worst, min_voltage, max_loading, violations), shards adalah list
+            timing per shard (shard, outages, completed, worker_id, attempts,
+            elapsed, success)
+        """
+        if outages is None:
+            outages = self.enumerate_outages(session)
+        if not outages:
+            print("⚠ No outages to analyse")
+            return [], []
+
+        shards = self.shards(outages)
+        scripts = [
+            self.generator.generate_contingency_script(
+                shard, v_min=self.v_min, v_max=self.v_max, max_loading=self.max_loading,
+                shard_index=index
+            )
+            for index, shard in enumerate(shards)
+        ]
+
+        print(f"N-1: {len(outages)} outages in {len(shards)} shards of {self.shard_size}")
+        start_time = time.perf_counter()
+        jobs = self.scheduler.run(scripts)
+
+        table = []
+        shard_timing = []
+        for shard, job in zip(shards, jobs):
+            base_violations = set()
+            for base in job.events("contingency_base"):
+                base_violations.update((v[0], v[1]) for v in base["violations"])
+
+            rows = {row["outage"]: row for row in job.events("contingency")}
+            for outage in shard:
+                row = rows.get(outage, {"outage": outage, "error_code": None, "violations": []})
+                table.append(self._table_row(row, base_violations))
+
+            shard_timing.append({
+                "shard": job.index,
+                "outages": len(shard),
+                "completed": len(rows),
+                "worker_id": job.worker_id,
+                "attempts": job.attempts,
+                "elapsed": job.elapsed,
+                "success": job.success,
+            })
+
+        # not_run paling bawah, selain itu severity terbesar di atas
+        table.sort(key=lambda row: (row["status"] == "not_run", -row["severity"]))
+        for rank, row in enumerate(table, 1):
+            row["rank"] = rank
+
+        elapsed = time.perf_counter() - start_time
+        self.print_shard_timing(shard_timing)
+        critical = sum(1 for row in table if row["status"] in ("violations", "diverged"))
+        print(f"N-1 finished in {elapsed:.2f} seconds: {critical} critical outages")
+        return table, shard_timing
+
+    @staticmethod
+    def print_shard_timing(shard_timing):
+        """Cetak timing per shard (untuk tuning shard_size)"""
+        print(f"{'Shard':>5}  {'Worker':>6}  {'Done':>9}  {'Time (s)':>9}  {'s/outage':>9}")
+        for shard in shard_timing:
+            per_outage = shard["elapsed"] / shard["outages"] if shard["outages"] else 0.0
+            mark = "✓" if shard["success"] else "✗"
+            print(f"{shard['shard']:>5}  {str(shard['worker_id']):>6}  "
+                  f"{shard['completed']:>4}/{shard['outages']:<4}  {shard['elapsed']:>9.3f}  "
+                  f"{per_outage:>9.4f} {mark}")
@@ -0,0 +1,246 @@
+"""
+Module untuk mencari instalasi DIgSILENT PowerFactory (dengan cache)
+"""
+
+import json
+import os
+import re
+import sys
+
+
+# Folder yang di-scan untuk instalasi PowerFactory
+DEFAULT_INSTALL_ROOTS = [
+    r"C:\Program Files\DIgSILENT",
+    r"D:\Digsilent Powerfactory 2021",
+]
+
+# Root tambahan bisa diberikan lewat environment (dipisah os.pathsep)
+INSTALL_ROOTS_ENV = "DIGSILENT_INSTALL_ROOTS"
+
+CACHE_VERSION = 1
+
+_VERSION_PATTERN = re.compile(r"powerfactory\s*(\d{4})(?:\s*SP\s*(\d+))?", re.IGNORECASE)
+_PYTHON_PATTERN = re.compile(r"^(\d+)\.(\d+)$")
+
+# Cache in-memory, supaya executor berikutnya di process yang sama tidak baca disk
+_memory_cache = {}
+
+
+def cache_root():
+    """Folder cache per user (%LOCALAPPDATA% di Windows, ~/.cache di Linux)"""
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'digsilent-test')
+
+
+def default_cache_path():
+    """Lokasi file cache hasil discovery"""
+    return os.path.join(cache_root(), 'powerfactory_installations.json')
+
+
+def get_install_roots():
+    """List root instalasi (default + environment DIGSILENT_INSTALL_ROOTS)"""
+    roots = list(DEFAULT_INSTALL_ROOTS)
+    extra = os.environ.get(INSTALL_ROOTS_ENV, '')
+    for root in extra.split(os.pathsep):
+        if root and root not in roots:
+            roots.append(root)
+    return roots
+
+
+def parse_version(name):
+    """
+    Parse versi dan service pack dari nama folder
+
+    Args:
+        name: Nama folder, misalnya "PowerFactory 2022 SP2"
+
+    Returns:
+        Tuple (year, service_pack) atau None jika bukan folder PowerFactory
+    """
+    match = _VERSION_PATTERN.search(name)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2) or 0)
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _subdirs(path):
+    """List (name, path) subfolder memakai os.scandir"""
+    try:
+        with os.scandir(path) as entries:
+            return [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
+
+
+def _find_python_dirs(install_dir):
+    """Cari folder Python\\x.y di install_dir atau satu level di bawahnya"""
+    candidates = [os.path.join(install_dir, 'Python')]
+    candidates += [os.path.join(path, 'Python') for _, path in _subdirs(install_dir)]
+
+    python_dirs = []
+    for python_root in candidates:
+        for name, path in _subdirs(python_root):
+            match = _PYTHON_PATTERN.match(name)
+            if match:
+                python_dirs.append((python_root, (int(match.group(1)), int(match.group(2))), path))
+    return python_dirs
+
+
+def scan_installations(roots=None):
+    """
+    Scan root instalasi sekali dengan os.scandir
+
+    Args:
+        roots: List root (optional, default get_install_roots())
+
+    Returns:
+        Tuple (installations, watched) dimana watched adalah dict
+        {folder: mtime} yang dipakai untuk invalidasi cache
+    """
+    if roots is None:
+        roots = get_install_roots()
+
+    installations = []
+    watched = {}
+
+    for root in roots:
+        watched[root] = _mtime(root)
+        if watched[root] is None:
+            continue
+
+        install_dirs = [(name, path) for name, path in _subdirs(root) if parse_version(name)]
+        root_version = parse_version(os.path.basename(root.rstrip('\\/')))
+        if root_version:
+            install_dirs.append((os.path.basename(root.rstrip('\\/')), root))
+
+        for name, install_dir in install_dirs:
+            year, service_pack = parse_version(name)
+            watched[install_dir] = _mtime(install_dir)
+
+            for python_root, python_version, python_path in _find_python_dirs(install_dir):
+                watched[python_root] = _mtime(python_root)
+                installations.append({
+                    'install_dir': install_dir,
+                    'version': year,
+                    'service_pack': service_pack,
+                    'python_version': list(python_version),
+                    'python_path': python_path,
+                })
+
+    return installations, watched
+
+
+def sort_installations(installations, python_version=None):
+    """
+    Urutkan instalasi: Python yang cocok dengan interpreter dulu, lalu versi terbaru
+
+    Args:
+        installations: List dict instalasi
+        python_version: Tuple (major, minor) (default interpreter yang berjalan)
+
+    Returns:
+        List dict instalasi yang sudah diurutkan
+    """
+    if python_version is None:
+        python_version = sys.version_info[:2]
+    python_version = list(python_version)
+
+    return sorted(
+        installations,
+        key=lambda inst: (
+            inst['python_version'] == python_version,
+            inst['version'],
+            inst['service_pack'],
+            inst['python_version'],
+        ),
+        reverse=True
+    )
+
+
+def _cache_valid(cache, roots):
+    if cache.get('cache_version') != CACHE_VERSION or cache.get('roots') != roots:
+        return False
+    return all(_mtime(path) == mtime for path, mtime in cache.get('watched', {}).items())
+
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cache(cache_path, cache):
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"⚠ Cannot write discovery cache: {str(e)}")
+
+
+def discover_installations(roots=None, use_cache=True, cache_path=None, python_version=None):
+    """
+    Cari semua instalasi PowerFactory, dengan cache di disk
+
+    Cache di-invalidasi otomatis jika mtime salah satu folder yang di-scan
+    berubah (misalnya ada instalasi atau versi Python baru).
+
+    Args:
+        roots: List root instalasi (optional)
+        use_cache: Gunakan cache in-memory dan di disk
+        cache_path: Lokasi file cache (optional, default default_cache_path())
+        python_version: Tuple (major, minor) untuk prioritas (optional)
+
+    Returns:
+        List dict instalasi (install_dir, version, service_pack,
+        python_version, python_path), yang paling cocok di depan
+    """
+    if roots is None:
+        roots = get_install_roots()
+    if cache_path is None:
+        cache_path = default_cache_path()
+
+    cache = None
+    if use_cache:
+        cache = _memory_cache.get(cache_path)
+        if cache is None or not _cache_valid(cache, roots):
+            cache = _load_cache(cache_path)
+            if cache is not None and not _cache_valid(cache, roots):
+                cache = None
+
+    if cache is None:
+        installations, watched = scan_installations(roots)
+        cache = {
+            'cache_version': CACHE_VERSION,
+            'roots': roots,
+            'watched': watched,
+            'installations': installations,
+        }
+        if use_cache:
+            _save_cache(cache_path, cache)
+
+    if use_cache:
+        _memory_cache[cache_path] = cache
+
+    return sort_installations(cache['installations'], python_version)
+
+
+def find_powerfactory_paths(roots=None, use_cache=True):
+    """
+    List path Python PowerFactory, yang paling cocok di depan
+
+    Returns:
+        List path folder Python\\x.y
+    """
+    return [inst['python_path'] for inst in discover_installations(roots, use_cache)]
@@ -4,8 +4,444 @@ Module untuk eksekusi skrip di DIgSILENT PowerFactory
 
 import sys
 import os
+import json
+import queue
 import subprocess
+import threading
 import time
+from collections import deque
+
+from digsilent_code_cache import default_code_cache
+from digsilent_discovery import find_powerfactory_paths
+from digsilent_result_channel import ResultChannel, StructuredResult
+from digsilent_tracing import NULL_TRACER
+
+
+# Pola baris output skrip yang di-parse saat streaming
+OUTPUT_EVENTS = (
+    ('completed', ('SCRIPT COMPLETED SUCCESSFULLY', 'EXPORT COMPLETED SUCCESSFULLY')),
+    ('failed', ('SCRIPT FAILED', 'EXPORT FAILED')),
+    ('success', ('✓',)),
+    ('error', ('✗', 'Error:', 'Traceback')),
+    ('warning', ('⚠', 'Warning:')),
+    ('progress', ('Executing', 'Exporting', 'Collected', 'Connected', 'Activated',
+                  'Progress', 'Resuming')),
+)
+
+
+def parse_output_line(line):
+    """
+    Klasifikasi satu baris output skrip
+
+    Args:
+        line: Baris output (tanpa newline)
+
+    Returns:
+        Nama event ('completed', 'failed', 'success', 'error', 'warning',
+        'progress') atau None untuk baris biasa
+    """
+    text = line.strip()
+    for event, markers in OUTPUT_EVENTS:
+        if any(text.startswith(marker) for marker in markers):
+            return event
+    return None
+
+
+class ScriptOutputStream:
+    """
+    Iterator output subprocess baris per baris (stdout dan stderr)
+
+    Output dibaca oleh thread reader ke queue yang ukurannya dibatasi,
+    sehingga memori tetap kecil walaupun skrip berjalan sangat lama.
+    Jika consumer lambat, reader berhenti membaca dan subprocess tertahan
+    oleh pipe (backpressure), bukan menumpuk output di memori.
+
+    Contoh:
+        stream = ScriptOutputStream([sys.executable, script_path])
+        for stream_name, line in stream:
+            if 'diverged' in line:
+                stream.kill()
+        print(stream.returncode)
+    """
+
+    def __init__(self, args, env=None, timeout=None, max_pending_lines=1000):
+        """
+        Start subprocess
+
+        Args:
+            args: Command list untuk subprocess
+            env: Environment subprocess (optional)
+            timeout: Batas waktu total dalam detik (optional)
+            max_pending_lines: Jumlah maksimal baris yang ditahan di memori
+        """
+        self.timeout = timeout
+        self.timed_out = False
+        self.killed = False
+        self._lines = queue.Queue(maxsize=max_pending_lines)
+        self._stop = threading.Event()
+
+        if env is None:
+            env = os.environ.copy()
+        env['PYTHONUNBUFFERED'] = '1'
+
+        self.process = subprocess.Popen(
+            args,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+
+        self._readers = [
+            threading.Thread(target=self._pump, args=(self.process.stdout, 'stdout'), daemon=True),
+            threading.Thread(target=self._pump, args=(self.process.stderr, 'stderr'), daemon=True),
+        ]
+        for reader in self._readers:
+            reader.start()
+
+    def _put(self, item):
+        """Masukkan item ke queue, berhenti jika stream sudah ditutup"""
+        while not self._stop.is_set():
+            try:
+                self._lines.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _pump(self, pipe, stream_name):
+        """Thread reader: baca pipe baris per baris ke queue"""
+        try:
+            for line in pipe:
+                if not self._put((stream_name, line.rstrip('\n'))):
+                    break
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._put(None)
+
+    @property
+    def returncode(self):
+        return self.process.returncode
+
+    def kill(self):
+        """Hentikan subprocess (misalnya run yang runaway)"""
+        if self.process.poll() is None:
+            self.process.kill()
+            self.killed = True
+
+    def close(self):
+        """Hentikan subprocess jika masih berjalan dan lepas reader thread"""
+        self.kill()
+        self._stop.set()
+        self.process.wait()
+        for pipe in (self.process.stdout, self.process.stderr):
+            try:
+                pipe.close()
+            except (OSError, ValueError):
+                pass
+
+    def __iter__(self):
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        finished = 0
+
+        try:
+            while finished < len(self._readers):
+                if deadline is not None and time.monotonic() > deadline:
+                    self.timed_out = True
+                    break
+
+                try:
+                    item = self._lines.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+                if item is None:
+                    finished += 1
+                    continue
+
+                yield item
+
+            if not self.timed_out:
+                self.process.wait()
+        finally:
+            self.close()
+
+
+class PowerFactorySession:
+    """
+    Session PowerFactory yang long-lived (context manager)
+
+    Menyimpan handle aplikasi, active project dan active study case sehingga
+    bisa dipakai ulang untuk banyak eksekusi skrip tanpa import dan
+    GetApplication() berulang. Jika handle sudah stale, session otomatis
+    reconnect sebelum eksekusi berikutnya.
+
+    Contoh:
+        with executor.session() as session:
+            for script_path in scripts:
+                session.execute(script_path)
+    """
+
+    def __init__(self, pf_paths=None, project_name=None, study_case=None,
+                 pf_module=None, code_cache=None, tracer=None):
+        """
+        Initialize session
+
+        Args:
+            pf_paths: List path Python PowerFactory (dari DIgSILENTExecutor)
+            project_name: Nama project yang diaktifkan saat connect (optional)
+            study_case: Nama study case yang diaktifkan saat connect (optional)
+            pf_module: Module powerfactory yang sudah di-import (optional),
+                       berguna untuk testing dengan fake module
+            code_cache: CompiledScriptCache (optional, default cache bersama)
+            tracer: Tracer untuk span per fase (optional)
+        """
+        self.pf_paths = pf_paths or []
+        self.tracer = tracer or NULL_TRACER
+        self.code_cache = code_cache or default_code_cache
+        self.project_name = project_name
+        self.study_case_name = study_case
+        self.pf = pf_module
+        self.app = None
+        self.project = None
+        self.study_case = None
+        self.connect_count = 0
+        self.execution_count = 0
+        self._script_cache = {}
+        self._network_index = None
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _import_powerfactory(self):
+        """Import module powerfactory sekali per session"""
+        if self.pf is None:
+            if self.pf_paths:
+                pf_path = self.pf_paths[0]
+                if pf_path not in sys.path:
+                    sys.path.append(pf_path)
+
+            with self.tracer.span('import_powerfactory', 'session'):
+                import powerfactory
+            self.pf = powerfactory
+
+        return self.pf
+
+    def connect(self):
+        """
+        Connect ke PowerFactory dan aktifkan project/study case
+
+        Returns:
+            Handle aplikasi PowerFactory
+
+        Raises:
+            ConnectionError: Jika PowerFactory, project atau study case
+                             tidak tersedia
+        """
+        pf = self._import_powerfactory()
+
+        with self.tracer.span('GetApplication', 'session'):
+            app = pf.GetApplication()
+        if app is None:
+            raise ConnectionError("Cannot connect to PowerFactory. Make sure PowerFactory is running.")
+
+        if self.project_name:
+            with self.tracer.span('activate_project', 'session', project=self.project_name):
+                activated = app.ActivateProject(self.project_name)
+            if activated != 0:
+                raise ConnectionError(f"Cannot activate project: {self.project_name}")
+
+        project = app.GetActiveProject()
+        if project is None:
+            raise ConnectionError("No active project")
+
+        if self.study_case_name:
+            with self.tracer.span('activate_study_case', 'session', study_case=self.study_case_name):
+                study_cases = project.GetContents(self.study_case_name)
+                if study_cases:
+                    study_cases[0].Activate()
+            if not study_cases:
+                raise ConnectionError(f"Study case '{self.study_case_name}' not found")
+
+        self.app = app
+        self.project = project
+        self.study_case = app.GetActiveStudyCase()
+        self.connect_count += 1
+
+        print(f"✓ Connected to PowerFactory (session connect #{self.connect_count})")
+        return app
+
+    def is_alive(self):
+        """
+        Cek apakah handle aplikasi masih valid
+
+        Returns:
+            True jika handle masih bisa dipakai, False jika stale
+        """
+        if self.app is None:
+            return False
+
+        try:
+            return self.app.GetActiveProject() is not None
+        except Exception:
+            return False
+
+    def ensure_connected(self):
+        """Reconnect jika handle belum ada atau sudah stale"""
+        if not self.is_alive():
+            if self.app is not None:
+                print("⚠ PowerFactory handle is stale, reconnecting...")
+            self.connect()
+        return self.app
+
+    def close(self):
+        """Lepas semua handle yang disimpan session"""
+        self.app = None
+        self.project = None
+        self.study_case = None
+        self._script_cache.clear()
+        if self._network_index is not None:
+            self._network_index.invalidate()
+
+    def network_index(self):
+        """
+        NetworkIndex milik session (dibuat sekali, di-invalidate saat reconnect)
+
+        Returns:
+            NetworkIndex
+        """
+        if self._network_index is None:
+            from digsilent_network_index import NetworkIndex
+            self._network_index = NetworkIndex(self)
+        return self._network_index
+
+    def _load_script(self, script_path):
+        """
+        Compile skrip, di-cache berdasarkan mtime dan ukuran file
+
+        Jika file tidak berubah, file tidak dibaca ulang sama sekali.
+        """
+        stat = os.stat(script_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._script_cache.get(script_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        with self.tracer.span('compile', 'session', script=script_path):
+            script_code = self.code_cache.compile_file(script_path)
+
+        self._script_cache[script_path] = (key, script_code)
+        return script_code
+
+    def call(self, func, *args, **kwargs):
+        """
+        Panggil fungsi skrip langsung dengan handle aplikasi session
+
+        Tidak ada file yang di-generate atau dibaca; func dipanggil sebagai
+        func(app, *args, **kwargs), misalnya digsilent_functions.run_load_flow.
+
+        Args:
+            func: Callable dengan argumen pertama handle aplikasi
+            *args, **kwargs: Argumen tambahan untuk func
+
+        Returns:
+            Return value func, atau None jika gagal
+        """
+        try:
+            app = self.ensure_connected()
+        except ImportError:
+            print("✗ Cannot import powerfactory module")
+            return None
+        except ConnectionError as e:
+            print(f"✗ {str(e)}")
+            return None
+
+        name = getattr(func, '__name__', 'function')
+        try:
+            with self.tracer.span(name, 'function'), self.tracer.profile(name):
+                result = func(app, *args, **kwargs)
+            self.execution_count += 1
+            return result
+        except Exception as e:
+            print(f"✗ Error executing {getattr(func, '__name__', func)}: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return None
+
+    def execute(self, script_path, extra_globals=None):
+        """
+        Eksekusi skrip memakai handle PowerFactory dari session
+
+        Args:
+            script_path: Path ke skrip yang akan dijalankan
+            extra_globals: Dict tambahan untuk globals skrip (optional)
+
+        Returns:
+            True jika sukses, False jika gagal
+        """
+        if not os.path.exists(script_path):
+            print(f"✗ Script not found: {script_path}")
+            return False
+
+        try:
+            self.ensure_connected()
+        except ImportError:
+            print("✗ Cannot import powerfactory module")
+            return False
+        except ConnectionError as e:
+            print(f"✗ {str(e)}")
+            return False
+
+        print(f"Executing script: {script_path}")
+        print("="*60)
+
+        try:
+            script_code = self._load_script(script_path)
+
+            script_globals = {
+                '__name__': '__main__',
+                '__file__': os.path.abspath(script_path),
+                'powerfactory': self.pf,
+                'pf': self.pf,
+                'app': self.app,
+                'project': self.project,
+                'study_case': self.study_case,
+                'network_index': self.network_index()
+            }
+            script_globals.update(extra_globals or {})
+
+            # "import powerfactory" di skrip memakai module session (juga fake
+            # module yang tidak ada di sys.path), bukan import ulang
+            previous = sys.modules.get('powerfactory')
+            sys.modules['powerfactory'] = self.pf
+            try:
+                with self.tracer.span('exec', 'session', script=script_path), \
+                        self.tracer.profile(script_path):
+                    exec(script_code, script_globals)
+            finally:
+                if previous is None:
+                    sys.modules.pop('powerfactory', None)
+                else:
+                    sys.modules['powerfactory'] = previous
+
+            self.execution_count += 1
+            print("="*60)
+            print("✓ Script executed in PowerFactory session")
+            return True
+
+        except Exception as e:
+            print(f"✗ Error executing script: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return False
 
 
 class DIgSILENTExecutor:
@@ -13,60 +449,59 @@ class DIgSILENTExecutor:
     Class untuk eksekusi skrip Python di DIgSILENT PowerFactory
     """
 
-    def __init__(self):
-        """Initialize executor"""
-        self.pf_paths = self._find_powerfactory_paths()
+    def __init__(self, code_cache=None, tracer=None):
+        """
+        Initialize executor
+
+        Args:
+            code_cache: CompiledScriptCache (optional, default cache bersama)
+            tracer: Tracer untuk span per fase dan cProfile per job (optional,
+                    lihat digsilent_tracing)
+        """
+        self.tracer = tracer or NULL_TRACER
+        with self.tracer.span('discover_paths'):
+            self.pf_paths = self._find_powerfactory_paths()
+        self.code_cache = code_cache or default_code_cache
 
     def _find_powerfactory_paths(self):
         """
-        Cari path instalasi PowerFactory (support 2021 dan 2022)
-        """
-        possible_paths = [
-            # PowerFactory 2021
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021\Python\3.8",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021\Python\3.9",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021\Python\3.10",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021 SP1\Python\3.8",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021 SP1\Python\3.9",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021 SP1\Python\3.10",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021 SP2\Python\3.8",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021 SP2\Python\3.9",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021 SP2\Python\3.10",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021 SP3\Python\3.8",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021 SP3\Python\3.9",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021 SP3\Python\3.10",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021 SP4\Python\3.8",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021 SP4\Python\3.9",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2021 SP4\Python\3.10",
-            # PowerFactory 2022
-            r"C:\Program Files\DIgSILENT\PowerFactory 2022\Python\3.8",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2022\Python\3.9",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2022\Python\3.10",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2022\Python\3.11",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2022 SP1\Python\3.8",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2022 SP1\Python\3.9",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2022 SP1\Python\3.10",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2022 SP1\Python\3.11",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2022 SP2\Python\3.8",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2022 SP2\Python\3.9",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2022 SP2\Python\3.10",
-            r"C:\Program Files\DIgSILENT\PowerFactory 2022 SP2\Python\3.11",
-        ]
+        Cari path instalasi PowerFactory (2021, 2022 dan versi yang lebih baru)
+
+        Memakai discovery yang di-cache (lihat digsilent_discovery), path
+        dengan versi Python yang cocok dengan interpreter ada di depan.
+        """
+        return find_powerfactory_paths()
+
+    def session(self, project_name=None, study_case=None, pf_module=None):
+        """
+        Buat PowerFactorySession yang bisa dipakai ulang untuk banyak skrip
 
-        found_paths = []
-        for path in possible_paths:
-            if os.path.exists(path):
-                found_paths.append(path)
+        Args:
+            project_name: Nama project yang diaktifkan (optional)
+            study_case: Nama study case yang diaktifkan (optional)
+            pf_module: Module powerfactory alternatif, misalnya fake module
+                       untuk testing (optional)
 
-        return found_paths
+        Returns:
+            PowerFactorySession (gunakan dengan statement `with`)
+        """
+        return PowerFactorySession(
+            pf_paths=self.pf_paths,
+            project_name=project_name,
+            study_case=study_case,
+            pf_module=pf_module,
+            code_cache=self.code_cache,
+            tracer=self.tracer
+        )
 
-    def execute_script_direct(self, script_path):
+    def execute_script_direct(self, script_path, extra_globals=None):
         """
         Eksekusi skrip langsung dengan menambahkan PowerFactory path ke sys.path
         Metode ini untuk skrip yang dipanggil dari Python biasa
 
         Args:
             script_path: Path ke skrip yang akan dijalankan
+            extra_globals: Dict tambahan untuk globals skrip (optional)
 
         Returns:
             True jika sukses, False jika gagal
@@ -89,10 +524,13 @@ class DIgSILENTExecutor:
 
         # Execute script
         try:
-            with open(script_path, 'r') as f:
-                script_code = f.read()
+            with self.tracer.span('compile', script=script_path):
+                script_code = self.code_cache.compile_file(script_path)
 
-            exec(script_code, {'__name__': '__main__'})
+            script_globals = {'__name__': '__main__', '__file__': os.path.abspath(script_path)}
+            script_globals.update(extra_globals or {})
+            with self.tracer.span('exec', script=script_path), self.tracer.profile(script_path):
+                exec(script_code, script_globals)
             return True
 
         except Exception as e:
@@ -101,6 +539,30 @@ class DIgSILENTExecutor:
             traceback.print_exc()
             return False
 
+    def build_subprocess_env(self, extra_env=None):
+        """
+        Buat environment untuk subprocess dengan PowerFactory path di PYTHONPATH
+
+        Args:
+            extra_env: Dict environment tambahan (optional)
+
+        Returns:
+            Dict environment
+        """
+        env = os.environ.copy()
+        if extra_env:
+            env.update(extra_env)
+
+        if self.pf_paths:
+            pythonpath = env.get('PYTHONPATH', '')
+            if pythonpath:
+                pythonpath = f"{self.pf_paths[0]}{os.pathsep}{pythonpath}"
+            else:
+                pythonpath = self.pf_paths[0]
+            env['PYTHONPATH'] = pythonpath
+
+        return env
+
     def execute_script_subprocess(self, script_path, python_executable=None):
         """
         Eksekusi skrip menggunakan subprocess
@@ -125,23 +587,17 @@ class DIgSILENTExecutor:
         print("="*60)
 
         # Set environment untuk menambahkan PowerFactory path
-        env = os.environ.copy()
-        if self.pf_paths:
-            pythonpath = env.get('PYTHONPATH', '')
-            if pythonpath:
-                pythonpath = f"{self.pf_paths[0]};{pythonpath}"
-            else:
-                pythonpath = self.pf_paths[0]
-            env['PYTHONPATH'] = pythonpath
+        env = self.build_subprocess_env()
 
         # Execute
         try:
-            result = subprocess.run(
-                [python_executable, script_path],
-                env=env,
-                capture_output=True,
-                text=True
-            )
+            with self.tracer.span('subprocess', script=script_path):
+                result = subprocess.run(
+                    self.tracer.python_command(python_executable, script_path),
+                    env=env,
+                    capture_output=True,
+                    text=True
+                )
 
             # Print output
             if result.stdout:
@@ -164,17 +620,248 @@ class DIgSILENTExecutor:
             print(f"✗ Error executing script: {str(e)}")
             return False
 
-    def execute_in_powerfactory(self, script_path):
+    def stream_script_output(self, script_path, python_executable=None, timeout=None,
+                             max_pending_lines=1000):
+        """
+        Jalankan skrip di subprocess dan baca output baris per baris
+
+        Args:
+            script_path: Path ke skrip yang akan dijalankan
+            python_executable: Path ke Python executable (optional)
+            timeout: Batas waktu total dalam detik (optional)
+            max_pending_lines: Jumlah maksimal baris yang ditahan di memori
+
+        Returns:
+            ScriptOutputStream (iterable of (stream_name, line))
+        """
+        if python_executable is None:
+            python_executable = sys.executable
+
+        return ScriptOutputStream(
+            self.tracer.python_command(python_executable, script_path),
+            env=self.build_subprocess_env(),
+            timeout=timeout,
+            max_pending_lines=max_pending_lines
+        )
+
+    def execute_script_streaming(self, script_path, on_line=None, python_executable=None,
+                                 timeout=None, tail_lines=100):
+        """
+        Eksekusi skrip di subprocess dengan output streaming
+
+        Setiap baris diteruskan saat itu juga (tidak menunggu proses
+        selesai) dan di-parse dengan parse_output_line().
+
+        Args:
+            script_path: Path ke skrip yang akan dijalankan
+            on_line: Callback on_line(stream_name, line, event) (optional).
+                     Jika callback mengembalikan False, subprocess di-kill.
+                     Jika None, output langsung di-print.
+            python_executable: Path ke Python executable (optional)
+            timeout: Batas waktu total dalam detik (optional)
+            tail_lines: Jumlah baris terakhir yang disimpan untuk ringkasan
+
+        Returns:
+            True jika sukses, False jika gagal, timeout atau di-kill
+        """
+        if not os.path.exists(script_path):
+            print(f"✗ Script not found: {script_path}")
+            return False
+
+        print(f"Executing script (streaming): {script_path}")
+        print("="*60)
+
+        try:
+            stream = self.stream_script_output(script_path, python_executable, timeout)
+        except Exception as e:
+            print(f"✗ Error executing script: {str(e)}")
+            return False
+
+        tail = deque(maxlen=tail_lines)
+        events = {}
+
+        for stream_name, line in stream:
+            event = parse_output_line(line)
+            if event is not None:
+                events[event] = events.get(event, 0) + 1
+            tail.append(line)
+
+            if on_line is None:
+                print(line if stream_name == 'stdout' else f"STDERR: {line}")
+            elif on_line(stream_name, line, event) is False:
+                stream.kill()
+
+        print("="*60)
+        if stream.timed_out:
+            print(f"✗ Script timed out after {timeout} seconds")
+            return False
+        if stream.killed:
+            print("✗ Script killed")
+            return False
+        if stream.returncode == 0 and not events.get('failed'):
+            print("✓ Script executed successfully")
+            return True
+
+        print(f"✗ Script failed with return code: {stream.returncode}")
+        return False
+
+    def execute_with_results(self, script_path, method='subprocess', python_executable=None,
+                             timeout=None, session=None, extra_env=None, extra_globals=None):
+        """
+        Eksekusi skrip dan terima hasil terstruktur dari channel hasil
+
+        Status, error code, jumlah iterasi, timing dan array hasil dikirim
+        skrip sebagai payload JSON-lines (lihat digsilent_result_channel),
+        bukan di-scrape dari stdout.
+
+        Args:
+            script_path: Path ke skrip yang akan dijalankan
+            method: Metode eksekusi ('subprocess', 'direct', 'powerfactory')
+            python_executable: Path ke Python executable (optional, subprocess)
+            timeout: Batas waktu dalam detik (optional, subprocess)
+            session: PowerFactorySession yang sudah terbuka (optional, powerfactory)
+            extra_env: Dict environment tambahan (optional, subprocess)
+            extra_globals: Dict globals tambahan (optional, direct/powerfactory)
+
+        Returns:
+            StructuredResult
+        """
+        if not os.path.exists(script_path):
+            print(f"✗ Script not found: {script_path}")
+            return StructuredResult(script_path, [])
+
+        channel = ResultChannel()
+        script_globals = dict(extra_globals or {})
+        script_globals['_digsilent_emit'] = channel.emit
+
+        if method == 'direct':
+            self.execute_script_direct(script_path, extra_globals=script_globals)
+            self.tracer.add_script_spans(channel.payloads, channel.received)
+            return StructuredResult(script_path, channel.payloads)
+
+        if method == 'powerfactory':
+            self.execute_in_powerfactory(script_path, session=session,
+                                         extra_globals=script_globals)
+            self.tracer.add_script_spans(channel.payloads, channel.received)
+            return StructuredResult(script_path, channel.payloads)
+
+        if method != 'subprocess':
+            print(f"✗ Unknown method: {method}")
+            return StructuredResult(script_path, [])
+
+        if python_executable is None:
+            python_executable = sys.executable
+
+        returncode = None
+        timed_out = False
+        stdout = stderr = ''
+
+        with channel:
+            env = channel.child_env(self.build_subprocess_env(extra_env))
+            try:
+                with self.tracer.span('subprocess', script=script_path):
+                    result = subprocess.run(
+                        self.tracer.python_command(python_executable, script_path),
+                        env=env,
+                        capture_output=True,
+                        text=True,
+                        timeout=timeout,
+                        **channel.popen_kwargs()
+                    )
+                returncode = result.returncode
+                stdout = result.stdout
+                stderr = result.stderr
+            except subprocess.TimeoutExpired:
+                timed_out = True
+            except Exception as e:
+                stderr = str(e)
+
+        self.tracer.add_script_spans(channel.payloads, channel.received)
+
+        return StructuredResult(script_path, channel.payloads, returncode=returncode,
+                                timed_out=timed_out, stdout=stdout, stderr=stderr)
+
+    def execute_with_shared_arrays(self, script_path, arrays, method='subprocess', **kwargs):
+        """
+        Eksekusi skrip yang mengisi SharedResultArrays milik caller
+
+        Args:
+            script_path: Path ke skrip (misalnya dari generate_shared_memory_export_script)
+            arrays: SharedResultArrays yang sudah dialokasikan
+            method: Metode eksekusi ('subprocess', 'direct', 'powerfactory')
+            **kwargs: Argumen lain untuk execute_with_results()
+
+        Returns:
+            StructuredResult (array dibaca dengan arrays.array(nama))
+        """
+        return self.execute_with_results(
+            script_path,
+            method=method,
+            extra_env=arrays.child_env(),
+            extra_globals={'_digsilent_shared_arrays': arrays.views()},
+            **kwargs
+        )
+
+    def execute_shared_export(self, element_classes=None, capacity=100000, generator=None,
+                              method='subprocess', **kwargs):
+        """
+        Export hasil elemen ke shared memory dan kembalikan array zero-copy
+
+        Jika kapasitas kurang, buffer dialokasikan ulang sesuai jumlah
+        elemen yang dilaporkan skrip dan skrip dijalankan sekali lagi.
+
+        Args:
+            element_classes: Dict {class: [attribute, ...]} (optional)
+            capacity: Kapasitas awal baris per class
+            generator: DIgSILENTScriptGenerator (optional)
+            method: Metode eksekusi ('subprocess', 'direct', 'powerfactory')
+            **kwargs: Argumen lain untuk execute_with_results()
+
+        Returns:
+            Tuple (StructuredResult, SharedResultArrays). Caller wajib
+            memanggil arrays.close() setelah selesai memakai array.
+        """
+        from digsilent_shared_results import SharedResultArrays
+
+        if generator is None:
+            from digsilent_script_generator import DIgSILENTScriptGenerator
+            generator = DIgSILENTScriptGenerator()
+
+        if element_classes is None:
+            element_classes = generator.COLUMNAR_ATTRIBUTES
+
+        script_path = generator.generate_shared_memory_export_script(element_classes)
+
+        arrays = SharedResultArrays.for_elements(element_classes, capacity)
+        result = self.execute_with_shared_arrays(script_path, arrays, method=method, **kwargs)
+
+        overflow = [p for p in result.events('shared_export') if p.get('status') == 'capacity_exceeded']
+        if overflow:
+            required = max(overflow[-1]['required'].values())
+            print(f"⚠ Shared memory capacity {capacity} too small, retrying with {required}")
+            arrays.close()
+            arrays = SharedResultArrays.for_elements(element_classes, required)
+            result = self.execute_with_shared_arrays(script_path, arrays, method=method, **kwargs)
+
+        return result, arrays
+
+    def execute_in_powerfactory(self, script_path, session=None, extra_globals=None):
         """
         Eksekusi skrip langsung di DIgSILENT PowerFactory
         Menggunakan PowerFactory Python API
 
         Args:
             script_path: Path ke skrip yang akan dijalankan
+            session: PowerFactorySession yang sudah terbuka (optional).
+                     Jika diberikan, koneksi dari session dipakai ulang.
+            extra_globals: Dict tambahan untuk globals skrip (optional)
 
         Returns:
             True jika sukses, False jika gagal
         """
+        if session is not None:
+            return session.execute(script_path, extra_globals=extra_globals)
+
         if not os.path.exists(script_path):
             print(f"✗ Script not found: {script_path}")
             return False
@@ -189,10 +876,12 @@ class DIgSILENTExecutor:
             return False
 
         try:
-            import powerfactory
+            with self.tracer.span('import_powerfactory'):
+                import powerfactory
 
             # Get PowerFactory application
-            app = powerfactory.GetApplication()
+            with self.tracer.span('GetApplication'):
+                app = powerfactory.GetApplication()
             if app is None:
                 print("✗ Cannot connect to PowerFactory. Make sure PowerFactory is running.")
                 return False
@@ -204,15 +893,19 @@ class DIgSILENTExecutor:
             print(f"Executing script: {script_path}")
             print("="*60)
 
-            with open(script_path, 'r') as f:
-                script_code = f.read()
+            with self.tracer.span('compile', script=script_path):
+                script_code = self.code_cache.compile_file(script_path)
 
             # Execute dalam context PowerFactory
-            exec(script_code, {
+            script_globals = {
                 '__name__': '__main__',
+                '__file__': os.path.abspath(script_path),
                 'powerfactory': powerfactory,
                 'pf': powerfactory
-            })
+            }
+            script_globals.update(extra_globals or {})
+            with self.tracer.span('exec', script=script_path), self.tracer.profile(script_path):
+                exec(script_code, script_globals)
 
             print("="*60)
             print("✓ Script executed in PowerFactory context")
@@ -227,29 +920,35 @@ class DIgSILENTExecutor:
             traceback.print_exc()
             return False
 
-    def execute_and_wait(self, script_path, method='direct', wait_time=2):
+    def execute_and_wait(self, script_path, method='direct', wait_time=0):
         """
         Eksekusi skrip dan tunggu selesai
 
+        Eksekusi sudah blocking sampai skrip selesai, jadi tidak perlu
+        sleep tambahan. wait_time hanya untuk jeda manual antar skrip.
+
         Args:
             script_path: Path ke skrip yang akan dijalankan
-            method: Metode eksekusi ('direct', 'subprocess', 'powerfactory')
-            wait_time: Waktu tunggu setelah eksekusi (detik)
+            method: Metode eksekusi ('direct', 'subprocess', 'streaming', 'powerfactory')
+            wait_time: Waktu tunggu tambahan setelah eksekusi (detik, default 0)
 
         Returns:
             True jika sukses, False jika gagal
         """
         start_time = time.time()
 
-        if method == 'direct':
-            success = self.execute_script_direct(script_path)
-        elif method == 'subprocess':
-            success = self.execute_script_subprocess(script_path)
-        elif method == 'powerfactory':
-            success = self.execute_in_powerfactory(script_path)
-        else:
-            print(f"✗ Unknown method: {method}")
-            return False
+        with self.tracer.span('execute_and_wait', method=method, script=script_path):
+            if method == 'direct':
+                success = self.execute_script_direct(script_path)
+            elif method == 'subprocess':
+                success = self.execute_script_subprocess(script_path)
+            elif method == 'streaming':
+                success = self.execute_script_streaming(script_path)
+            elif method == 'powerfactory':
+                success = self.execute_in_powerfactory(script_path)
+            else:
+                print(f"✗ Unknown method: {method}")
+                return False
 
         execution_time = time.time() - start_time
         print(f"\nExecution time: {execution_time:.2f} seconds")
@@ -259,3 +958,176 @@ class DIgSILENTExecutor:
             time.sleep(wait_time)
 
         return success
+
+    def execute_load_flow_chain(self, steps, warm_start=True, generator=None,
+                                method='subprocess', session=None):
+        """
+        Jalankan chain load flow dan kembalikan iterasi/timing per step
+
+        Args:
+            steps: List step, setiap step list [nama objek, attribute, nilai]
+            warm_start: Seed step berikutnya dari solusi sebelumnya
+            generator: DIgSILENTScriptGenerator (optional)
+            method: Metode eksekusi ('subprocess', 'direct', 'powerfactory')
+            session: PowerFactorySession yang sudah terbuka (optional, powerfactory)
+
+        Returns:
+            List dict per step (step, error_code, iterations, elapsed, warm, max_du)
+        """
+        if generator is None:
+            from digsilent_script_generator import DIgSILENTScriptGenerator
+            generator = DIgSILENTScriptGenerator()
+
+        script_path = generator.generate_chained_load_flow_script(steps, warm_start=warm_start)
+        result = self.execute_with_results(script_path, method=method, session=session)
+        rows = result.events('chain_step')
+
+        iterations = [row['iterations'] for row in rows if row['iterations'] is not None]
+        elapsed = sum(row['elapsed'] for row in rows)
+        mode = "warm start" if warm_start else "cold start"
+        print(f"Chain ({mode}): {len(rows)}/{len(steps)} steps, "
+              f"{sum(iterations) if iterations else 'n/a'} iterations, {elapsed:.3f} s in ComLdf")
+        return rows
+
+    def execute_time_series(self, profile_path, targets, outputs, output_dir="results/time_series",
+                            chunk_size=168, generator=None, method='subprocess', session=None):
+        """
+        Jalankan time-series quasi-dynamic dengan output per chunk dan checkpoint
+
+        Jika output_dir sudah berisi checkpoint dari run yang sama, run
+        dilanjutkan dari chunk terakhir yang selesai. Baca hasil dengan
+        digsilent_results.load_time_series() atau iter_time_series_chunks().
+
+        Args:
+            profile_path: Path file profil .npy (n_steps x len(targets))
+            targets: List [nama objek, attribute] per kolom profil
+            outputs: List [nama objek, attribute] yang dibaca setiap step
+            output_dir: Folder chunk hasil dan checkpoint
+            chunk_size: Jumlah step per chunk
+            generator: DIgSILENTScriptGenerator (optional)
+            method: Metode eksekusi ('subprocess', 'direct', 'powerfactory')
+            session: PowerFactorySession yang sudah terbuka (optional, powerfactory)
+
+        Returns:
+            StructuredResult (event 'time_series_chunk' per chunk yang dihitung)
+        """
+        if generator is None:
+            from digsilent_script_generator import DIgSILENTScriptGenerator
+            generator = DIgSILENTScriptGenerator()
+
+        script_path = generator.generate_time_series_script(
+            profile_path, targets, outputs, output_dir=output_dir, chunk_size=chunk_size
+        )
+        return self.execute_with_results(script_path, method=method, session=session)
+
+    def execute_short_circuit(self, terminals=None, fault_type="3psc", options=None,
+                              generator=None, method='subprocess', session=None):
+        """
+        Jalankan short-circuit sweep (ComShc) untuk semua atau sebagian terminal
+
+        Semua lokasi gangguan dihitung dalam satu skrip/session dengan ComShc
+        yang dikonfigurasi sekali, bukan satu skrip per gangguan.
+
+        Args:
+            terminals: List nama ElmTerm (optional, default semua terminal)
+            fault_type: Jenis gangguan iopt_shc (default '3psc')
+            options: Dict attribute ComShc tambahan (optional)
+            generator: DIgSILENTScriptGenerator (optional)
+            method: Metode eksekusi ('subprocess', 'direct', 'powerfactory')
+            session: PowerFactorySession yang sudah terbuka (optional, powerfactory)
+
+        Returns:
+            Dict terminals dan array ikss, ip, ith, error_codes
+            (digsilent_results.load_short_circuit), atau None jika gagal
+        """
+        from digsilent_results import load_short_circuit
+
+        if generator is None:
+            from digsilent_script_generator import DIgSILENTScriptGenerator
+            generator = DIgSILENTScriptGenerator()
+
+        script_path = generator.generate_short_circuit_script(terminals, fault_type=fault_type,
+                                                              options=options)
+        result = self.execute_with_results(script_path, method=method, session=session)
+        return load_short_circuit(result)
+
+    def execute_function(self, func, *args, session=None, audit_generator=None, **kwargs):
+        """
+        Eksekusi fungsi skrip in-process (tanpa generate file)
+
+        Args:
+            func: Fungsi dari digsilent_functions (atau callable func(app, ...))
+            *args, **kwargs: Argumen untuk func
+            session: PowerFactorySession yang sudah terbuka (optional,
+                     jika None session sementara dibuat)
+            audit_generator: DIgSILENTScriptGenerator (optional). Jika
+                             diberikan, skrip audit yang setara ditulis ke disk.
+
+        Returns:
+            Return value func, atau None jika gagal
+        """
+        if audit_generator is not None:
+            audit_generator.generate_function_script(func, *args, **kwargs)
+
+        if session is not None:
+            return session.call(func, *args, **kwargs)
+
+        with self.session() as temp_session:
+            return temp_session.call(func, *args, **kwargs)
+
+    def execute_batch_load_flow(self, study_cases, generator=None, method='powerfactory',
+                                session=None, result_path=None):
+        """
+        Jalankan load flow untuk banyak study case dalam satu skrip
+
+        Args:
+            study_cases: List nama study case
+            generator: DIgSILENTScriptGenerator (optional, dibuat baru jika None)
+            method: Metode eksekusi ('direct', 'subprocess', 'powerfactory')
+            session: PowerFactorySession yang sudah terbuka (optional,
+                     hanya untuk method 'powerfactory')
+            result_path: Path file JSON hasil (optional)
+
+        Returns:
+            List dict per study case (study_case, status, error_code, elapsed),
+            atau None jika eksekusi gagal
+        """
+        if generator is None:
+            from digsilent_script_generator import DIgSILENTScriptGenerator
+            generator = DIgSILENTScriptGenerator()
+
+        script_path = generator.generate_batch_load_flow_script(
+            study_cases, result_path=result_path
+        )
+        if result_path is None:
+            result_path = os.path.splitext(os.path.abspath(script_path))[0] + '_results.json'
+
+        # Hasil run sebelumnya (result_path dari caller atau skrip deterministic
+        # yang dipakai ulang) tidak boleh terbaca sebagai hasil run ini
+        try:
+            os.remove(result_path)
+        except FileNotFoundError:
+            pass
+
+        if method == 'powerfactory':
+            success = self.execute_in_powerfactory(script_path, session=session)
+        else:
+            success = self.execute_and_wait(script_path, method=method, wait_time=0)
+
+        if not success:
+            print("✗ Batch load flow script failed")
+            return None
+
+        if not os.path.exists(result_path):
+            print(f"✗ Batch result not found: {result_path}")
+            return None
+
+        with open(result_path, 'r') as f:
+            results = json.load(f)
+
+        print(f"{'Study Case':<30} {'Status':<10} {'Code':>6} {'Time (s)':>10}")
+        for row in results:
+            code = '' if row['error_code'] is None else row['error_code']
+            print(f"{row['study_case']:<30} {row['status']:<10} {code:>6} {row['elapsed']:>10.3f}")
+
+        return results
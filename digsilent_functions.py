@@ -0,0 +1,653 @@
+"""
+Module berisi versi callable dari template skrip DIgSILENT PowerFactory
+
+Fungsi di sini dipanggil langsung dengan handle aplikasi dari session
+(tanpa generate file). Setiap fungsi self-contained (import di dalam
+fungsi), sehingga source-nya bisa ditulis sebagai skrip audit dengan
+DIgSILENTScriptGenerator.generate_function_script().
+"""
+
+
+def activate_study_case(app, study_case):
+    """
+    Aktifkan study case di project aktif
+
+    Args:
+        app: Handle aplikasi PowerFactory
+        study_case: Nama study case
+
+    Returns:
+        True jika study case ditemukan dan diaktifkan
+    """
+    project = app.GetActiveProject()
+    if project is None:
+        print("Error: No active project")
+        return False
+
+    study_cases = project.GetContents(study_case)
+    if not study_cases:
+        print(f"Warning: Study case '{study_case}' not found")
+        return False
+
+    study_cases[0].Activate()
+    print(f"Activated study case: {study_case}")
+    return True
+
+
+def run_load_flow(app, study_case=None):
+    """
+    Jalankan load flow (versi callable dari template 'load_flow')
+
+    Args:
+        app: Handle aplikasi PowerFactory
+        study_case: Nama study case (optional, default study case aktif)
+
+    Returns:
+        True jika sukses, False jika gagal
+    """
+    project = app.GetActiveProject()
+    if project is None:
+        print("Error: No active project")
+        return False
+
+    if study_case:
+        study_cases = project.GetContents(study_case)
+        if study_cases:
+            study_cases[0].Activate()
+            print(f"Activated study case: {study_case}")
+        else:
+            print(f"Warning: Study case '{study_case}' not found")
+
+    ldf = app.GetFromStudyCase("ComLdf")
+    if ldf is None:
+        print("Error: Cannot get Load Flow command")
+        return False
+
+    print("Executing Load Flow...")
+    result = ldf.Execute()
+
+    if result == 0:
+        print("✓ Load Flow calculation successful")
+        return True
+    else:
+        print(f"✗ Load Flow calculation failed with error code: {result}")
+        return False
+
+
+def run_batch_load_flow(app, study_cases):
+    """
+    Load flow untuk banyak study case (versi callable dari 'batch_load_flow')
+
+    Args:
+        app: Handle aplikasi PowerFactory
+        study_cases: List nama study case
+
+    Returns:
+        List dict per study case (study_case, status, error_code, elapsed)
+    """
+    import time
+
+    project = app.GetActiveProject()
+    if project is None:
+        print("Error: No active project")
+        return None
+
+    results = []
+    for name in study_cases:
+        start = time.perf_counter()
+        row = {"study_case": name, "status": "failed", "error_code": None}
+
+        try:
+            cases = project.GetContents(name)
+            if not cases:
+                row["status"] = "not_found"
+            else:
+                cases[0].Activate()
+
+                ldf = app.GetFromStudyCase("ComLdf")
+                if ldf is None:
+                    row["status"] = "no_ldf"
+                else:
+                    code = ldf.Execute()
+                    row["error_code"] = code
+                    row["status"] = "ok" if code == 0 else "failed"
+        except Exception as e:
+            row["status"] = "error"
+            row["message"] = str(e)
+
+        row["elapsed"] = time.perf_counter() - start
+        results.append(row)
+
+        mark = "✓" if row["status"] == "ok" else "✗"
+        print(f"{mark} {name}: {row['status']} ({row['elapsed']:.3f} s)")
+
+    return results
+
+
+def export_results(app, export_path):
+    """
+    Export tegangan terminal ke CSV (versi callable dari 'export_results')
+
+    Args:
+        app: Handle aplikasi PowerFactory
+        export_path: Path file CSV
+
+    Returns:
+        True jika sukses
+    """
+    import csv
+
+    terminals = app.GetCalcRelevantObjects("*.ElmTerm")
+    print(f"Found {len(terminals)} terminals")
+    print(f"Exporting to: {export_path}")
+
+    with open(export_path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['Name', 'Voltage (kV)', 'Angle (deg)', 'Type'])
+
+        for term in terminals:
+            writer.writerow([
+                term.GetAttribute('loc_name'),
+                term.GetAttribute('m:u'),
+                term.GetAttribute('m:phiu'),
+                term.GetAttribute('iUsage'),
+            ])
+
+    print(f"✓ Exported {len(terminals)} terminals to {export_path}")
+    return True
+
+
+def run_load_flow_chain(app, steps, warm_start=True, warm_start_options=None, emit=None,
+                        cold_start_options=None):
+    """
+    Load flow berurutan untuk titik operasi yang berdekatan (warm start)
+
+    Setiap step meng-apply nilai attribute lalu menjalankan ComLdf. Jika
+    warm_start aktif dan step sebelumnya konvergen, ComLdf dijalankan tanpa
+    inisialisasi ulang (warm_start_options), sehingga PowerFactory memulai
+    iterasi dari solusi yang masih tersimpan di model dari step sebelumnya.
+    Step pertama, step setelah step yang gagal dan semua step dengan
+    warm_start=False dijalankan dengan cold_start_options (inisialisasi
+    penuh, apa pun setting study case). Setting ComLdf dan nilai attribute
+    awal dikembalikan setelah chain selesai.
+
+    Args:
+        app: Handle aplikasi PowerFactory
+        steps: List step, setiap step list [nama objek, attribute, nilai]
+        warm_start: Step berikutnya tanpa inisialisasi ulang jika step
+                    sebelumnya konvergen
+        warm_start_options: Dict attribute ComLdf untuk warm start
+                            (default {"iopt_noinit": 1})
+        emit: Callable emit(**payload) untuk result channel (optional)
+        cold_start_options: Dict attribute ComLdf untuk cold start
+                            (default {"iopt_noinit": 0})
+
+    Returns:
+        List dict per step (step, error_code, iterations, elapsed, warm, max_du)
+    """
+    import time
+
+    ldf = app.GetFromStudyCase("ComLdf")
+    if ldf is None:
+        print("Error: Cannot get Load Flow command")
+        return None
+
+    if warm_start_options is None:
+        warm_start_options = {"iopt_noinit": 1}
+    if cold_start_options is None:
+        cold_start_options = {"iopt_noinit": 0}
+
+    ldf_originals = {}
+    for option in list(warm_start_options) + list(cold_start_options):
+        try:
+            ldf_originals[option] = ldf.GetAttribute(option)
+        except Exception:
+            pass    # attribute tidak bisa dibaca, tidak dikembalikan
+
+    terminals = app.GetCalcRelevantObjects("*.ElmTerm")
+    objects = {}
+    originals = {}
+    state = None
+    results = []
+
+    try:
+        for index, step in enumerate(steps):
+            for name, attribute, value in step:
+                if name not in objects:
+                    found = app.GetCalcRelevantObjects(name)
+                    if not found:
+                        raise KeyError(f"Object not found: {name}")
+                    objects[name] = found[0]
+                if (name, attribute) not in originals:
+                    originals[(name, attribute)] = objects[name].GetAttribute(attribute)
+                objects[name].SetAttribute(attribute, value)
+
+            warm = warm_start and state is not None
+            for option, value in (warm_start_options if warm else cold_start_options).items():
+                ldf.SetAttribute(option, value)
+
+            start = time.perf_counter()
+            error_code = ldf.Execute()
+            elapsed = time.perf_counter() - start
+
+            try:
+                iterations = ldf.GetAttribute("c:iter")
+                iterations = None if iterations is None else int(iterations)
+            except Exception:
+                iterations = None
+
+            max_du = None
+            if error_code == 0:
+                # Tegangan hanya untuk max_du (perubahan terhadap step sebelumnya);
+                # warm start memakai solusi yang tersimpan di model, bukan state ini
+                voltages = [term.GetAttribute("m:u") for term in terminals]
+                if state is not None and voltages:
+                    max_du = max(abs(u - u_prev) for u, u_prev in zip(voltages, state))
+                state = voltages
+            else:
+                state = None
+
+            row = {"step": index, "error_code": error_code, "iterations": iterations,
+                   "elapsed": elapsed, "warm": warm, "max_du": max_du}
+            results.append(row)
+            if emit is not None:
+                emit(event="chain_step", **row)
+
+            mark = "✓" if error_code == 0 else "✗"
+            mode = "warm" if warm else "cold"
+            print(f"{mark} Step {index} ({mode}): code {error_code}, iterations {iterations}, {elapsed:.3f} s")
+
+    finally:
+        for option, value in ldf_originals.items():
+            ldf.SetAttribute(option, value)
+        for (name, attribute), value in originals.items():
+            objects[name].SetAttribute(attribute, value)
+
+    return results
+
+
+def run_time_series(app, profile_path, targets, outputs, output_dir, chunk_size=168, emit=None):
+    """
+    Quasi-dynamic time-series: load flow per step dari profil memory-mapped
+
+    Profil adalah file .npy berbentuk (n_steps, len(targets)) yang dibuka
+    dengan mmap, sehingga hanya chunk yang sedang dihitung yang dibaca.
+    Hasil ditulis per chunk ke output_dir (values_NNNNN.npy dan
+    codes_NNNNN.npy) dan checkpoint.json diperbarui setelah setiap chunk.
+    Jika run terputus, pemanggilan ulang dengan argumen dan file profil
+    yang sama (path, mtime, ukuran) melanjutkan dari chunk terakhir yang
+    selesai.
+
+    Args:
+        app: Handle aplikasi PowerFactory
+        profile_path: Path file profil .npy (n_steps x len(targets))
+        targets: List [nama objek, attribute] per kolom profil
+        outputs: List [nama objek, attribute] yang dibaca setiap step
+        output_dir: Folder chunk hasil dan checkpoint
+        chunk_size: Jumlah step per chunk (default 168 = satu minggu per jam)
+        emit: Callable emit(**payload) untuk result channel (optional)
+
+    Returns:
+        Dict ringkasan (n_steps, chunks, failed, resumed_from), atau None jika gagal
+    """
+    import json
+    import os
+    import time
+
+    import numpy as np
+
+    ldf = app.GetFromStudyCase("ComLdf")
+    if ldf is None:
+        print("Error: Cannot get Load Flow command")
+        return None
+
+    profile = np.load(profile_path, mmap_mode="r")
+    if profile.ndim != 2 or profile.shape[1] != len(targets):
+        print(f"Error: Profile shape {profile.shape} does not match {len(targets)} targets")
+        return None
+    n_steps = profile.shape[0]
+
+    os.makedirs(output_dir, exist_ok=True)
+    checkpoint_path = os.path.join(output_dir, "checkpoint.json")
+    # mtime dan ukuran: profil yang di-generate ulang (shape sama) tidak melanjutkan chunk lama
+    profile_stat = os.stat(profile_path)
+    signature = {
+        "profile": os.path.abspath(profile_path),
+        "profile_mtime_ns": profile_stat.st_mtime_ns,
+        "profile_size": profile_stat.st_size,
+        "n_steps": n_steps,
+        "targets": [list(target) for target in targets],
+        "outputs": [list(output) for output in outputs],
+        "chunk_size": chunk_size,
+    }
+
+    checkpoint = {"signature": signature, "next_step": 0, "chunks": []}
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path, "r") as f:
+            previous = json.load(f)
+        if previous.get("signature") == signature:
+            checkpoint = previous
+            print(f"Resuming time series at step {checkpoint['next_step']}/{n_steps}")
+        else:
+            print("⚠ Checkpoint belongs to a different run, starting from step 0")
+    resumed_from = checkpoint["next_step"]
+
+    objects = {}
+    for name, _ in list(targets) + list(outputs):
+        if name not in objects:
+            found = app.GetCalcRelevantObjects(name)
+            if not found:
+                print(f"Error: Object not found: {name}")
+                return None
+            objects[name] = found[0]
+    target_objects = [(objects[name], attribute) for name, attribute in targets]
+    output_objects = [(objects[name], attribute) for name, attribute in outputs]
+    originals = [(obj, attribute, obj.GetAttribute(attribute)) for obj, attribute in target_objects]
+
+    def save_atomic(path, array):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp_path, path)
+
+    try:
+        step = checkpoint["next_step"]
+        while step < n_steps:
+            stop = min(step + chunk_size, n_steps)
+            values = np.full((stop - step, len(output_objects)), np.nan)
+            codes = np.zeros(stop - step, dtype=np.int32)
+
+            start = time.perf_counter()
+            for row, profile_row in enumerate(profile[step:stop]):
+                for (obj, attribute), value in zip(target_objects, profile_row):
+                    obj.SetAttribute(attribute, float(value))
+                codes[row] = ldf.Execute()
+                if codes[row] == 0:
+                    for column, (obj, attribute) in enumerate(output_objects):
+                        values[row, column] = obj.GetAttribute(attribute)
+            elapsed = time.perf_counter() - start
+
+            index = len(checkpoint["chunks"])
+            chunk = {"index": index, "start": step, "stop": stop,
+                     "values": f"values_{index:05d}.npy", "codes": f"codes_{index:05d}.npy",
+                     "failed": int(np.count_nonzero(codes)), "elapsed": elapsed}
+            save_atomic(os.path.join(output_dir, chunk["values"]), values)
+            save_atomic(os.path.join(output_dir, chunk["codes"]), codes)
+
+            checkpoint["chunks"].append(chunk)
+            checkpoint["next_step"] = stop
+            tmp_path = checkpoint_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(checkpoint, f, indent=2)
+            os.replace(tmp_path, checkpoint_path)
+
+            if emit is not None:
+                emit(event="time_series_chunk", **chunk)
+            print(f"Progress: step {stop}/{n_steps} ({chunk['failed']} failed, {elapsed:.2f} s)")
+            step = stop
+
+    finally:
+        for obj, attribute, value in originals:
+            obj.SetAttribute(attribute, value)
+
+    failed = sum(chunk["failed"] for chunk in checkpoint["chunks"])
+    print(f"✓ Time series finished: {n_steps} steps, {len(checkpoint['chunks'])} chunks, {failed} failed")
+    return {"n_steps": n_steps, "chunks": len(checkpoint["chunks"]), "failed": failed,
+            "resumed_from": resumed_from}
+
+
+def list_outages(app, classes=("ElmLne", "ElmTr2")):
+    """
+    Daftar kandidat outage N-1 (elemen yang sedang in service)
+
+    Args:
+        app: Handle aplikasi PowerFactory
+        classes: Class elemen yang di-outage
+
+    Returns:
+        List nama objek "<loc_name>.<class>"
+    """
+    outages = []
+    for class_name in classes:
+        for obj in app.GetCalcRelevantObjects(f"*.{class_name}"):
+            try:
+                if obj.GetAttribute("outserv"):
+                    continue
+            except Exception:
+                pass
+            outages.append(f"{obj.GetAttribute('loc_name')}.{class_name}")
+    return outages
+
+
+def run_contingencies(app, outages, v_min=0.95, v_max=1.05, max_loading=100.0, emit=None,
+                      index=None):
+    """
+    Load flow N-1 untuk daftar outage dan hitung pelanggaran batas
+
+    Setiap outage di-set outserv = 1, ComLdf dijalankan, lalu tegangan
+    bus (m:u di luar v_min..v_max) dan loading cabang (c:loading di atas
+    max_loading) diperiksa. Status outserv asli selalu dikembalikan.
+    Base case dihitung dulu agar pelanggaran yang sudah ada bisa dipisahkan.
+    Dengan index, objek diambil dari NetworkIndex dan outserv di-set lewat
+    index.set_attribute() sehingga index di-invalidate setiap outage.
+
+    Args:
+        app: Handle aplikasi PowerFactory
+        outages: List nama objek "<loc_name>.<class>"
+        v_min, v_max: Batas tegangan bus (p.u.)
+        max_loading: Batas loading cabang (%)
+        emit: Callable emit(**payload) untuk result channel (optional)
+        index: NetworkIndex session (optional, misalnya session.network_index())
+
+    Returns:
+        List dict per outage (outage, error_code, elapsed, violations,
+        min_voltage, max_voltage, max_loading), atau None jika gagal
+    """
+    import time
+
+    ldf = app.GetFromStudyCase("ComLdf")
+    if ldf is None:
+        print("Error: Cannot get Load Flow command")
+        return None
+
+    def elements(class_name):
+        if index is not None:
+            return list(zip(index.names(class_name), index.objects(class_name)))
+        return [(obj.GetAttribute("loc_name"), obj)
+                for obj in app.GetCalcRelevantObjects(f"*.{class_name}")]
+
+    def set_outserv(element, value):
+        if index is not None:
+            index.set_attribute(element, "outserv", value)
+        else:
+            element.SetAttribute("outserv", value)
+
+    terminals = elements("ElmTerm")
+    branches = elements("ElmLne") + elements("ElmTr2")
+
+    # Objek outage di-resolve sekali, sebelum index di-invalidate oleh outage pertama
+    targets = []
+    for outage in outages:
+        if index is not None:
+            element = index.get(outage)
+        else:
+            found = app.GetCalcRelevantObjects(outage)
+            element = found[0] if found else None
+        if element is None:
+            print(f"⚠ Outage element not found: {outage}")
+            continue
+        targets.append((outage, element))
+
+    def check():
+        violations = []
+        voltages = []
+        for name, term in terminals:
+            u = term.GetAttribute("m:u")
+            voltages.append(u)
+            if u < v_min or u > v_max:
+                violations.append(["voltage", name, u])
+        loadings = []
+        for name, branch in branches:
+            loading = branch.GetAttribute("c:loading")
+            loadings.append(loading)
+            if loading > max_loading:
+                violations.append(["loading", name, loading])
+        return {"violations": violations,
+                "min_voltage": min(voltages) if voltages else None,
+                "max_voltage": max(voltages) if voltages else None,
+                "max_loading": max(loadings) if loadings else None}
+
+    base_code = ldf.Execute()
+    base = check() if base_code == 0 else {"violations": []}
+    if emit is not None:
+        emit(event="contingency_base", error_code=base_code, violations=base["violations"])
+
+    results = []
+    for outage, element in targets:
+        original = element.GetAttribute("outserv")
+
+        start = time.perf_counter()
+        set_outserv(element, 1)
+        try:
+            error_code = ldf.Execute()
+            state = check() if error_code == 0 else {}
+        finally:
+            set_outserv(element, original)
+        elapsed = time.perf_counter() - start
+
+        row = {"outage": outage, "error_code": error_code, "elapsed": elapsed,
+               "violations": state.get("violations", []),
+               "min_voltage": state.get("min_voltage"),
+               "max_voltage": state.get("max_voltage"),
+               "max_loading": state.get("max_loading")}
+        results.append(row)
+        if emit is not None:
+            emit(event="contingency", **row)
+
+    print(f"✓ Contingencies solved: {len(results)}/{len(outages)}")
+    return results
+
+
+def run_short_circuit_sweep(app, terminals=None, fault_type="3psc", options=None, emit=None):
+    """
+    Hitung hubung singkat (ComShc) untuk banyak lokasi gangguan dalam satu session
+
+    ComShc dikonfigurasi sekali (default IEC 60909, iopt_mde = 1). Tanpa
+    subset terminal, semua busbar dihitung dengan satu Execute()
+    (iopt_allbus = 1); dengan subset, lokasi gangguan (shc_term) diganti
+    per terminal tanpa konfigurasi ulang. Ik'' (m:Ikss), ip (m:ip) dan
+    Ith (m:Ith) dikumpulkan sebagai kolom. Setting ComShc asli (termasuk
+    yang bernilai None, misalnya shc_term) dikembalikan setelah selesai.
+
+    Args:
+        app: Handle aplikasi PowerFactory
+        terminals: List nama ElmTerm (optional, default semua terminal)
+        fault_type: Jenis gangguan iopt_shc ('3psc', 'spgf', '2psc', ...)
+        options: Dict attribute ComShc tambahan (optional); iopt_mde,
+                 iopt_shc, iopt_allbus dan shc_term diatur oleh sweep dan
+                 tidak bisa di-override
+        emit: Callable emit(**payload) untuk result channel (optional)
+
+    Returns:
+        Dict kolom (terminals, ikss, ip, ith, error_codes) dan elapsed,
+        satu baris per terminal dengan urutan sama seperti input; nilai
+        None untuk lokasi yang gagal dihitung dan error code -1 untuk
+        terminal yang tidak ditemukan; None jika gagal
+    """
+    import time
+
+    shc = app.GetFromStudyCase("ComShc")
+    if shc is None:
+        print("Error: Cannot get Short-Circuit command")
+        return None
+
+    if terminals is None:
+        objects = app.GetCalcRelevantObjects("*.ElmTerm")
+        names = [term.GetAttribute("loc_name") for term in objects]
+    else:
+        # Terminal yang tidak ditemukan tetap dapat baris (objek None)
+        objects = []
+        names = []
+        for name in terminals:
+            name = name[:-len(".ElmTerm")] if name.endswith(".ElmTerm") else name
+            found = app.GetCalcRelevantObjects(f"{name}.ElmTerm")
+            if not found:
+                print(f"⚠ Terminal not found: {name}")
+            objects.append(found[0] if found else None)
+            names.append(found[0].GetAttribute("loc_name") if found else name)
+
+    # Mode sweep di-apply terakhir sehingga options tidak bisa mengubahnya
+    mode = {"iopt_mde": 1, "iopt_shc": fault_type,
+            "iopt_allbus": 1 if terminals is None else 0}
+    settings = dict(options or {})
+    ignored = sorted(set(settings).intersection(mode, ["shc_term"]))
+    if ignored:
+        print(f"⚠ Short-circuit options ignored (set by the sweep): {', '.join(ignored)}")
+    for option in ignored:
+        del settings[option]
+    settings.update(mode)
+
+    originals = {}
+    for option in list(settings) + ["shc_term"]:
+        try:
+            originals[option] = shc.GetAttribute(option)
+        except Exception:
+            pass    # attribute tidak bisa dibaca, tidak dikembalikan
+
+    def read(term):
+        values = []
+        for attribute in ("m:Ikss", "m:ip", "m:Ith"):
+            try:
+                value = term.GetAttribute(attribute)
+                values.append(None if value is None else float(value))
+            except Exception:
+                values.append(None)
+        return values
+
+    columns = {"ikss": [], "ip": [], "ith": []}
+    error_codes = []
+
+    start = time.perf_counter()
+    try:
+        for option, value in settings.items():
+            shc.SetAttribute(option, value)
+
+        if terminals is None:
+            error_code = shc.Execute()
+            rows = [read(term) if error_code == 0 else [None, None, None] for term in objects]
+            error_codes = [error_code] * len(objects)
+        else:
+            rows = []
+            for index, term in enumerate(objects):
+                if term is None:
+                    rows.append([None, None, None])
+                    error_codes.append(-1)
+                    continue
+                shc.SetAttribute("shc_term", term)
+                error_code = shc.Execute()
+                rows.append(read(term) if error_code == 0 else [None, None, None])
+                error_codes.append(error_code)
+                if (index + 1) % 500 == 0:
+                    print(f"Progress: {index + 1}/{len(objects)} fault locations")
+    finally:
+        for option, value in originals.items():
+            try:
+                shc.SetAttribute(option, value)
+            except Exception as e:
+                print(f"⚠ Cannot restore ComShc {option}: {e}")
+
+    for ikss, ip, ith in rows:
+        columns["ikss"].append(ikss)
+        columns["ip"].append(ip)
+        columns["ith"].append(ith)
+
+    elapsed = time.perf_counter() - start
+    failed = sum(1 for code in error_codes if code != 0)
+    result = {"terminals": names, "error_codes": error_codes, "elapsed": elapsed,
+              "fault_type": fault_type, **columns}
+    if emit is not None:
+        emit(event="short_circuit", **result)
+
+    mark = "✓" if failed == 0 else "⚠"
+    print(f"{mark} Short-circuit: {len(names) - failed}/{len(names)} fault locations in {elapsed:.3f} s")
+    return result
@@ -0,0 +1,181 @@
+"""
+Module untuk antrian job yang tidak menjalankan ulang studi yang identik
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from digsilent_executor import DIgSILENTExecutor
+
+
+# Header timestamp skrip mode non-deterministic, tidak ikut di key job
+_GENERATED_AT = re.compile(rb'^Generated at: .*$', re.MULTILINE)
+
+
+class DeduplicatingJobQueue:
+    """
+    Antrian job di depan executor dengan dedup berdasarkan isi skrip
+
+    Key job = SHA-256 dari isi skrip (tanpa header timestamp) + fingerprint
+    project (versi model). Job dengan key yang sama:
+    - sudah pernah sukses dan masih di cache: hasil cache dikembalikan
+    - sedang berjalan: submission digabung ke Future yang sama
+    Cache dibatasi jumlah entry (LRU) dan umur entry (detik).
+
+    Eksekusi memakai executor.execute_with_results(); default 'subprocess'
+    karena job bisa berjalan bersamaan di beberapa thread.
+
+    Contoh:
+        queue = DeduplicatingJobQueue(executor, fingerprint=lambda: model_version)
+        futures = [queue.submit(generator.generate_load_flow_script()) for _ in range(10)]
+        results = [f.result() for f in futures]     # satu eksekusi
+    """
+
+    def __init__(self, executor=None, method='subprocess', max_workers=4, max_entries=256,
+                 max_age=3600, fingerprint=None, **execute_kwargs):
+        """
+        Initialize queue
+
+        Args:
+            executor: DIgSILENTExecutor (optional, dibuat baru jika None)
+            method: Metode eksekusi untuk execute_with_results()
+            max_workers: Jumlah job yang berjalan bersamaan
+            max_entries: Jumlah maksimal hasil di cache
+            max_age: Umur maksimal hasil di cache dalam detik (None = tanpa batas)
+            fingerprint: String atau callable -> string yang menandai versi
+                         project/model (wajib). Callable dievaluasi setiap
+                         submit, sehingga perubahan model langsung membuat
+                         job dijalankan ulang
+            **execute_kwargs: Argumen lain untuk execute_with_results()
+        """
+        if fingerprint is None:
+            raise ValueError("DeduplicatingJobQueue needs a project fingerprint (string or callable), "
+                             "otherwise cached results survive model changes")
+
+        self.executor = executor or DIgSILENTExecutor()
+        self.method = method
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.fingerprint = fingerprint
+        self.execute_kwargs = execute_kwargs
+        self.hits = 0
+        self.merged = 0
+        self.executed = 0
+        self.evictions = 0
+        self._cache = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+        return False
+
+    def _fingerprint(self):
+        if callable(self.fingerprint):
+            return str(self.fingerprint())
+        return str(self.fingerprint)
+
+    def job_key(self, script_path):
+        """
+        Key job dari isi skrip dan fingerprint project
+
+        Returns:
+            String hex SHA-256
+        """
+        with open(script_path, 'rb') as f:
+            content = _GENERATED_AT.sub(b'', f.read())
+        digest = hashlib.sha256(content)
+        digest.update(b'\0' + self._fingerprint().encode('utf-8'))
+        return digest.hexdigest()
+
+    def _evict(self, now):
+        """Hapus entry yang kadaluarsa dan entry LRU di atas max_entries"""
+        if self.max_age is not None:
+            expired = [key for key, (_, stored) in self._cache.items() if now - stored > self.max_age]
+            for key in expired:
+                del self._cache[key]
+            self.evictions += len(expired)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+
+    def submit(self, script_path):
+        """
+        Submit skrip, kembalikan Future berisi StructuredResult
+
+        Args:
+            script_path: Path skrip (misalnya dari DIgSILENTScriptGenerator)
+
+        Returns:
+            concurrent.futures.Future
+        """
+        key = self.job_key(script_path)
+        now = time.time()
+
+        with self._lock:
+            self._evict(now)
+
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                future = Future()
+                future.set_result(cached[0])
+                return future
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.merged += 1
+                return future
+
+            future = self._pool.submit(self._execute, key, script_path)
+            self._in_flight[key] = future
+            return future
+
+    def _execute(self, key, script_path):
+        try:
+            result = self.executor.execute_with_results(script_path, method=self.method,
+                                                        **self.execute_kwargs)
+            with self._lock:
+                self.executed += 1
+                # Hanya hasil sukses yang di-cache, job gagal dijalankan ulang
+                if result.success:
+                    self._cache[key] = (result, time.time())
+                    self._evict(time.time())
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def run(self, script_path):
+        """Submit dan tunggu hasil (blocking)"""
+        return self.submit(script_path).result()
+
+    def invalidate(self):
+        """Kosongkan cache hasil (misalnya setelah model berubah)"""
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self):
+        """Counter cache: hits, merged, executed, evictions, entries, in_flight"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'merged': self.merged,
+                'executed': self.executed,
+                'evictions': self.evictions,
+                'entries': len(self._cache),
+                'in_flight': len(self._in_flight),
+            }
+
+    def shutdown(self, wait=True):
+        """Hentikan thread pool"""
+        self._pool.shutdown(wait=wait)
@@ -0,0 +1,172 @@
+"""
+Module untuk index elemen jaringan di atas GetCalcRelevantObjects
+"""
+
+
+class NetworkIndex:
+    """
+    Index elemen jaringan per session
+
+    Setiap class elemen diambil sekali dengan GetCalcRelevantObjects, lalu
+    dibuat map nama -> objek dan id objek -> posisi di list class. Lookup
+    seperti "ambil bus berdasarkan nama" menjadi O(1) tanpa scan list.
+
+    Index otomatis di-invalidate jika session reconnect, dan bisa
+    di-invalidate manual (invalidate()) atau lewat set_attribute() untuk
+    attribute yang mengubah topologi.
+
+    Contoh:
+        with executor.session() as session:
+            index = session.network_index()
+            bus = index.lookup("Bus 1.ElmTerm")
+            position = index.position(bus)      # baris di index.objects("ElmTerm")
+            index.set_attribute(index.lookup("Line 1.ElmLne"), "outserv", 1)   # invalidate
+    """
+
+    # Attribute yang mengubah topologi (outage elemen, status switch)
+    TOPOLOGY_ATTRIBUTES = ("outserv", "on_off")
+
+    def __init__(self, source):
+        """
+        Initialize index
+
+        Args:
+            source: PowerFactorySession (atau handle aplikasi PowerFactory)
+        """
+        self.source = source
+        self.generation = 0
+        self.fetches = 0
+        self._connect_count = getattr(source, 'connect_count', None)
+        self._objects = {}
+        self._names = {}
+        self._by_name = {}
+        self._positions = {}
+
+    def _app(self):
+        if hasattr(self.source, 'ensure_connected'):
+            app = self.source.ensure_connected()
+            if self.source.connect_count != self._connect_count:
+                # Handle baru setelah reconnect: objek lama tidak valid lagi
+                self._connect_count = self.source.connect_count
+                self.invalidate()
+            return app
+        return self.source
+
+    def invalidate(self, class_name=None):
+        """
+        Hapus isi index (semua class atau satu class)
+
+        Panggil setelah operasi yang mengubah topologi atau isi model
+        (switching, tambah/hapus elemen, aktivasi study case/variation).
+        """
+        class_names = list(self._objects) if class_name is None else [class_name]
+        for name in class_names:
+            for obj in self._objects.pop(name, []):
+                self._positions.pop(id(obj), None)
+            self._names.pop(name, None)
+            self._by_name.pop(name, None)
+        self.generation += 1
+
+    def _load(self, class_name):
+        app = self._app()
+        if class_name in self._objects:
+            return
+
+        objects = list(app.GetCalcRelevantObjects(f"*.{class_name}") or [])
+        names = [obj.GetAttribute("loc_name") for obj in objects]
+        self.fetches += 1
+
+        self._objects[class_name] = objects
+        self._names[class_name] = names
+        self._by_name[class_name] = {name: obj for name, obj in zip(names, objects)}
+        for position, obj in enumerate(objects):
+            self._positions[id(obj)] = (class_name, position)
+
+    def objects(self, class_name):
+        """List objek satu class (diambil sekali)"""
+        self._load(class_name)
+        return self._objects[class_name]
+
+    def names(self, class_name):
+        """List loc_name satu class, urutan sama dengan objects()"""
+        self._load(class_name)
+        return self._names[class_name]
+
+    @staticmethod
+    def _split(name, class_name):
+        if class_name is None:
+            name, _, class_name = name.rpartition('.')
+            if not name:
+                raise KeyError(f"Object name needs a class suffix: {class_name}")
+        return name, class_name
+
+    def get(self, name, class_name=None, default=None):
+        """
+        Ambil objek berdasarkan nama
+
+        Args:
+            name: "<loc_name>.<class>" atau loc_name jika class_name diisi
+            class_name: Class elemen (optional)
+            default: Nilai jika objek tidak ada
+
+        Returns:
+            Objek PowerFactory atau default
+        """
+        name, class_name = self._split(name, class_name)
+        self._load(class_name)
+        return self._by_name[class_name].get(name, default)
+
+    def lookup(self, name, class_name=None):
+        """Seperti get(), tapi raise KeyError jika objek tidak ada"""
+        obj = self.get(name, class_name)
+        if obj is None:
+            raise KeyError(f"Object not found: {name}")
+        return obj
+
+    def position(self, obj):
+        """
+        Posisi objek di list class-nya (objek harus berasal dari index)
+
+        Returns:
+            Index baris di objects(class_name)
+        """
+        try:
+            return self._positions[id(obj)][1]
+        except KeyError:
+            raise KeyError(f"Object is not in the network index: {obj!r}")
+
+    def read(self, class_name, attributes, **kwargs):
+        """
+        Baca attribute semua objek satu class ke kolom typed
+
+        Args:
+            class_name: Class elemen, misalnya "ElmTerm"
+            attributes: List nama attribute
+            **kwargs: Argumen lain untuk digsilent_bulk_reader.read_attributes()
+
+        Returns:
+            AttributeColumns, baris sama dengan objects(class_name)
+        """
+        from digsilent_bulk_reader import read_attributes
+        return read_attributes(self.objects(class_name), attributes, **kwargs)
+
+    def set_attribute(self, obj, attribute, value):
+        """
+        SetAttribute yang meng-invalidate index untuk attribute topologi
+
+        Returns:
+            Return value SetAttribute
+        """
+        result = obj.SetAttribute(attribute, value)
+        if attribute in self.TOPOLOGY_ATTRIBUTES:
+            self.invalidate()
+        return result
+
+    def stats(self):
+        """Jumlah class dan objek yang ter-index, fetch dan generation"""
+        return {
+            'classes': len(self._objects),
+            'objects': len(self._positions),
+            'fetches': self.fetches,
+            'generation': self.generation,
+        }
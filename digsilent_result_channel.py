@@ -0,0 +1,145 @@
+"""
+Module untuk channel hasil terstruktur dari skrip DIgSILENT ke executor
+
+Skrip yang di-generate mengirim payload JSON-lines (status, error code
+ComLdf.Execute(), jumlah iterasi, timing, array hasil) lewat pipe
+terpisah dari stdout, sehingga executor tidak perlu parsing teks output.
+"""
+
+import json
+import os
+import subprocess
+import threading
+import time
+
+
+class ResultChannel:
+    """
+    Sisi pembaca channel hasil
+
+    Subprocess: pipe OS, write end diwariskan ke child (DIGSILENT_RESULT_FD
+    di POSIX, DIGSILENT_RESULT_HANDLE di Windows). In-process: callable
+    emit() dipasang sebagai _digsilent_emit di globals skrip.
+
+    Contoh:
+        with ResultChannel() as channel:
+            subprocess.run(args, env=channel.child_env(env), **channel.popen_kwargs())
+        print(channel.payloads)
+    """
+
+    def __init__(self):
+        self.payloads = []
+        self.received = []
+        self.errors = []
+        self._read_fd = None
+        self._write_fd = None
+        self._reader = None
+
+    def emit(self, payload):
+        """Terima payload langsung (mode in-process)"""
+        self.payloads.append(payload)
+        self.received.append(time.perf_counter())
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def open(self):
+        """Buat pipe dan mulai thread pembaca"""
+        self._read_fd, self._write_fd = os.pipe()
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def _read(self):
+        with os.fdopen(self._read_fd, 'rb') as pipe:
+            for line in pipe:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self.payloads.append(json.loads(line.decode('utf-8')))
+                    self.received.append(time.perf_counter())
+                except ValueError:
+                    self.errors.append(line)
+
+    def child_env(self, env=None):
+        """
+        Environment untuk child process
+
+        Args:
+            env: Environment dasar (optional, default os.environ)
+
+        Returns:
+            Dict environment dengan lokasi write end pipe
+        """
+        env = dict(os.environ if env is None else env)
+        if os.name == 'nt':
+            import msvcrt
+            env['DIGSILENT_RESULT_HANDLE'] = str(msvcrt.get_osfhandle(self._write_fd))
+        else:
+            env['DIGSILENT_RESULT_FD'] = str(self._write_fd)
+        return env
+
+    def popen_kwargs(self):
+        """
+        Argumen tambahan untuk subprocess.run/Popen agar write end diwariskan
+
+        Returns:
+            Dict keyword arguments
+        """
+        if os.name == 'nt':
+            import msvcrt
+            handle = msvcrt.get_osfhandle(self._write_fd)
+            os.set_handle_inheritable(handle, True)
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.lpAttributeList = {'handle_list': [handle]}
+            return {'startupinfo': startupinfo}
+        return {'pass_fds': (self._write_fd,)}
+
+    def close(self):
+        """Tutup write end di parent dan tunggu semua payload terbaca"""
+        if self._write_fd is not None:
+            os.close(self._write_fd)
+            self._write_fd = None
+        if self._reader is not None:
+            self._reader.join()
+            self._reader = None
+
+
+class StructuredResult:
+    """
+    Hasil eksekusi skrip beserta payload dari channel hasil
+    """
+
+    def __init__(self, script_path, payloads, returncode=None, timed_out=False,
+                 stdout='', stderr=''):
+        self.script_path = script_path
+        self.payloads = payloads
+        self.returncode = returncode
+        self.timed_out = timed_out
+        self.stdout = stdout
+        self.stderr = stderr
+
+    def events(self, event):
+        """List payload dengan event tertentu (misalnya 'load_flow')"""
+        return [payload for payload in self.payloads if payload.get('event') == event]
+
+    @property
+    def status(self):
+        """Status akhir skrip dari payload event 'script' (None jika tidak ada)"""
+        scripts = self.events('script')
+        return scripts[-1].get('status') if scripts else None
+
+    @property
+    def success(self):
+        if self.timed_out or self.returncode not in (None, 0):
+            return False
+        return self.status == 'ok'
+
+    def __repr__(self):
+        return (f"StructuredResult(script={os.path.basename(self.script_path)!r}, "
+                f"status={self.status!r}, returncode={self.returncode}, payloads={len(self.payloads)})")
@@ -0,0 +1,377 @@
+"""
+Module untuk menyimpan hasil studi DIgSILENT PowerFactory secara terindeks (SQLite)
+"""
+
+import csv
+import json
+import os
+import sqlite3
+import time
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    study_case TEXT,
+    label TEXT,
+    created REAL NOT NULL,
+    source TEXT,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_study_case ON runs (study_case, run_id);
+CREATE INDEX IF NOT EXISTS idx_runs_created ON runs (created);
+
+CREATE TABLE IF NOT EXISTS elements (
+    element_id INTEGER PRIMARY KEY,
+    class_name TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (class_name, name)
+);
+
+CREATE TABLE IF NOT EXISTS attributes (
+    attribute_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    element_id INTEGER NOT NULL,
+    attribute_id INTEGER NOT NULL,
+    run_id INTEGER NOT NULL,
+    value,
+    PRIMARY KEY (element_id, attribute_id, run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_results_run ON results (run_id);
+"""
+
+# Kolom CSV dari generate_export_results_script -> attribute ElmTerm
+CSV_EXPORT_COLUMNS = {
+    'Voltage (kV)': 'm:u',
+    'Angle (deg)': 'm:phiu',
+    'Type': 'iUsage',
+}
+
+
+def _split_element(element, class_name):
+    """'Bus 1.ElmTerm' -> ('Bus 1', 'ElmTerm') jika class_name tidak diisi"""
+    if class_name is None:
+        element, _, class_name = element.rpartition('.')
+        if not element:
+            raise ValueError(f"Element name needs a class suffix: {class_name}")
+    return element, class_name
+
+
+def _number(text):
+    """Konversi nilai CSV ke angka jika bisa"""
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+class ResultStore:
+    """
+    Penyimpanan hasil studi per run, study case, elemen dan attribute
+
+    Setiap export/run disimpan sebagai satu run (run_id, study case,
+    timestamp). Nilai disimpan di tabel results dengan primary key
+    (elemen, attribute, run), sehingga query "tegangan bus X di 500 run
+    terakhir" adalah range scan di index, bukan scan semua data.
+
+    Contoh:
+        with ResultStore("results/results.db") as store:
+            run_id = store.import_csv("results/exported_data.csv", study_case="Base Case")
+            for run_id, created, value in store.history("Bus 1.ElmTerm", "m:u", last=500):
+                print(run_id, value)
+    """
+
+    def __init__(self, path="results/results.db"):
+        """
+        Initialize store (file database dibuat jika belum ada)
+
+        Args:
+            path: Path file SQLite
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        # Insert per run menyentuh banyak halaman index (clustered per elemen)
+        self.connection.execute("PRAGMA cache_size=-65536")
+        self.connection.executescript(SCHEMA)
+        self._element_ids = {}
+        self._attribute_ids = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        """Tutup koneksi database"""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def _element_id(self, class_name, name):
+        key = (class_name, name)
+        element_id = self._element_ids.get(key)
+        if element_id is None:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO elements (class_name, name) VALUES (?, ?)", key)
+            element_id = self.connection.execute(
+                "SELECT element_id FROM elements WHERE class_name = ? AND name = ?", key
+            ).fetchone()[0]
+            self._element_ids[key] = element_id
+        return element_id
+
+    def _attribute_id(self, attribute):
+        attribute_id = self._attribute_ids.get(attribute)
+        if attribute_id is None:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO attributes (name) VALUES (?)", (attribute,))
+            attribute_id = self.connection.execute(
+                "SELECT attribute_id FROM attributes WHERE name = ?", (attribute,)
+            ).fetchone()[0]
+            self._attribute_ids[attribute] = attribute_id
+        return attribute_id
+
+    def start_run(self, study_case=None, label=None, created=None, source=None, metadata=None):
+        """
+        Buat run baru
+
+        Args:
+            study_case: Nama study case (optional)
+            label: Label bebas, misalnya nama skenario (optional)
+            created: Timestamp epoch (optional, default sekarang)
+            source: Asal data, misalnya path file export (optional)
+            metadata: Dict tambahan, disimpan sebagai JSON (optional)
+
+        Returns:
+            run_id
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (study_case, label, created, source, metadata) VALUES (?, ?, ?, ?, ?)",
+                (study_case, label, time.time() if created is None else created, source,
+                 json.dumps(metadata) if metadata is not None else None)
+            )
+        return cursor.lastrowid
+
+    def insert_values(self, run_id, rows):
+        """
+        Bulk insert nilai untuk satu run (satu transaksi)
+
+        Args:
+            run_id: Run dari start_run()
+            rows: Iterable (class_name, element, attribute, value)
+
+        Returns:
+            Jumlah baris yang disimpan
+        """
+        records = []
+        for class_name, element, attribute, value in rows:
+            if value is None:
+                continue
+            records.append((self._element_id(class_name, element), self._attribute_id(attribute),
+                            run_id, value))
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO results (element_id, attribute_id, run_id, value) "
+                "VALUES (?, ?, ?, ?)", records)
+        return len(records)
+
+    def insert_columns(self, run_id, class_name, names, columns):
+        """
+        Bulk insert data kolom (columnar export, read_attributes, shared arrays)
+
+        Args:
+            run_id: Run dari start_run()
+            class_name: Class elemen, misalnya "ElmTerm"
+            names: List nama elemen (loc_name)
+            columns: Dict {attribute: sequence nilai}, urutan sama dengan names
+
+        Returns:
+            Jumlah baris yang disimpan
+        """
+        def rows():
+            for attribute, values in columns.items():
+                if attribute == 'loc_name':
+                    continue
+                for name, value in zip(names, values):
+                    if hasattr(value, 'item'):
+                        value = value.item()     # numpy scalar -> Python
+                    if isinstance(value, float) and value != value:
+                        continue                 # NaN = nilai tidak ada
+                    yield class_name, str(name), attribute, value
+
+        return self.insert_values(run_id, rows())
+
+    def import_csv(self, path, study_case=None, label=None, class_name='ElmTerm',
+                   name_column='Name', columns=None):
+        """
+        Import file CSV export (default format generate_export_results_script)
+
+        Args:
+            path: Path file CSV
+            study_case: Nama study case (optional)
+            label: Label run (optional)
+            class_name: Class elemen di CSV
+            name_column: Kolom nama elemen
+            columns: Dict {kolom CSV: attribute} (default CSV_EXPORT_COLUMNS)
+
+        Returns:
+            run_id
+        """
+        columns = columns or CSV_EXPORT_COLUMNS
+        created = os.path.getmtime(path)
+
+        with open(path, 'r', newline='') as f:
+            reader = csv.DictReader(f)
+            rows = [
+                (class_name, record[name_column], attribute, _number(record[column]))
+                for record in reader
+                for column, attribute in columns.items()
+                if record.get(column) not in (None, '')
+            ]
+
+        run_id = self.start_run(study_case=study_case, label=label, created=created,
+                                source=os.path.abspath(path))
+        count = self.insert_values(run_id, rows)
+        print(f"✓ Imported {count} values from {path} (run {run_id})")
+        return run_id
+
+    def import_columnar(self, path, fmt=None, study_case=None, label=None):
+        """
+        Import hasil generate_columnar_export_script (npz, parquet, arrow)
+
+        Returns:
+            run_id
+        """
+        from digsilent_results import load_columnar_results
+
+        tables = load_columnar_results(path, fmt=fmt)
+        run_id = self.start_run(study_case=study_case, label=label,
+                                created=os.path.getmtime(path), source=os.path.abspath(path))
+        count = 0
+        for class_name, columns in tables.items():
+            if 'loc_name' not in columns:
+                print(f"⚠ Skipping {class_name}: no loc_name column")
+                continue
+            count += self.insert_columns(run_id, class_name, list(columns['loc_name']), columns)
+        print(f"✓ Imported {count} values from {path} (run {run_id})")
+        return run_id
+
+    def import_result(self, result, study_case=None, label=None):
+        """
+        Import tegangan bus dari StructuredResult load flow (emit_voltages=True)
+
+        Returns:
+            run_id, atau None jika payload tidak berisi tegangan
+        """
+        payloads = [p for p in result.events('load_flow') if 'bus_names' in p]
+        if not payloads:
+            print("⚠ No bus voltages in result (generate with emit_voltages=True)")
+            return None
+
+        payload = payloads[-1]
+        run_id = self.start_run(study_case=study_case, label=label,
+                                source=os.path.abspath(result.script_path),
+                                metadata={'iterations': payload.get('iterations'),
+                                          'elapsed': payload.get('elapsed')})
+        self.insert_columns(run_id, 'ElmTerm', payload['bus_names'],
+                            {'m:u': payload['bus_voltages']})
+        return run_id
+
+    def history(self, element, attribute, class_name=None, last=500, study_case=None):
+        """
+        Nilai satu attribute elemen di run-run terakhir
+
+        Args:
+            element: "<nama>.<class>" atau nama jika class_name diisi
+            attribute: Nama attribute, misalnya "m:u"
+            class_name: Class elemen (optional)
+            last: Jumlah run terakhir (None = semua)
+            study_case: Filter study case (optional)
+
+        Returns:
+            List (run_id, created, value), run terbaru di depan
+        """
+        name, class_name = _split_element(element, class_name)
+        element_row = self.connection.execute(
+            "SELECT element_id FROM elements WHERE class_name = ? AND name = ?",
+            (class_name, name)).fetchone()
+        attribute_row = self.connection.execute(
+            "SELECT attribute_id FROM attributes WHERE name = ?", (attribute,)).fetchone()
+        if element_row is None or attribute_row is None:
+            return []
+
+        query = ("SELECT r.run_id, r.created, v.value FROM results v "
+                 "JOIN runs r ON r.run_id = v.run_id "
+                 "WHERE v.element_id = ? AND v.attribute_id = ?")
+        params = [element_row[0], attribute_row[0]]
+        if study_case is not None:
+            query += " AND r.study_case = ?"
+            params.append(study_case)
+        query += " ORDER BY v.run_id DESC"
+        if last is not None:
+            query += " LIMIT ?"
+            params.append(last)
+        return self.connection.execute(query, params).fetchall()
+
+    def run_values(self, run_id, class_name=None, attribute=None):
+        """
+        Semua nilai satu run (optional filter class/attribute)
+
+        Returns:
+            List (class_name, element, attribute, value)
+        """
+        query = ("SELECT e.class_name, e.name, a.name, v.value FROM results v "
+                 "JOIN elements e ON e.element_id = v.element_id "
+                 "JOIN attributes a ON a.attribute_id = v.attribute_id "
+                 "WHERE v.run_id = ?")
+        params = [run_id]
+        if class_name is not None:
+            query += " AND e.class_name = ?"
+            params.append(class_name)
+        if attribute is not None:
+            query += " AND a.name = ?"
+            params.append(attribute)
+        return self.connection.execute(query, params).fetchall()
+
+    def runs(self, study_case=None, last=None):
+        """
+        Daftar run, terbaru di depan
+
+        Returns:
+            List dict (run_id, study_case, label, created, source, metadata)
+        """
+        query = "SELECT run_id, study_case, label, created, source, metadata FROM runs"
+        params = []
+        if study_case is not None:
+            query += " WHERE study_case = ?"
+            params.append(study_case)
+        query += " ORDER BY run_id DESC"
+        if last is not None:
+            query += " LIMIT ?"
+            params.append(last)
+        return [
+            {'run_id': row[0], 'study_case': row[1], 'label': row[2], 'created': row[3],
+             'source': row[4], 'metadata': json.loads(row[5]) if row[5] else None}
+            for row in self.connection.execute(query, params)
+        ]
+
+    def delete_run(self, run_id):
+        """Hapus satu run beserta nilainya"""
+        with self.connection:
+            self.connection.execute("DELETE FROM results WHERE run_id = ?", (run_id,))
+            self.connection.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
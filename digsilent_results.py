@@ -0,0 +1,301 @@
+"""
+Module untuk membaca hasil export DIgSILENT PowerFactory
+"""
+
+import json
+import os
+from array import array
+
+
+DELTA_LOG_NAME = 'delta_log.jsonl'
+SNAPSHOT_NAME = 'snapshot.jsonl'
+CHECKPOINT_NAME = 'checkpoint.json'
+
+
+def _detect_format(path):
+    """Tebak format export dari path"""
+    if os.path.isdir(path):
+        names = os.listdir(path)
+        if any(name.endswith('.parquet') for name in names):
+            return 'parquet'
+        if any(name.endswith('.arrow') for name in names):
+            return 'arrow'
+        raise ValueError(f"No columnar export found in: {path}")
+    if path.endswith('.npz'):
+        return 'npz'
+    raise ValueError(f"Cannot detect columnar format for: {path}")
+
+
+def _mmap_npz(path):
+    """
+    Memory-map kolom file .npz tanpa load ke memori
+
+    np.savez menyimpan setiap array sebagai member zip tanpa kompresi
+    (ZIP_STORED), sehingga data array ada apa adanya di file. Offset data
+    dihitung dari local header zip dan header .npy, lalu dibuka dengan
+    np.memmap. Member yang terkompresi (np.savez_compressed) atau kosong
+    di-load biasa.
+
+    Returns:
+        Dict {nama member: array}
+    """
+    import struct
+    import zipfile
+
+    import numpy as np
+
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+        for info in archive.infolist():
+            key = info.filename[:-4] if info.filename.endswith('.npy') else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(info) as member:
+                    arrays[key] = np.lib.format.read_array(member, allow_pickle=False)
+                continue
+
+            # Local file header: 30 byte + nama file + extra field
+            f.seek(info.header_offset)
+            header = f.read(30)
+            name_length, extra_length = struct.unpack('<HH', header[26:30])
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+
+            if dtype.hasobject:
+                raise ValueError(f"Cannot memory-map object array: {key}")
+            if int(np.prod(shape)) == 0:
+                arrays[key] = np.empty(shape, dtype=dtype)
+                continue
+            arrays[key] = np.memmap(path, dtype=dtype, mode='r', offset=f.tell(), shape=shape,
+                                    order='F' if fortran_order else 'C')
+    return arrays
+
+
+def load_columnar_results(path, fmt=None, mmap=False):
+    """
+    Baca hasil export columnar (npz, parquet, arrow)
+
+    Args:
+        path: File .npz atau folder export parquet/arrow
+        fmt: Format ('npz', 'parquet', 'arrow'), otomatis jika None
+        mmap: Memory-map file saat dibaca (kolom dibaca dari disk saat
+              diakses, tidak di-load ke memori)
+
+    Returns:
+        Dict {class: {attribute: array}}
+    """
+    if fmt is None:
+        fmt = _detect_format(path)
+
+    tables = {}
+
+    if fmt == 'npz':
+        import numpy as np
+
+        if mmap:
+            arrays = _mmap_npz(path)
+        else:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {key: data[key] for key in data.files}
+
+        for key, values in arrays.items():
+            class_name, attribute = key.split('.', 1)
+            tables.setdefault(class_name, {})[attribute] = values
+        return tables
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    extension = '.' + fmt
+    for name in sorted(os.listdir(path)):
+        if not name.endswith(extension):
+            continue
+
+        file_path = os.path.join(path, name)
+        if fmt == 'parquet':
+            table = pq.read_table(file_path, memory_map=mmap)
+        elif fmt == 'arrow':
+            if mmap:
+                # Buffer tabel menunjuk ke memory map, file tetap terbuka selama tabel dipakai
+                table = pa.ipc.open_file(pa.memory_map(file_path, 'r')).read_all()
+            else:
+                with pa.OSFile(file_path, 'rb') as source:
+                    table = pa.ipc.open_file(source).read_all()
+        else:
+            raise ValueError(f"Unknown columnar format: {fmt}")
+
+        tables[name[:-len(extension)]] = {
+            column: table.column(column).to_numpy() for column in table.column_names
+        }
+
+    return tables
+
+
+def read_delta_log(export_dir):
+    """
+    Baca baris delta log (append-only) dari export incremental
+
+    Args:
+        export_dir: Folder export delta
+
+    Returns:
+        List dict baris delta (run, time, class, name, values / removed)
+    """
+    log_path = os.path.join(export_dir, DELTA_LOG_NAME)
+    if not os.path.exists(log_path):
+        return []
+
+    rows = []
+    with open(log_path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                rows.append(json.loads(line))
+    return rows
+
+
+def _apply_delta(state, row):
+    key = (row['class'], row['name'])
+    if row.get('removed'):
+        state.pop(key, None)
+    else:
+        state[key] = {'run': row['run'], 'time': row['time'], 'values': row['values']}
+
+
+def load_delta_state(export_dir):
+    """
+    Nilai terbaru semua elemen (snapshot hasil compaction + replay delta log)
+
+    Args:
+        export_dir: Folder export delta
+
+    Returns:
+        Dict {(class, name): {'run', 'time', 'values'}}
+    """
+    state = {}
+
+    snapshot_path = os.path.join(export_dir, SNAPSHOT_NAME)
+    if os.path.exists(snapshot_path):
+        with open(snapshot_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    _apply_delta(state, json.loads(line))
+
+    for row in read_delta_log(export_dir):
+        _apply_delta(state, row)
+
+    return state
+
+
+def compact_delta_log(export_dir):
+    """
+    Compaction: gabungkan delta log ke snapshot lalu kosongkan log
+
+    Args:
+        export_dir: Folder export delta
+
+    Returns:
+        Jumlah elemen di snapshot baru
+    """
+    state = load_delta_state(export_dir)
+
+    snapshot_path = os.path.join(export_dir, SNAPSHOT_NAME)
+    tmp_path = snapshot_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        for (class_name, name), entry in sorted(state.items()):
+            row = {'run': entry['run'], 'time': entry['time'], 'class': class_name,
+                   'name': name, 'values': entry['values']}
+            f.write(json.dumps(row, default=str) + '\n')
+    os.replace(tmp_path, snapshot_path)
+
+    # Log dikosongkan setelah snapshot aman tertulis
+    open(os.path.join(export_dir, DELTA_LOG_NAME), 'w').close()
+
+    print(f"✓ Compacted delta log into {len(state)} elements: {snapshot_path}")
+    return len(state)
+
+
+def iter_time_series_chunks(output_dir, mmap=True):
+    """
+    Iterasi chunk hasil time-series satu per satu
+
+    Args:
+        output_dir: Folder output run_time_series
+        mmap: Memory-map file chunk (tidak di-load ke memori)
+
+    Yields:
+        Tuple (start_step, values, codes) per chunk, values berbentuk
+        (steps, len(outputs)) dan codes error code ComLdf per step
+    """
+    import numpy as np
+
+    checkpoint_path = os.path.join(output_dir, CHECKPOINT_NAME)
+    with open(checkpoint_path, 'r') as f:
+        checkpoint = json.load(f)
+
+    mmap_mode = 'r' if mmap else None
+    for chunk in checkpoint['chunks']:
+        values = np.load(os.path.join(output_dir, chunk['values']), mmap_mode=mmap_mode)
+        codes = np.load(os.path.join(output_dir, chunk['codes']), mmap_mode=mmap_mode)
+        yield chunk['start'], values, codes
+
+
+def load_time_series(output_dir):
+    """
+    Gabungkan semua chunk time-series yang sudah selesai
+
+    Args:
+        output_dir: Folder output run_time_series
+
+    Returns:
+        Tuple (values, codes) untuk step 0..next_step
+    """
+    import numpy as np
+
+    chunks = list(iter_time_series_chunks(output_dir, mmap=True))
+    if not chunks:
+        return np.empty((0, 0)), np.empty(0, dtype=np.int32)
+    values = np.concatenate([chunk_values for _, chunk_values, _ in chunks])
+    codes = np.concatenate([chunk_codes for _, _, chunk_codes in chunks])
+    return values, codes
+
+
+def load_short_circuit(payload, use_numpy=None):
+    """
+    Ubah hasil short-circuit sweep (event 'short_circuit') ke array
+
+    Args:
+        payload: Payload event 'short_circuit' atau StructuredResult
+        use_numpy: True/False, default numpy jika ter-install
+
+    Returns:
+        Dict terminals (list nama) dan array ikss, ip, ith (kA, NaN untuk
+        lokasi yang gagal) serta error_codes; None jika tidak ada hasil
+    """
+    if hasattr(payload, 'events'):
+        events = payload.events('short_circuit')
+        if not events:
+            return None
+        payload = events[-1]
+
+    np = None
+    if use_numpy is not False:
+        try:
+            import numpy as np
+        except ImportError:
+            if use_numpy:
+                raise
+
+    nan = float('nan')
+    result = {'terminals': list(payload['terminals'])}
+    for key in ('ikss', 'ip', 'ith'):
+        values = [nan if value is None else value for value in payload[key]]
+        result[key] = np.array(values, dtype=np.float64) if np is not None else array('d', values)
+    codes = payload['error_codes']
+    result['error_codes'] = np.array(codes, dtype=np.int64) if np is not None else array('q', codes)
+    return result
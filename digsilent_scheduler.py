@@ -0,0 +1,185 @@
+"""
+Module untuk eksekusi paralel banyak skrip DIgSILENT PowerFactory
+"""
+
+import os
+import queue
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from digsilent_executor import DIgSILENTExecutor
+from digsilent_result_channel import ResultChannel
+
+
+def _decode(output):
+    """TimeoutExpired bisa membawa output bytes walaupun text=True"""
+    if output is None:
+        return ''
+    if isinstance(output, bytes):
+        return output.decode(errors='replace')
+    return output
+
+
+class ScriptJobResult:
+    """
+    Hasil eksekusi satu skrip di scheduler
+    """
+
+    def __init__(self, index, script_path):
+        self.index = index
+        self.script_path = script_path
+        self.success = False
+        self.returncode = None
+        self.timed_out = False
+        self.attempts = 0
+        self.worker_id = None
+        self.elapsed = 0.0
+        self.stdout = ''
+        self.stderr = ''
+        self.payloads = []
+
+    def events(self, kind):
+        """Payload result channel dengan event tertentu (hanya mode structured)"""
+        return [payload for payload in self.payloads if payload.get('event') == kind]
+
+    def __repr__(self):
+        status = 'timeout' if self.timed_out else ('ok' if self.success else 'failed')
+        return (f"ScriptJobResult(index={self.index}, script={os.path.basename(self.script_path)!r}, "
+                f"status={status}, attempts={self.attempts}, elapsed={self.elapsed:.2f}s)")
+
+
+class ParallelScriptScheduler:
+    """
+    Scheduler yang menyebar antrian skrip ke beberapa worker process
+
+    Setiap worker slot menjalankan skrip di interpreter (process) sendiri,
+    sehingga setiap job terikat ke engine instance sendiri. Worker id
+    dikirim lewat environment DIGSILENT_WORKER_ID, dan environment per
+    worker bisa diatur dengan worker_env.
+
+    Contoh dengan stub interpreter (tanpa PowerFactory):
+        scheduler = ParallelScriptScheduler(
+            max_workers=4,
+            worker_env=lambda worker_id: {'PYTHONPATH': 'fake_powerfactory'}
+        )
+        results = scheduler.run(script_paths)
+    """
+
+    def __init__(self, executor=None, max_workers=None, python_executable=None,
+                 timeout=None, retries=0, worker_env=None, structured=False):
+        """
+        Initialize scheduler
+
+        Args:
+            executor: DIgSILENTExecutor (optional, dibuat baru jika None)
+            max_workers: Jumlah worker process (default jumlah CPU)
+            python_executable: Interpreter yang dipakai worker (default sys.executable)
+            timeout: Batas waktu per job dalam detik (optional)
+            retries: Jumlah retry jika job gagal atau timeout
+            worker_env: Callable worker_id -> dict environment tambahan (optional)
+            structured: Jika True, payload result channel setiap job disimpan
+                        di ScriptJobResult.payloads
+        """
+        self.executor = executor or DIgSILENTExecutor()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.python_executable = python_executable or sys.executable
+        self.timeout = timeout
+        self.retries = retries
+        self.worker_env = worker_env
+        self.structured = structured
+
+    def _run_job(self, job, workers):
+        """Jalankan satu job di worker slot yang tersedia, dengan retry"""
+        worker_id = workers.get()
+        try:
+            extra_env = {'DIGSILENT_WORKER_ID': str(worker_id)}
+            if self.worker_env is not None:
+                extra_env.update(self.worker_env(worker_id))
+            env = self.executor.build_subprocess_env(extra_env)
+
+            job.worker_id = worker_id
+            start_time = time.perf_counter()
+
+            tracer = self.executor.tracer
+            while job.attempts <= self.retries:
+                job.attempts += 1
+                job.timed_out = False
+                channel = ResultChannel() if self.structured else None
+                try:
+                    if channel is not None:
+                        channel.open()
+                    with tracer.span('job', 'scheduler', script=job.script_path,
+                                     worker_id=worker_id, attempt=job.attempts):
+                        result = subprocess.run(
+                            tracer.python_command(self.python_executable, job.script_path),
+                            env=channel.child_env(env) if channel is not None else env,
+                            capture_output=True,
+                            text=True,
+                            timeout=self.timeout,
+                            **(channel.popen_kwargs() if channel is not None else {})
+                        )
+                    job.returncode = result.returncode
+                    job.stdout = result.stdout
+                    job.stderr = result.stderr
+                    job.success = result.returncode == 0
+                except subprocess.TimeoutExpired as e:
+                    job.timed_out = True
+                    job.stdout = _decode(e.stdout)
+                    job.stderr = _decode(e.stderr)
+                    job.success = False
+                except Exception as e:
+                    job.stderr = str(e)
+                    job.success = False
+                finally:
+                    if channel is not None:
+                        channel.close()
+                        job.payloads = channel.payloads
+                        tracer.add_script_spans(channel.payloads, channel.received)
+
+                if job.success:
+                    break
+
+            job.elapsed = time.perf_counter() - start_time
+            return job
+
+        finally:
+            workers.put(worker_id)
+
+    def run(self, script_paths):
+        """
+        Jalankan semua skrip secara paralel
+
+        Args:
+            script_paths: List path skrip
+
+        Returns:
+            List ScriptJobResult dengan urutan sama seperti script_paths
+        """
+        jobs = [ScriptJobResult(i, path) for i, path in enumerate(script_paths)]
+
+        for job in jobs:
+            if not os.path.exists(job.script_path):
+                job.stderr = f"Script not found: {job.script_path}"
+
+        runnable = [job for job in jobs if os.path.exists(job.script_path)]
+
+        workers = queue.Queue()
+        for worker_id in range(self.max_workers):
+            workers.put(worker_id)
+
+        print(f"Scheduling {len(runnable)} scripts on {self.max_workers} workers")
+        start_time = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(self._run_job, job, workers) for job in runnable]
+            for future in futures:
+                future.result()
+
+        elapsed = time.perf_counter() - start_time
+        succeeded = sum(1 for job in jobs if job.success)
+        mark = "✓" if succeeded == len(jobs) else "✗"
+        print(f"{mark} {succeeded}/{len(jobs)} scripts succeeded in {elapsed:.2f} seconds")
+
+        return jobs
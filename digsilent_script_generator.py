@@ -2,103 +2,237 @@
 Module untuk generate skrip DIgSILENT PowerFactory
 """
 
+import inspect
 import os
 from datetime import datetime
 
+from digsilent_script_store import shared_store
+from digsilent_templates import default_registry
+from digsilent_tracing import NULL_TRACER
+
 
 class DIgSILENTScriptGenerator:
     """
     Class untuk generate skrip yang akan dijalankan di DIgSILENT
     """
 
-    def __init__(self, output_dir="generated_scripts"):
+    # Attribute yang di-export per class elemen untuk export kolom (columnar)
+    COLUMNAR_ATTRIBUTES = {
+        "ElmTerm": ["loc_name", "m:u", "m:Ul", "m:phiu", "iUsage"],
+        "ElmLne": ["loc_name", "m:P:bus1", "m:Q:bus1", "m:I:bus1", "c:loading"],
+        "ElmSym": ["loc_name", "m:P:bus1", "m:Q:bus1", "c:loading"],
+        "ElmLod": ["loc_name", "m:P:bus1", "m:Q:bus1", "m:u1"],
+    }
+
+    COLUMNAR_FORMATS = ("npz", "parquet", "arrow")
+
+    def __init__(self, output_dir="generated_scripts", deterministic=False, registry=None,
+                 tracer=None, store=None):
         """
         Initialize generator
 
         Args:
             output_dir: Folder untuk menyimpan skrip yang di-generate
+            deterministic: Jika True, skrip tidak berisi timestamp dan nama
+                           file diambil dari hash isi skrip (content-addressed),
+                           sehingga studi yang identik menghasilkan file yang sama
+            registry: TemplateRegistry (optional, default registry bawaan)
+            tracer: Tracer untuk span render/tulis skrip (optional)
+            store: ScriptStore untuk nama file, index dan retensi (optional,
+                   default store bersama untuk output_dir dengan retensi
+                   default, lihat shared_store)
+        """
+        self.store = store or shared_store(output_dir)
+        self.output_dir = self.store.root
+        self.deterministic = deterministic
+        self.registry = registry or default_registry
+        self.tracer = tracer or NULL_TRACER
+
+    def _render(self, template_name, **params):
+        """Render template dengan header timestamp (kecuali mode deterministic)"""
+        if self.deterministic:
+            generated_at = ""
+        else:
+            generated_at = f"Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        with self.tracer.span('render', 'generator', template=template_name):
+            return self.registry.render(template_name, generated_at=generated_at, **params)
+
+    def _write_script(self, prefix, script_content):
+        """
+        Tulis skrip lewat ScriptStore
+
+        Mode deterministic: nama file = prefix + hash isi, file yang sudah
+        ada tidak ditulis ulang (dedup). Mode biasa: nama file unik
+        (timestamp mikrodetik + PID + counter) di subfolder per hari.
+
+        Returns:
+            Path ke file skrip
         """
-        self.output_dir = output_dir
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        with self.tracer.span('write_script', 'generator', prefix=prefix):
+            script_path, reused = self.store.write(prefix, script_content,
+                                                   content_addressed=self.deterministic)
+
+        if reused:
+            print(f"✓ Reused script: {script_path}")
+        else:
+            print(f"✓ Generated script: {script_path}")
+        return script_path
 
-    def generate_load_flow_script(self, project_name=None, study_case=None):
+    def generate_load_flow_script(self, project_name=None, study_case=None, emit_voltages=False):
         """
         Generate skrip untuk menjalankan load flow calculation
 
         Args:
             project_name: Nama project (optional)
             study_case: Nama study case (optional)
+            emit_voltages: Kirim array nama dan tegangan bus di result channel
 
         Returns:
             Path ke file skrip yang di-generate
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        script_name = f"loadflow_{timestamp}.py"
-        script_path = os.path.join(self.output_dir, script_name)
+        script_content = self._render(
+            'load_flow',
+            study_case_code=self._generate_study_case_code(study_case) if study_case else "    # Using current active study case",
+            emit_voltages=emit_voltages
+        )
+        return self._write_script("loadflow", script_content)
 
-        script_content = '''"""
-Auto-generated script untuk Load Flow Calculation
-Generated at: {timestamp}
-"""
+    def generate_chained_load_flow_script(self, steps, warm_start=True):
+        """
+        Generate skrip load flow berurutan dengan warm start antar step
 
-import powerfactory as pf
+        Logika chain diambil dari digsilent_functions.run_load_flow_chain,
+        iterasi dan timing per step dikirim lewat result channel.
 
-def run_load_flow():
-    # Get PowerFactory application
-    app = pf.GetApplication()
-    if app is None:
-        print("Error: Cannot connect to PowerFactory")
-        return False
+        Args:
+            steps: List step, setiap step list [nama objek, attribute, nilai]
+            warm_start: Seed step berikutnya dari solusi sebelumnya
+
+        Returns:
+            Path ke file skrip yang di-generate
+        """
+        from digsilent_functions import run_load_flow_chain
+
+        script_content = self._render(
+            'load_flow_chain',
+            steps=[[list(change) for change in step] for step in steps],
+            warm_start=warm_start,
+            chain_function=inspect.getsource(run_load_flow_chain)
+        )
+        return self._write_script("loadflow_chain", script_content)
+
+    def generate_time_series_script(self, profile_path, targets, outputs,
+                                    output_dir="results/time_series", chunk_size=168):
+        """
+        Generate skrip time-series quasi-dynamic (profil memory-mapped)
+
+        Logika diambil dari digsilent_functions.run_time_series: hasil
+        ditulis per chunk .npy dengan checkpoint/resume di output_dir.
 
-    print("Connected to PowerFactory")
+        Args:
+            profile_path: Path file profil .npy (n_steps x len(targets))
+            targets: List [nama objek, attribute] per kolom profil
+            outputs: List [nama objek, attribute] yang dibaca setiap step
+            output_dir: Folder chunk hasil dan checkpoint
+            chunk_size: Jumlah step per chunk
 
-    # Get active project
-    project = app.GetActiveProject()
-    if project is None:
-        print("Error: No active project")
-        return False
+        Returns:
+            Path ke file skrip yang di-generate
+        """
+        from digsilent_functions import run_time_series
+
+        script_content = self._render(
+            'time_series',
+            profile_path=os.path.abspath(profile_path),
+            targets=[list(target) for target in targets],
+            outputs=[list(output) for output in outputs],
+            output_dir=os.path.abspath(output_dir),
+            chunk_size=chunk_size,
+            time_series_function=inspect.getsource(run_time_series)
+        )
+        return self._write_script("timeseries", script_content)
 
-    print(f"Active Project: {{project.GetFullName()}}")
+    def generate_contingency_script(self, outages, v_min=0.95, v_max=1.05, max_loading=100.0,
+                                    shard_index=None):
+        """
+        Generate skrip N-1 contingency untuk satu shard outage
 
-    # Activate study case if specified
-{study_case_code}
+        Logika diambil dari digsilent_functions.run_contingencies, hasil
+        per outage dikirim lewat result channel (event 'contingency').
 
-    # Get Load Flow command
-    ldf = app.GetFromStudyCase("ComLdf")
-    if ldf is None:
-        print("Error: Cannot get Load Flow command")
-        return False
+        Args:
+            outages: List nama objek "<loc_name>.<class>"
+            v_min, v_max: Batas tegangan bus (p.u.)
+            max_loading: Batas loading cabang (%)
+            shard_index: Nomor shard untuk nama file (optional)
 
-    # Execute Load Flow
-    print("Executing Load Flow...")
-    result = ldf.Execute()
+        Returns:
+            Path ke file skrip yang di-generate
+        """
+        from digsilent_functions import run_contingencies
+
+        script_content = self._render(
+            'contingency',
+            outages=list(outages),
+            v_min=v_min,
+            v_max=v_max,
+            max_loading=max_loading,
+            contingency_function=inspect.getsource(run_contingencies)
+        )
+        prefix = "contingency" if shard_index is None else f"contingency_shard{shard_index:03d}"
+        return self._write_script(prefix, script_content)
 
-    if result == 0:
-        print("✓ Load Flow calculation successful")
-        return True
-    else:
-        print(f"✗ Load Flow calculation failed with error code: {{result}}")
-        return False
+    def generate_short_circuit_script(self, terminals=None, fault_type="3psc", options=None):
+        """
+        Generate skrip short-circuit sweep (ComShc) untuk banyak lokasi gangguan
 
-if __name__ == "__main__":
-    success = run_load_flow()
-    print("\\n" + "="*60)
-    if success:
-        print("SCRIPT COMPLETED SUCCESSFULLY")
-    else:
-        print("SCRIPT FAILED")
-    print("="*60)
-'''.format(
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            study_case_code=self._generate_study_case_code(study_case) if study_case else "    # Using current active study case"
+        Logika diambil dari digsilent_functions.run_short_circuit_sweep:
+        ComShc dikonfigurasi sekali dan semua lokasi gangguan dihitung di
+        satu skrip, hasil dikirim sebagai kolom (event 'short_circuit').
+
+        Args:
+            terminals: List nama ElmTerm (optional, default semua terminal)
+            fault_type: Jenis gangguan iopt_shc (default '3psc')
+            options: Dict attribute ComShc tambahan (optional, misalnya
+                     {"iopt_cur": 0}); iopt_mde, iopt_shc, iopt_allbus dan
+                     shc_term diatur oleh sweep
+
+        Returns:
+            Path ke file skrip yang di-generate
+        """
+        from digsilent_functions import run_short_circuit_sweep
+
+        script_content = self._render(
+            'short_circuit',
+            terminals=None if terminals is None else list(terminals),
+            fault_type=fault_type,
+            options=dict(options or {}),
+            short_circuit_function=inspect.getsource(run_short_circuit_sweep)
         )
+        return self._write_script("shortcircuit", script_content)
 
-        with open(script_path, 'w') as f:
-            f.write(script_content)
+    def generate_batch_load_flow_script(self, study_cases, result_path=None):
+        """
+        Generate satu skrip yang menjalankan load flow untuk banyak study case
 
-        print(f"✓ Generated script: {script_path}")
-        return script_path
+        Skrip connect ke PowerFactory sekali, lalu loop semua study case
+        (aktivasi, GetFromStudyCase("ComLdf"), Execute) dan menulis tabel
+        status + timing per study case ke file JSON.
+
+        Args:
+            study_cases: List nama study case
+            result_path: Path file JSON hasil (optional, default di sebelah
+                         skrip: <nama skrip>_results.json)
+
+        Returns:
+            Path ke file skrip yang di-generate
+        """
+        script_content = self._render(
+            'batch_load_flow',
+            study_cases=list(study_cases),
+            result_path=result_path
+        )
+        return self._write_script("batch_loadflow", script_content)
 
     def generate_export_results_script(self, export_path="results.csv", elements=None):
         """
@@ -111,79 +245,97 @@ if __name__ == "__main__":
         Returns:
             Path ke file skrip yang di-generate
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        script_name = f"export_results_{timestamp}.py"
-        script_path = os.path.join(self.output_dir, script_name)
+        script_content = self._render('export_results', export_path=export_path)
+        return self._write_script("export_results", script_content)
 
-        script_content = '''"""
-Auto-generated script untuk Export Results
-Generated at: {timestamp}
-"""
-
-import powerfactory as pf
-import csv
+    def generate_columnar_export_script(self, export_path="results.npz", fmt="npz",
+                                        element_classes=None):
+        """
+        Generate skrip untuk export hasil dalam format kolom (columnar)
 
-def export_results():
-    # Get PowerFactory application
-    app = pf.GetApplication()
-    if app is None:
-        print("Error: Cannot connect to PowerFactory")
-        return False
+        Attribute dikumpulkan per kolom (satu pass per attribute) lalu
+        disimpan sebagai array, bukan baris CSV per elemen.
 
-    print("Connected to PowerFactory")
+        Args:
+            export_path: Path file .npz, atau folder untuk format parquet/arrow
+                         (satu file per class elemen)
+            fmt: Format output ('npz', 'parquet', 'arrow')
+            element_classes: Dict {class: [attribute, ...]} atau list class
+                             (optional, default COLUMNAR_ATTRIBUTES)
 
-    # Get active project
-    project = app.GetActiveProject()
-    if project is None:
-        print("Error: No active project")
-        return False
+        Returns:
+            Path ke file skrip yang di-generate
+        """
+        if fmt not in self.COLUMNAR_FORMATS:
+            raise ValueError(f"Unknown columnar format: {fmt} (pilih {', '.join(self.COLUMNAR_FORMATS)})")
+
+        if element_classes is None:
+            element_classes = self.COLUMNAR_ATTRIBUTES
+        elif not isinstance(element_classes, dict):
+            element_classes = {cls: self.COLUMNAR_ATTRIBUTES[cls] for cls in element_classes}
+
+        script_content = self._render(
+            'columnar_export',
+            element_classes=dict(element_classes),
+            export_path=export_path,
+            fmt=fmt
+        )
+        return self._write_script("export_columnar", script_content)
 
-    print(f"Active Project: {{project.GetFullName()}}")
+    def generate_shared_memory_export_script(self, element_classes=None):
+        """
+        Generate skrip yang mengisi array hasil langsung di shared memory
 
-    # Get all terminals (busbar)
-    terminals = app.GetCalcRelevantObjects("*.ElmTerm")
+        Array dialokasikan caller (SharedResultArrays), skrip hanya mengisi
+        nilai di tempat. Nama elemen dan jumlah baris dikirim lewat result
+        channel.
 
-    print(f"Found {{len(terminals)}} terminals")
+        Args:
+            element_classes: Dict {class: [attribute, ...]} atau list class
+                             (optional, default COLUMNAR_ATTRIBUTES)
 
-    # Export to CSV
-    export_file = r"{export_path}"
-    print(f"Exporting to: {{export_file}}")
+        Returns:
+            Path ke file skrip yang di-generate
+        """
+        if element_classes is None:
+            element_classes = self.COLUMNAR_ATTRIBUTES
+        elif not isinstance(element_classes, dict):
+            element_classes = {cls: self.COLUMNAR_ATTRIBUTES[cls] for cls in element_classes}
 
-    with open(export_file, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        # Header
-        writer.writerow(['Name', 'Voltage (kV)', 'Angle (deg)', 'Type'])
+        script_content = self._render('shared_export', element_classes=dict(element_classes))
+        return self._write_script("export_shared", script_content)
 
-        # Data
-        for term in terminals:
-            name = term.GetAttribute('loc_name')
-            voltage = term.GetAttribute('m:u')  # Voltage in p.u.
-            angle = term.GetAttribute('m:phiu')  # Voltage angle in degrees
-            term_type = term.GetAttribute('iUsage')
+    def generate_delta_export_script(self, export_dir="results/delta", element_classes=None,
+                                     decimals=6):
+        """
+        Generate skrip export incremental: hanya elemen yang hasilnya berubah
 
-            writer.writerow([name, voltage, angle, term_type])
+        Skrip menyimpan fingerprint nilai terakhir per elemen di
+        <export_dir>/fingerprints.json dan menambahkan baris yang berubah
+        (atau elemen yang hilang) ke <export_dir>/delta_log.jsonl.
+        Gunakan digsilent_results.compact_delta_log() untuk compaction.
 
-    print(f"✓ Exported {{len(terminals)}} terminals to {{export_file}}")
-    return True
+        Args:
+            export_dir: Folder state dan delta log
+            element_classes: Dict {class: [attribute, ...]} atau list class
+                             (optional, default COLUMNAR_ATTRIBUTES)
+            decimals: Pembulatan nilai float sebelum fingerprint
 
-if __name__ == "__main__":
-    success = export_results()
-    print("\\n" + "="*60)
-    if success:
-        print("EXPORT COMPLETED SUCCESSFULLY")
-    else:
-        print("EXPORT FAILED")
-    print("="*60)
-'''.format(
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            export_path=export_path
+        Returns:
+            Path ke file skrip yang di-generate
+        """
+        if element_classes is None:
+            element_classes = self.COLUMNAR_ATTRIBUTES
+        elif not isinstance(element_classes, dict):
+            element_classes = {cls: self.COLUMNAR_ATTRIBUTES[cls] for cls in element_classes}
+
+        script_content = self._render(
+            'delta_export',
+            element_classes=dict(element_classes),
+            export_dir=os.path.abspath(export_dir),
+            decimals=decimals
         )
-
-        with open(script_path, 'w') as f:
-            f.write(script_content)
-
-        print(f"✓ Generated script: {script_path}")
-        return script_path
+        return self._write_script("export_delta", script_content)
 
     def generate_custom_script(self, script_name, script_body):
         """
@@ -196,36 +348,40 @@ if __name__ == "__main__":
         Returns:
             Path ke file skrip yang di-generate
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         if not script_name.endswith('.py'):
             script_name += '.py'
 
-        script_name = f"{script_name.replace('.py', '')}_{timestamp}.py"
-        script_path = os.path.join(self.output_dir, script_name)
+        script_content = self._render('custom', script_body=script_body)
+        return self._write_script(script_name.replace('.py', ''), script_content)
 
-        script_content = f'''"""
-Auto-generated custom script
-Generated at: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-"""
+    def generate_function_script(self, func, *args, **kwargs):
+        """
+        Generate skrip audit dari fungsi skrip (digsilent_functions)
 
-import powerfactory as pf
+        Source fungsi ditulis ke file beserta pemanggilannya, sehingga skrip
+        bisa dijalankan ulang secara mandiri di PowerFactory.
 
-{script_body}
-'''
+        Args:
+            func: Fungsi dengan argumen pertama handle aplikasi
+            *args, **kwargs: Argumen yang dipakai saat pemanggilan
 
-        with open(script_path, 'w') as f:
-            f.write(script_content)
+        Returns:
+            Path ke file skrip yang di-generate
+        """
+        call_args = ''.join(f", {arg!r}" for arg in args)
+        call_args += ''.join(f", {key}={value!r}" for key, value in kwargs.items())
 
-        print(f"✓ Generated script: {script_path}")
-        return script_path
+        script_body = f'''{inspect.getsource(func)}
 
-    def _generate_study_case_code(self, study_case_name):
-        """Generate code untuk aktivasi study case"""
-        return f'''    # Activate study case
-    study_case = project.GetContents("{study_case_name}")[0]
-    if study_case:
-        study_case.Activate()
-        print(f"Activated study case: {study_case_name}")
+if __name__ == "__main__":
+    app = globals().get("app") or pf.GetApplication()
+    if app is None:
+        print("Error: Cannot connect to PowerFactory")
     else:
-        print(f"Warning: Study case '{study_case_name}' not found")
+        print({func.__name__}(app{call_args}))
 '''
+        return self.generate_custom_script(func.__name__, script_body)
+
+    def _generate_study_case_code(self, study_case_name):
+        """Generate code untuk aktivasi study case"""
+        return self.registry.render('study_case', study_case_name=study_case_name)
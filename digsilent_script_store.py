@@ -0,0 +1,410 @@
+"""
+Module untuk penyimpanan skrip yang di-generate (nama unik, retensi, arsip, index)
+"""
+
+import itertools
+import json
+import os
+import re
+import tarfile
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from datetime import datetime
+
+from digsilent_templates import content_key
+
+
+# Nama file yang dibuat generator: prefix + _YYYYmmdd_HHMMSS (layout lama),
+# _YYYYmmdd_HHMMSS_ffffff_pid_counter (subfolder per hari) atau _<hash isi>
+_GENERATED_NAME = re.compile(r'^(?P<prefix>\w+?)(_\d{8}_\d{6}(_\d{6}_\d+_\d+)?|_[0-9a-f]{16})\.py$')
+_DAY_DIR = re.compile(r'^\d{8}$')
+
+
+class ScriptStore:
+    """
+    Folder skrip yang di-generate dengan lifecycle terkelola
+
+    - Nama unik: timestamp mikrodetik + PID + counter, file dibuat dengan
+      mode eksklusif sehingga generate cepat dan multi process tidak
+      saling menimpa. Skrip biasa disimpan di subfolder per hari
+      (YYYYMMDD/) supaya listing folder tetap kecil; skrip content-addressed
+      (mode deterministic) di root folder.
+    - Index: index.jsonl (append-only, di-compact saat prune) berisi path,
+      prefix, waktu, ukuran dan status tiap skrip (live/archived).
+    - Retensi: max_scripts (jumlah, default 5000), max_age (detik, default
+      7 hari) dan max_bytes (total ukuran). Skrip tertua di luar batas
+      dihapus, atau dipack ke arsip zip/tar.gz di archives/ jika
+      archive=True; max_archives membatasi jumlah arsip. Retensi dicek saat
+      skrip pertama ditulis lalu setiap prune_every skrip; skrip
+      content-addressed yang dipakai ulang dihitung sebagai skrip baru.
+      Set max_scripts=None dan max_age=None untuk menyimpan semua skrip.
+    - Folder tanpa index: hanya file dengan pola nama generator yang
+      di-index (file lain tidak pernah disentuh), dan skrip hasil adopsi
+      ini baru ikut retensi jika prune_adopted=True.
+
+    Index hanya mencatat skrip yang ditulis lewat store ini; folder yang
+    dipakai beberapa process sebaiknya di-prune dari satu process saja.
+    Di dalam satu process, shared_store(root) memberi store yang sama untuk
+    folder yang sama sehingga index hanya dibaca sekali.
+
+    Contoh:
+        store = ScriptStore("generated_scripts", max_scripts=5000, archive=True)
+        generator = DIgSILENTScriptGenerator(store=store)
+    """
+
+    INDEX_NAME = 'index.jsonl'
+    ARCHIVE_DIR = 'archives'
+    ARCHIVE_FORMATS = ('zip', 'tar.gz')
+
+    def __init__(self, root="generated_scripts", max_scripts=5000, max_age=7 * 24 * 3600,
+                 max_bytes=None, archive=False, archive_format='zip', max_archives=None,
+                 prune_every=100, prune_adopted=False):
+        """
+        Initialize store
+
+        Args:
+            root: Folder skrip
+            max_scripts: Jumlah maksimal skrip live (None: tanpa batas)
+            max_age: Umur maksimal skrip live dalam detik (None: tanpa batas)
+            max_bytes: Total ukuran maksimal skrip live (optional)
+            archive: Pack skrip lama ke arsip terkompresi alih-alih dihapus
+            archive_format: 'zip' atau 'tar.gz'
+            max_archives: Jumlah maksimal file arsip (optional)
+            prune_every: Cek retensi setiap sejumlah skrip yang ditulis
+            prune_adopted: Terapkan retensi juga ke skrip yang sudah ada
+                           sebelum index dibuat (default False)
+        """
+        if archive_format not in self.ARCHIVE_FORMATS:
+            raise ValueError(f"Unknown archive format: {archive_format} "
+                             f"(use one of {', '.join(self.ARCHIVE_FORMATS)})")
+
+        self.root = root
+        self.max_scripts = max_scripts
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.archive = archive
+        self.archive_format = archive_format
+        self.max_archives = max_archives
+        self.prune_every = prune_every
+        self.prune_adopted = prune_adopted
+        self.index_path = os.path.join(root, self.INDEX_NAME)
+        self._entries = OrderedDict()
+        self._index_lines = 0
+        self._writes = 0
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+        os.makedirs(root, exist_ok=True)
+        if os.path.exists(self.index_path):
+            self._load_index()
+        else:
+            self._adopt_existing()
+
+    @property
+    def has_retention(self):
+        return any(limit is not None for limit in (self.max_scripts, self.max_age, self.max_bytes,
+                                                   self.max_archives))
+
+    def _load_index(self):
+        """Baca index.jsonl, entry terakhir per path yang berlaku"""
+        with open(self.index_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue    # baris terpotong (process berhenti saat menulis)
+                self._index_lines += 1
+                self._entries.pop(entry['path'], None)
+                if entry.get('state') != 'removed':
+                    self._entries[entry['path']] = entry
+
+    def _adopt_existing(self):
+        """
+        Index skrip generator yang sudah ada (folder tanpa index.jsonl)
+
+        Hanya file dengan pola nama generator di root folder dan subfolder
+        per hari yang di-index, ditandai adopted; file lain dibiarkan.
+        """
+        candidates = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if _DAY_DIR.match(name) and os.path.isdir(path):
+                candidates.extend(f"{name}/{child}" for child in os.listdir(path))
+            else:
+                candidates.append(name)
+
+        found = []
+        for name in candidates:
+            match = _GENERATED_NAME.match(name.rpartition('/')[2])
+            path = self._full_path(name)
+            if match and os.path.isfile(path):
+                stat = os.stat(path)
+                found.append({'path': name, 'prefix': match.group('prefix'),
+                              'created': stat.st_mtime, 'size': stat.st_size, 'state': 'live',
+                              'adopted': True})
+        for entry in sorted(found, key=lambda entry: entry['created']):
+            self._entries[entry['path']] = entry
+        self._compact_index()
+
+    def _append_index(self, entries):
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + '\n')
+        self._index_lines += len(entries)
+
+    def _compact_index(self):
+        """Tulis ulang index hanya dengan entry yang berlaku (atomic)"""
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in self._entries.values():
+                f.write(json.dumps(entry) + '\n')
+        os.replace(tmp_path, self.index_path)
+        self._index_lines = len(self._entries)
+
+    def _unique_name(self, prefix, now):
+        return (f"{now.strftime('%Y%m%d')}/{prefix}_{now.strftime('%Y%m%d_%H%M%S_%f')}"
+                f"_{os.getpid()}_{next(self._counter)}.py")
+
+    def write(self, prefix, content, content_addressed=False):
+        """
+        Tulis skrip ke store
+
+        Args:
+            prefix: Prefix nama file (misalnya 'loadflow')
+            content: Isi skrip
+            content_addressed: Nama file dari hash isi; file yang sudah ada
+                               dipakai ulang (mode deterministic generator)
+                               dan waktu entry-nya diperbarui
+
+        Returns:
+            Tuple (path skrip, reused)
+        """
+        with self._lock:
+            now = datetime.now()
+            if content_addressed:
+                name = f"{prefix}_{content_key(content)}.py"
+                path = os.path.join(self.root, name)
+                if os.path.exists(path):
+                    self._touch(name, prefix, path, now)
+                    return path, True
+                mode = 'w'
+            else:
+                name = self._unique_name(prefix, now)
+                path = os.path.join(self.root, *name.split('/'))
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                mode = 'x'
+
+            while True:
+                try:
+                    with open(path, mode, encoding='utf-8') as f:
+                        f.write(content)
+                    break
+                except FileExistsError:
+                    name = self._unique_name(prefix, now)
+                    path = os.path.join(self.root, *name.split('/'))
+
+            self._record({'path': name, 'prefix': prefix, 'created': now.timestamp(),
+                          'size': len(content.encode('utf-8')), 'state': 'live'})
+            return path, False
+
+    def _touch(self, name, prefix, path, now):
+        """Skrip yang dipakai ulang jadi entry terbaru (tidak kena retensi umur/jumlah)"""
+        try:
+            os.utime(path)
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        self._record({'path': name, 'prefix': prefix, 'created': now.timestamp(),
+                      'size': size, 'state': 'live'})
+
+    def _record(self, entry):
+        """Simpan entry sebagai yang terbaru di index, cek retensi berkala"""
+        self._entries.pop(entry['path'], None)
+        self._entries[entry['path']] = entry
+        self._append_index([entry])
+
+        if self.has_retention and self._writes % self.prune_every == 0:
+            self._prune()
+        self._writes += 1
+
+    def prune(self):
+        """
+        Terapkan retensi sekarang
+
+        Returns:
+            Dict jumlah skrip yang dihapus/diarsip dan arsip yang dihapus
+        """
+        with self._lock:
+            return self._prune()
+
+    def _expired(self, now):
+        """Entry live yang melewati batas umur, jumlah atau ukuran (tertua dulu)"""
+        live = [entry for entry in self._entries.values() if entry['state'] == 'live'
+                and (self.prune_adopted or not entry.get('adopted'))]
+        expired = set()
+        if self.max_age is not None:
+            expired.update(entry['path'] for entry in live if now - entry['created'] > self.max_age)
+        if self.max_scripts is not None and len(live) > self.max_scripts:
+            expired.update(entry['path'] for entry in live[:len(live) - self.max_scripts])
+        if self.max_bytes is not None:
+            total = sum(entry['size'] for entry in live if entry['path'] not in expired)
+            for entry in live:
+                if total <= self.max_bytes:
+                    break
+                if entry['path'] not in expired:
+                    expired.add(entry['path'])
+                    total -= entry['size']
+        return [entry for entry in live if entry['path'] in expired]
+
+    def _prune(self):
+        expired = [entry for entry in self._expired(time.time())
+                   if os.path.exists(self._full_path(entry['path']))]
+        stats = {'removed': 0, 'archived': 0, 'archives_removed': 0}
+
+        if expired and self.archive:
+            archive_name = self._pack(expired)
+            for entry in expired:
+                entry['state'] = 'archived'
+                entry['archive'] = archive_name
+            stats['archived'] = len(expired)
+        else:
+            for entry in expired:
+                del self._entries[entry['path']]
+            stats['removed'] = len(expired)
+
+        for entry in expired:
+            try:
+                os.remove(self._full_path(entry['path']))
+            except OSError:
+                pass
+
+        if self.max_archives is not None:
+            stats['archives_removed'] = self._prune_archives()
+
+        self._remove_empty_dirs()
+        if expired or stats['archives_removed']:
+            self._compact_index()
+        return stats
+
+    def _pack(self, entries):
+        """Pack skrip ke satu arsip baru, return path arsip relatif ke root"""
+        archive_dir = os.path.join(self.root, self.ARCHIVE_DIR)
+        os.makedirs(archive_dir, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        name = f"{self.ARCHIVE_DIR}/scripts_{stamp}_{os.getpid()}.{self.archive_format}"
+        archive_path = os.path.join(self.root, *name.split('/'))
+        tmp_path = f"{archive_path}.tmp"
+
+        if self.archive_format == 'zip':
+            with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                for entry in entries:
+                    archive.write(self._full_path(entry['path']), entry['path'])
+        else:
+            with tarfile.open(tmp_path, 'w:gz') as archive:
+                for entry in entries:
+                    archive.add(self._full_path(entry['path']), entry['path'])
+        os.replace(tmp_path, archive_path)
+        return name
+
+    def _prune_archives(self):
+        """Hapus arsip tertua di atas max_archives beserta entry-nya"""
+        archives = OrderedDict()
+        for entry in self._entries.values():
+            if entry['state'] == 'archived':
+                archives.setdefault(entry['archive'], []).append(entry['path'])
+
+        excess = list(archives)[:max(0, len(archives) - self.max_archives)]
+        for name in excess:
+            try:
+                os.remove(self._full_path(name))
+            except OSError:
+                pass
+            for path in archives[name]:
+                del self._entries[path]
+        return len(excess)
+
+    def _remove_empty_dirs(self):
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name != self.ARCHIVE_DIR and os.path.isdir(path) and not os.listdir(path):
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    pass
+
+    def _full_path(self, name):
+        return os.path.join(self.root, *name.split('/'))
+
+    def entries(self, prefix=None, state=None):
+        """List entry index (tertua dulu), bisa difilter prefix dan state"""
+        with self._lock:
+            return [dict(entry) for entry in self._entries.values()
+                    if (prefix is None or entry['prefix'] == prefix)
+                    and (state is None or entry['state'] == state)]
+
+    def read(self, name):
+        """
+        Baca isi skrip, dari file atau dari arsip
+
+        Args:
+            name: Path skrip relatif ke root (seperti di index)
+
+        Returns:
+            Isi skrip (string)
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(name)
+
+        if entry['state'] == 'live':
+            with open(self._full_path(name), encoding='utf-8') as f:
+                return f.read()
+
+        archive_path = self._full_path(entry['archive'])
+        if entry['archive'].endswith('.zip'):
+            with zipfile.ZipFile(archive_path) as archive:
+                return archive.read(name).decode('utf-8')
+        with tarfile.open(archive_path, 'r:gz') as archive:
+            return archive.extractfile(name).read().decode('utf-8')
+
+    def stats(self):
+        """Jumlah skrip live/archived, total ukuran live dan jumlah arsip"""
+        with self._lock:
+            live = [entry for entry in self._entries.values() if entry['state'] == 'live']
+            archives = {entry['archive'] for entry in self._entries.values()
+                        if entry['state'] == 'archived'}
+            return {
+                'live': len(live),
+                'live_bytes': sum(entry['size'] for entry in live),
+                'archived': len(self._entries) - len(live),
+                'archives': len(archives),
+                'index_lines': self._index_lines,
+            }
+
+
+_shared_stores = {}
+_shared_lock = threading.Lock()
+
+
+def shared_store(root="generated_scripts"):
+    """
+    ScriptStore bersama per folder (retensi default)
+
+    Generator yang dibuat berulang kali (misalnya per pemanggilan executor)
+    memakai store dan index yang sama, index.jsonl tidak di-parse ulang.
+
+    Args:
+        root: Folder skrip
+
+    Returns:
+        ScriptStore
+    """
+    key = os.path.abspath(root)
+    with _shared_lock:
+        store = _shared_stores.get(key)
+        if store is None:
+            store = _shared_stores[key] = ScriptStore(root)
+        return store
@@ -0,0 +1,161 @@
+"""
+Module untuk transfer array hasil besar lewat shared memory (zero-copy)
+
+Caller mengalokasikan blok shared memory (multiprocessing.shared_memory)
+dengan kapasitas tertentu. Skrip worker mengisi array di tempat lewat
+view NumPy dan menulis jumlah baris yang terisi di header blok. Caller
+lalu membaca view NumPy dari blok yang sama tanpa serialisasi.
+
+Layout setiap blok: header int64 (jumlah baris terisi), lalu data array.
+"""
+
+import gc
+import json
+import sys
+from multiprocessing import shared_memory
+
+# Ukuran header (int64 jumlah baris), data dimulai setelah header
+HEADER_SIZE = 8
+
+# Environment untuk spesifikasi blok di subprocess
+SHM_SPEC_ENV = "DIGSILENT_SHM_SPEC"
+
+# Blok yang masih punya view hidup saat close(); mapping dibiarkan sampai
+# process selesai supaya view tidak menunjuk ke memori yang sudah di-unmap
+_lingering_blocks = []
+
+
+def _mapping_refs(shm):
+    """Jumlah referensi ke mapping blok (view NumPy mereferensikan mmap)"""
+    mapping = getattr(shm, '_mmap', None)
+    return None if mapping is None else sys.getrefcount(mapping)
+
+
+class SharedResultArrays:
+    """
+    Sekumpulan array hasil di shared memory, dialokasikan oleh caller
+
+    Contoh:
+        with SharedResultArrays({"ElmTerm.m:u": ("f8", (50000,))}) as arrays:
+            executor.execute_with_shared_arrays(script_path, arrays)
+            voltages = arrays.array("ElmTerm.m:u")   # view, tanpa copy
+    """
+
+    def __init__(self, spec):
+        """
+        Alokasi shared memory
+
+        Args:
+            spec: Dict {nama: (dtype, shape)}, dimensi pertama shape adalah
+                  kapasitas baris (misalnya jumlah bus atau jumlah sample)
+        """
+        import numpy as np
+
+        self._np = np
+        self._blocks = {}
+        self._baseline_refs = {}
+        try:
+            for name, (dtype, shape) in spec.items():
+                dtype = np.dtype(dtype)
+                shape = tuple(shape) if isinstance(shape, (tuple, list)) else (shape,)
+                nbytes = int(np.prod(shape)) * dtype.itemsize
+                shm = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + max(nbytes, 1))
+                self._baseline_refs[name] = _mapping_refs(shm)
+                header = np.ndarray((1,), dtype=np.int64, buffer=shm.buf)
+                header[0] = 0
+                data = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=HEADER_SIZE)
+                self._blocks[name] = (shm, header, data)
+        except Exception:
+            self.close()
+            raise
+
+    @classmethod
+    def for_elements(cls, element_classes, capacity):
+        """
+        Buat buffer float64 per (class, attribute) numerik
+
+        Args:
+            element_classes: Dict {class: [attribute, ...]}, 'loc_name' dilewati
+            capacity: Jumlah maksimal elemen per class
+
+        Returns:
+            SharedResultArrays
+        """
+        spec = {}
+        for class_name, attributes in element_classes.items():
+            for attribute in attributes:
+                if attribute != 'loc_name':
+                    spec[f"{class_name}.{attribute}"] = ('f8', (capacity,))
+        return cls(spec)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def names(self):
+        return list(self._blocks)
+
+    def capacity(self, name):
+        """Kapasitas baris sebuah array"""
+        return self._blocks[name][2].shape[0]
+
+    def spec_json(self):
+        """Spesifikasi blok (nama shm, dtype, shape) sebagai JSON untuk worker"""
+        return json.dumps({
+            name: {'shm': shm.name, 'dtype': data.dtype.str, 'shape': list(data.shape)}
+            for name, (shm, header, data) in self._blocks.items()
+        })
+
+    def child_env(self):
+        """Environment tambahan untuk subprocess worker"""
+        return {SHM_SPEC_ENV: self.spec_json()}
+
+    def views(self):
+        """View (header, data) untuk worker in-process (tanpa attach ulang)"""
+        return {name: (header, data) for name, (shm, header, data) in self._blocks.items()}
+
+    def rows(self, name):
+        """Jumlah baris yang sudah diisi worker"""
+        return int(self._blocks[name][1][0])
+
+    def array(self, name):
+        """
+        View NumPy zero-copy dari baris yang sudah diisi worker
+
+        View hanya valid selama SharedResultArrays belum di-close. Gunakan
+        .copy() jika data dibutuhkan lebih lama.
+        """
+        return self._blocks[name][2][:self.rows(name)]
+
+    def arrays(self):
+        """Dict {nama: view} untuk semua array"""
+        return {name: self.array(name) for name in self._blocks}
+
+    def close(self):
+        """
+        Lepas dan hapus semua blok shared memory
+
+        Jika masih ada view dari array() yang dipakai caller, blok tetap
+        di-unlink tetapi mapping-nya dibiarkan sampai process selesai.
+        """
+        names = list(self._blocks)
+        shms = {name: self._blocks[name][0] for name in names}
+        self._blocks = {}
+        gc.collect()
+
+        for name, shm in shms.items():
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+            baseline = self._baseline_refs.get(name)
+            refs = _mapping_refs(shm)
+            if baseline is not None and refs is not None and refs > baseline:
+                print(f"⚠ Shared memory '{name}' still has live views, mapping kept until exit")
+                _lingering_blocks.append(shm)
+            else:
+                shm.close()
@@ -0,0 +1,198 @@
+"""
+Module untuk parameter sweep (sensitivity) di session PowerFactory
+"""
+
+import itertools
+import json
+import os
+import time
+
+
+class ParameterSweep:
+    """
+    Sweep parameter langsung di model yang sedang aktif
+
+    Setiap titik grid di-apply dengan SetAttribute, load flow (ComLdf)
+    dijalankan dan output yang dipilih dibaca. Parameter yang diubah titik
+    sebelumnya tetapi tidak diset titik berikutnya dikembalikan ke nilai
+    awal lebih dulu, sehingga setiap titik dihitung hanya dengan nilai di
+    point-nya sendiri (hasil di cache konsisten dengan key-nya); semua nilai
+    awal dikembalikan setelah sweep selesai. Hasil di-memoize berdasarkan tuple
+    parameter, sehingga titik yang sudah pernah dihitung (di sweep yang sama
+    atau sweep lain yang overlap) tidak dihitung ulang.
+
+    Contoh:
+        with executor.session() as session:
+            sweep = ParameterSweep(
+                session,
+                parameters={("Load 1.ElmLod", "scale0"): [0.8, 0.9, 1.0, 1.1]},
+                outputs=[("Bus 1.ElmTerm", "m:u"), ("Line 1.ElmLne", "c:loading")],
+                cache_path="results/sweep_cache.json"
+            )
+            rows = sweep.run()
+    """
+
+    def __init__(self, session, parameters, outputs, cache_path=None, model_tag=None, index=None):
+        """
+        Initialize sweep
+
+        Args:
+            session: PowerFactorySession (atau handle aplikasi PowerFactory)
+            parameters: Dict {(nama objek, attribute): [nilai, ...]}, nama
+                        objek dengan class, misalnya "Load 1.ElmLod"
+            outputs: List (nama objek, attribute) yang dibaca per titik
+            cache_path: File JSON untuk cache persisten (optional)
+            model_tag: Penanda versi model, ikut di key cache (optional)
+            index: NetworkIndex untuk lookup objek (optional, misalnya
+                   session.network_index()); perubahan attribute topologi
+                   selalu lewat index ini atau index session
+        """
+        self.session = session
+        self.parameters = {tuple(key): list(values) for key, values in parameters.items()}
+        self.outputs = [tuple(output) for output in outputs]
+        self.cache_path = cache_path
+        self.model_tag = model_tag
+        self.index = index
+        self.hits = 0
+        self.misses = 0
+        self._objects = {}
+        self._cache = self._load_cache()
+
+    def _app(self):
+        if hasattr(self.session, 'ensure_connected'):
+            return self.session.ensure_connected()
+        return self.session
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        with open(self.cache_path, 'r') as f:
+            return json.load(f)
+
+    def save_cache(self):
+        """Simpan cache ke cache_path (jika diset)"""
+        if not self.cache_path:
+            return
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._cache, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def cache_key(self, point):
+        """
+        Key cache untuk satu titik
+
+        Args:
+            point: Dict {(nama objek, attribute): nilai}
+
+        Returns:
+            String JSON dari tuple parameter yang sudah diurutkan
+        """
+        items = sorted(([name, attribute, value] for (name, attribute), value in point.items()),
+                       key=lambda item: (item[0], item[1]))
+        return json.dumps([self.model_tag, items], default=str)
+
+    def _object(self, app, name):
+        """Cari objek berdasarkan nama (sekali per sweep)"""
+        if name not in self._objects and self.index is not None:
+            self._objects[name] = self.index.lookup(name)
+        if name not in self._objects:
+            objects = app.GetCalcRelevantObjects(name)
+            if not objects:
+                raise KeyError(f"Object not found: {name}")
+            self._objects[name] = objects[0]
+        return self._objects[name]
+
+    def _set_attribute(self, obj, attribute, value):
+        """SetAttribute lewat NetworkIndex jika ada (invalidate untuk outserv/on_off)"""
+        index = self.index
+        if index is None and hasattr(self.session, 'network_index'):
+            index = self.session.network_index()
+        if index is not None:
+            index.set_attribute(obj, attribute, value)
+        else:
+            obj.SetAttribute(attribute, value)
+
+    def grid(self):
+        """Semua titik (product dari nilai parameter) sebagai list dict"""
+        keys = list(self.parameters)
+        return [dict(zip(keys, values)) for values in itertools.product(*self.parameters.values())]
+
+    def run(self, points=None):
+        """
+        Jalankan sweep
+
+        Args:
+            points: List dict {(nama objek, attribute): nilai} (optional,
+                    default semua titik dari grid())
+
+        Returns:
+            List dict per titik: point, error_code, outputs, cached, elapsed
+        """
+        if points is None:
+            points = self.grid()
+
+        app = self._app()
+        ldf = None
+        originals = {}
+        modified = set()
+        rows = []
+        start_time = time.perf_counter()
+
+        try:
+            for point in points:
+                key = self.cache_key(point)
+                cached = self._cache.get(key)
+                if cached is not None and all(f"{name}:{attribute}" in cached['outputs']
+                                              for name, attribute in self.outputs):
+                    self.hits += 1
+                    rows.append({'point': point, 'error_code': cached['error_code'],
+                                 'outputs': cached['outputs'], 'cached': True, 'elapsed': 0.0})
+                    continue
+
+                self.misses += 1
+                point_start = time.perf_counter()
+
+                # Reset parameter titik sebelumnya yang tidak ada di titik ini
+                for name, attribute in modified.difference(point):
+                    self._set_attribute(self._objects[name], attribute, originals[(name, attribute)])
+                    modified.discard((name, attribute))
+
+                for (name, attribute), value in point.items():
+                    obj = self._object(app, name)
+                    if (name, attribute) not in originals:
+                        originals[(name, attribute)] = obj.GetAttribute(attribute)
+                    self._set_attribute(obj, attribute, value)
+                    modified.add((name, attribute))
+
+                if ldf is None:
+                    ldf = app.GetFromStudyCase("ComLdf")
+                    if ldf is None:
+                        print("✗ Cannot get Load Flow command")
+                        break
+
+                error_code = ldf.Execute()
+                outputs = {}
+                if error_code == 0:
+                    for name, attribute in self.outputs:
+                        outputs[f"{name}:{attribute}"] = self._object(app, name).GetAttribute(attribute)
+
+                self._cache[key] = {'error_code': error_code, 'outputs': outputs}
+                rows.append({'point': point, 'error_code': error_code, 'outputs': outputs,
+                             'cached': False, 'elapsed': time.perf_counter() - point_start})
+
+        finally:
+            # Kembalikan model ke kondisi awal
+            for name, attribute in modified:
+                self._set_attribute(self._objects[name], attribute, originals[(name, attribute)])
+            self.save_cache()
+
+        cached = sum(1 for row in rows if row['cached'])
+        failed = sum(1 for row in rows if row['error_code'] != 0)
+        mark = "✓" if failed == 0 else "✗"
+        print(f"{mark} Sweep: {len(rows)} points ({cached} cached, {len(rows) - cached} solved, "
+              f"{failed} failed) in {time.perf_counter() - start_time:.2f} seconds")
+        return rows
@@ -0,0 +1,945 @@
+"""
+Module template untuk generate skrip DIgSILENT PowerFactory
+"""
+
+import hashlib
+from string import Formatter
+
+
+class ScriptTemplate:
+    """
+    Template skrip yang di-parse sekali (syntax sama dengan str.format)
+
+    Source di-split menjadi potongan literal dan field saat template dibuat,
+    sehingga render hanya menyambung string tanpa parsing ulang.
+    """
+
+    def __init__(self, name, source=None, chunks=None, defaults=None):
+        """
+        Initialize template
+
+        Args:
+            name: Nama template
+            source: Source template dengan field {nama}, {nama!r}, {nama:spec}
+            chunks: Potongan hasil parse (internal, dipakai oleh partial())
+            defaults: Dict nilai default untuk field (optional)
+        """
+        self.name = name
+        self.defaults = dict(defaults or {})
+        if chunks is None:
+            chunks = []
+            for literal, field_name, format_spec, conversion in Formatter().parse(source):
+                if literal:
+                    chunks.append(literal)
+                if field_name is not None:
+                    if not field_name.isidentifier():
+                        raise ValueError(f"Template '{name}': unsupported field '{{{field_name}}}'")
+                    chunks.append((field_name, format_spec, conversion))
+        self.chunks = chunks
+        self.fields = frozenset(chunk[0] for chunk in chunks if isinstance(chunk, tuple))
+
+    @staticmethod
+    def _format_field(value, format_spec, conversion):
+        if conversion == 'r':
+            value = repr(value)
+        elif conversion == 's':
+            value = str(value)
+        elif conversion == 'a':
+            value = ascii(value)
+        return format(value, format_spec or '')
+
+    def render(self, **params):
+        """
+        Render template
+
+        Args:
+            **params: Nilai untuk semua field template
+
+        Returns:
+            String skrip
+        """
+        if self.defaults:
+            params = {**self.defaults, **params}
+
+        missing = self.fields.difference(params)
+        if missing:
+            raise KeyError(f"Template '{self.name}' missing parameters: {', '.join(sorted(missing))}")
+
+        parts = []
+        for chunk in self.chunks:
+            if isinstance(chunk, tuple):
+                field_name, format_spec, conversion = chunk
+                parts.append(self._format_field(params[field_name], format_spec, conversion))
+            else:
+                parts.append(chunk)
+        return ''.join(parts)
+
+    def partial(self, **params):
+        """
+        Isi sebagian field, hasilnya template baru
+
+        Field yang sudah diisi digabung dengan literal di sekitarnya, sehingga
+        render berikutnya hanya mengisi parameter yang berubah.
+
+        Args:
+            **params: Nilai untuk sebagian field
+
+        Returns:
+            ScriptTemplate baru
+        """
+        chunks = []
+        for chunk in self.chunks:
+            if isinstance(chunk, tuple) and chunk[0] in params:
+                field_name, format_spec, conversion = chunk
+                chunk = self._format_field(params[field_name], format_spec, conversion)
+
+            if isinstance(chunk, str) and chunks and isinstance(chunks[-1], str):
+                chunks[-1] += chunk
+            else:
+                chunks.append(chunk)
+        defaults = {key: value for key, value in self.defaults.items() if key not in params}
+        return ScriptTemplate(self.name, chunks=chunks, defaults=defaults)
+
+
+class TemplateRegistry:
+    """
+    Registry template skrip, setiap template di-parse sekali saat register
+    """
+
+    def __init__(self):
+        self._templates = {}
+
+    def register(self, name, source, fixed=None, **defaults):
+        """
+        Parse dan simpan template
+
+        Args:
+            name: Nama template
+            source: Source template
+            fixed: Dict field yang tidak pernah berubah (misalnya kode result
+                   channel), diisi sekali dengan partial() saat register
+            **defaults: Nilai default untuk field template (optional,
+                        bisa di-override saat render)
+
+        Returns:
+            ScriptTemplate
+        """
+        template = ScriptTemplate(name, source, defaults=defaults)
+        if fixed:
+            template = template.partial(**fixed)
+        self._templates[name] = template
+        return template
+
+    def get(self, name):
+        """Ambil template berdasarkan nama"""
+        try:
+            return self._templates[name]
+        except KeyError:
+            raise KeyError(f"Unknown template: {name}") from None
+
+    def render(self, name, **params):
+        """Render template berdasarkan nama"""
+        return self.get(name).render(**params)
+
+    def names(self):
+        """List nama template yang terdaftar"""
+        return sorted(self._templates)
+
+
+def content_key(content, length=16):
+    """
+    Hash isi skrip untuk nama file content-addressed
+
+    Args:
+        content: Isi skrip
+        length: Panjang hex digest yang dipakai
+
+    Returns:
+        String hex SHA-256 (dipotong)
+    """
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:length]
+
+
+LOAD_FLOW_TEMPLATE = '''"""
+Auto-generated script untuk Load Flow Calculation
+{generated_at}"""
+
+import powerfactory as pf
+import time
+
+EMIT_VOLTAGES = {emit_voltages!r}
+
+{result_channel}
+def run_load_flow():
+    # Get PowerFactory application
+    app = globals().get("app") or pf.GetApplication()
+    if app is None:
+        print("Error: Cannot connect to PowerFactory")
+        return False
+
+    print("Connected to PowerFactory")
+
+    # Get active project
+    project = app.GetActiveProject()
+    if project is None:
+        print("Error: No active project")
+        return False
+
+    print(f"Active Project: {{project.GetFullName()}}")
+
+    # Activate study case if specified
+{study_case_code}
+
+    # Get Load Flow command
+    ldf = app.GetFromStudyCase("ComLdf")
+    if ldf is None:
+        print("Error: Cannot get Load Flow command")
+        return False
+
+    # Execute Load Flow
+    print("Executing Load Flow...")
+    start = time.perf_counter()
+    result = ldf.Execute()
+    elapsed = time.perf_counter() - start
+
+    payload = {{
+        "event": "load_flow",
+        "status": "ok" if result == 0 else "failed",
+        "error_code": result,
+        "iterations": _ldf_iterations(ldf),
+        "elapsed": elapsed,
+    }}
+    if EMIT_VOLTAGES and result == 0:
+        terminals = app.GetCalcRelevantObjects("*.ElmTerm")
+        payload["bus_names"] = [term.GetAttribute("loc_name") for term in terminals]
+        payload["bus_voltages"] = [term.GetAttribute("m:u") for term in terminals]
+    _emit_result(**payload)
+
+    if result == 0:
+        print("✓ Load Flow calculation successful")
+        return True
+    else:
+        print(f"✗ Load Flow calculation failed with error code: {{result}}")
+        return False
+
+if __name__ == "__main__":
+    success = run_load_flow()
+    _emit_result(event="script", status="ok" if success else "failed")
+    print("\\n" + "="*60)
+    if success:
+        print("SCRIPT COMPLETED SUCCESSFULLY")
+    else:
+        print("SCRIPT FAILED")
+    print("="*60)
+'''
+
+
+BATCH_LOAD_FLOW_TEMPLATE = '''"""
+Auto-generated script untuk Batch Load Flow Calculation
+{generated_at}"""
+
+import powerfactory as pf
+import json
+import os
+import time
+
+STUDY_CASES = {study_cases!r}
+RESULT_PATH = {result_path!r}
+if RESULT_PATH is None:
+    # Default: di sebelah skrip, sehingga isi skrip tidak bergantung pada nama file
+    RESULT_PATH = os.path.splitext(os.path.abspath(__file__))[0] + "_results.json"
+
+{result_channel}
+def run_batch_load_flow():
+    # Get PowerFactory application (sekali untuk semua study case)
+    app = globals().get("app") or pf.GetApplication()
+    if app is None:
+        print("Error: Cannot connect to PowerFactory")
+        return None
+
+    print("Connected to PowerFactory")
+
+    # Get active project
+    project = app.GetActiveProject()
+    if project is None:
+        print("Error: No active project")
+        return None
+
+    print(f"Active Project: {{project.GetFullName()}}")
+
+    results = []
+    for name in STUDY_CASES:
+        start = time.perf_counter()
+        row = {{"study_case": name, "status": "failed", "error_code": None}}
+
+        try:
+            study_cases = project.GetContents(name)
+            if not study_cases:
+                row["status"] = "not_found"
+            else:
+                study_cases[0].Activate()
+
+                ldf = app.GetFromStudyCase("ComLdf")
+                if ldf is None:
+                    row["status"] = "no_ldf"
+                else:
+                    code = ldf.Execute()
+                    row["error_code"] = code
+                    row["status"] = "ok" if code == 0 else "failed"
+        except Exception as e:
+            row["status"] = "error"
+            row["message"] = str(e)
+
+        row["elapsed"] = time.perf_counter() - start
+        results.append(row)
+        _emit_result(event="study_case", **row)
+
+        mark = "✓" if row["status"] == "ok" else "✗"
+        print(f"{{mark}} {{name}}: {{row['status']}} ({{row['elapsed']:.3f}} s)")
+
+    with open(RESULT_PATH, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"Results written to: {{RESULT_PATH}}")
+    return results
+
+if __name__ == "__main__":
+    results = run_batch_load_flow()
+    success = results is not None and all(r["status"] == "ok" for r in results)
+    _emit_result(event="script", status="ok" if success else "failed", result_path=RESULT_PATH)
+    print("\\n" + "="*60)
+    if success:
+        print("SCRIPT COMPLETED SUCCESSFULLY")
+    else:
+        print("SCRIPT FAILED")
+    print("="*60)
+'''
+
+
+EXPORT_RESULTS_TEMPLATE = '''"""
+Auto-generated script untuk Export Results
+{generated_at}"""
+
+import powerfactory as pf
+import csv
+import time
+
+{result_channel}
+def export_results():
+    # Get PowerFactory application
+    app = globals().get("app") or pf.GetApplication()
+    if app is None:
+        print("Error: Cannot connect to PowerFactory")
+        return False
+
+    print("Connected to PowerFactory")
+
+    # Get active project
+    project = app.GetActiveProject()
+    if project is None:
+        print("Error: No active project")
+        return False
+
+    print(f"Active Project: {{project.GetFullName()}}")
+
+    # Get all terminals (busbar), dari index session jika ada (nama dibaca sekali per session)
+    index = globals().get("network_index")
+    if index is not None:
+        terminals = index.objects("ElmTerm")
+        names = index.names("ElmTerm")
+    else:
+        terminals = app.GetCalcRelevantObjects("*.ElmTerm")
+        names = [term.GetAttribute('loc_name') for term in terminals]
+
+    print(f"Found {{len(terminals)}} terminals")
+
+    # Export to CSV
+    export_file = r"{export_path}"
+    print(f"Exporting to: {{export_file}}")
+
+    start = time.perf_counter()
+    with open(export_file, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        # Header
+        writer.writerow(['Name', 'Voltage (kV)', 'Angle (deg)', 'Type'])
+
+        # Data
+        for name, term in zip(names, terminals):
+            voltage = term.GetAttribute('m:u')  # Voltage in p.u.
+            angle = term.GetAttribute('m:phiu')  # Voltage angle in degrees
+            term_type = term.GetAttribute('iUsage')
+
+            writer.writerow([name, voltage, angle, term_type])
+
+    print(f"✓ Exported {{len(terminals)}} terminals to {{export_file}}")
+    _emit_result(event="export", status="ok", path=export_file, rows=len(terminals),
+                 elapsed=time.perf_counter() - start)
+    return True
+
+if __name__ == "__main__":
+    success = export_results()
+    _emit_result(event="script", status="ok" if success else "failed")
+    print("\\n" + "="*60)
+    if success:
+        print("EXPORT COMPLETED SUCCESSFULLY")
+    else:
+        print("EXPORT FAILED")
+    print("="*60)
+'''
+
+
+COLUMNAR_EXPORT_TEMPLATE = '''"""
+Auto-generated script untuk Export Results (columnar)
+{generated_at}"""
+
+import powerfactory as pf
+import os
+import time
+
+ELEMENT_ATTRIBUTES = {element_classes!r}
+EXPORT_PATH = r"{export_path}"
+EXPORT_FORMAT = "{fmt}"
+
+{result_channel}
+def collect_column(objects, attribute):
+    # Satu pass per attribute, missing attribute jadi None
+    try:
+        return [obj.GetAttribute(attribute) for obj in objects]
+    except Exception:
+        column = []
+        for obj in objects:
+            try:
+                column.append(obj.GetAttribute(attribute))
+            except Exception:
+                column.append(None)
+        return column
+
+def to_array(np, values):
+    if any(isinstance(v, str) for v in values):
+        return np.array(["" if v is None else str(v) for v in values])
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+def export_columnar():
+    try:
+        import numpy as np
+    except ImportError:
+        print("Error: numpy is required for columnar export")
+        return False
+
+    # Get PowerFactory application
+    app = globals().get("app") or pf.GetApplication()
+    if app is None:
+        print("Error: Cannot connect to PowerFactory")
+        return False
+
+    print("Connected to PowerFactory")
+
+    # Get active project
+    project = app.GetActiveProject()
+    if project is None:
+        print("Error: No active project")
+        return False
+
+    print(f"Active Project: {{project.GetFullName()}}")
+
+    start = time.perf_counter()
+    tables = {{}}
+    for class_name, attributes in ELEMENT_ATTRIBUTES.items():
+        objects = app.GetCalcRelevantObjects("*." + class_name)
+        tables[class_name] = {{attr: to_array(np, collect_column(objects, attr)) for attr in attributes}}
+        print(f"Collected {{len(objects)}} {{class_name}} x {{len(attributes)}} attributes")
+
+    print(f"Exporting ({{EXPORT_FORMAT}}) to: {{EXPORT_PATH}}")
+
+    if EXPORT_FORMAT == "npz":
+        arrays = {{f"{{cls}}.{{attr}}": col for cls, columns in tables.items() for attr, col in columns.items()}}
+        np.savez(EXPORT_PATH, **arrays)
+    else:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            print("Error: pyarrow is required for parquet/arrow export")
+            return False
+
+        os.makedirs(EXPORT_PATH, exist_ok=True)
+        for class_name, columns in tables.items():
+            table = pa.table(columns)
+            if EXPORT_FORMAT == "parquet":
+                pq.write_table(table, os.path.join(EXPORT_PATH, class_name + ".parquet"))
+            else:
+                with pa.OSFile(os.path.join(EXPORT_PATH, class_name + ".arrow"), "wb") as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+
+    print(f"✓ Exported {{len(tables)}} element classes to {{EXPORT_PATH}}")
+    _emit_result(
+        event="export",
+        status="ok",
+        path=EXPORT_PATH,
+        format=EXPORT_FORMAT,
+        elapsed=time.perf_counter() - start,
+        counts={{cls: len(next(iter(columns.values()), [])) for cls, columns in tables.items()}}
+    )
+    return True
+
+if __name__ == "__main__":
+    success = export_columnar()
+    _emit_result(event="script", status="ok" if success else "failed")
+    print("\\n" + "="*60)
+    if success:
+        print("EXPORT COMPLETED SUCCESSFULLY")
+    else:
+        print("EXPORT FAILED")
+    print("="*60)
+'''
+
+
+# Snippet yang disisipkan ke template: kirim payload JSON-lines ke executor.
+# In-process: lewat callable _digsilent_emit di globals skrip.
+# Subprocess: lewat pipe (DIGSILENT_RESULT_FD di POSIX, DIGSILENT_RESULT_HANDLE di Windows).
+RESULT_CHANNEL_CODE = '''_RESULT_FD = None
+
+def _emit_result(**payload):
+    # Kirim hasil terstruktur ke executor (tanpa parsing stdout)
+    global _RESULT_FD
+    import json
+    import os
+
+    emit = globals().get("_digsilent_emit")
+    if emit is not None:
+        emit(json.loads(json.dumps(payload, default=str)))
+        return
+
+    if _RESULT_FD is None:
+        if os.environ.get("DIGSILENT_RESULT_HANDLE"):
+            import msvcrt
+            _RESULT_FD = msvcrt.open_osfhandle(int(os.environ["DIGSILENT_RESULT_HANDLE"]), os.O_WRONLY)
+        elif os.environ.get("DIGSILENT_RESULT_FD"):
+            _RESULT_FD = int(os.environ["DIGSILENT_RESULT_FD"])
+        else:
+            _RESULT_FD = -1
+
+    if _RESULT_FD < 0:
+        return
+
+    data = (json.dumps(payload, default=str) + "\\n").encode("utf-8")
+    while data:
+        data = data[os.write(_RESULT_FD, data):]
+
+def _ldf_iterations(ldf):
+    # Jumlah iterasi load flow, jika tersedia di versi PowerFactory ini
+    try:
+        value = ldf.GetAttribute("c:iter")
+    except Exception:
+        return None
+    return None if value is None else int(value)
+'''
+
+
+# Snippet sisi worker untuk shared memory (lihat digsilent_shared_results).
+# In-process: view dari _digsilent_shared_arrays di globals skrip.
+# Subprocess: attach ke blok dari environment DIGSILENT_SHM_SPEC.
+SHARED_ARRAYS_CODE = '''_SHM_HANDLES = []
+
+def _attach_shared_arrays():
+    # Return dict {nama: (header, data)}; header[0] = jumlah baris terisi
+    views = globals().get("_digsilent_shared_arrays")
+    if views is not None:
+        return views
+
+    import json
+    import os
+    spec = os.environ.get("DIGSILENT_SHM_SPEC")
+    if not spec:
+        return {}
+
+    import numpy as np
+    from multiprocessing import shared_memory
+
+    views = {}
+    for name, info in json.loads(spec).items():
+        try:
+            shm = shared_memory.SharedMemory(name=info["shm"], track=False)
+        except TypeError:
+            # Python < 3.13: jangan biarkan resource tracker worker menghapus blok milik caller
+            shm = shared_memory.SharedMemory(name=info["shm"])
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(shm._name, "shared_memory")
+            except Exception:
+                pass
+        _SHM_HANDLES.append(shm)
+        header = np.ndarray((1,), dtype=np.int64, buffer=shm.buf)
+        data = np.ndarray(tuple(info["shape"]), dtype=np.dtype(info["dtype"]), buffer=shm.buf, offset=8)
+        views[name] = (header, data)
+    return views
+'''
+
+
+SHARED_EXPORT_TEMPLATE = '''"""
+Auto-generated script untuk Export Results ke shared memory
+{generated_at}"""
+
+import powerfactory as pf
+
+ELEMENT_ATTRIBUTES = {element_classes!r}
+
+{result_channel}
+{shared_arrays}
+def export_shared():
+    try:
+        import numpy as np
+    except ImportError:
+        print("Error: numpy is required for shared memory export")
+        return False
+
+    # Get PowerFactory application
+    app = globals().get("app") or pf.GetApplication()
+    if app is None:
+        print("Error: Cannot connect to PowerFactory")
+        return False
+
+    print("Connected to PowerFactory")
+
+    arrays = _attach_shared_arrays()
+    if not arrays:
+        print("Error: No shared memory arrays attached")
+        return False
+
+    counts = {{}}
+    names = {{}}
+    overflow = {{}}
+    for class_name, attributes in ELEMENT_ATTRIBUTES.items():
+        objects = app.GetCalcRelevantObjects("*." + class_name)
+        counts[class_name] = len(objects)
+        names[class_name] = [obj.GetAttribute("loc_name") for obj in objects]
+
+        for attribute in attributes:
+            key = class_name + "." + attribute
+            if key not in arrays:
+                continue
+
+            header, data = arrays[key]
+            if len(objects) > data.shape[0]:
+                overflow[key] = len(objects)
+                continue
+
+            # Isi array di tempat, tanpa list/CSV perantara
+            for i, obj in enumerate(objects):
+                try:
+                    value = obj.GetAttribute(attribute)
+                except Exception:
+                    value = None
+                data[i] = np.nan if value is None else value
+            header[0] = len(objects)
+
+        print(f"Filled {{len(objects)}} {{class_name}} x {{len(attributes)}} attributes")
+
+    if overflow:
+        print(f"✗ Shared memory capacity exceeded: {{overflow}}")
+        _emit_result(event="shared_export", status="capacity_exceeded", required=overflow, counts=counts)
+        return False
+
+    print(f"✓ Exported {{len(counts)}} element classes to shared memory")
+    _emit_result(event="shared_export", status="ok", counts=counts, names=names)
+    return True
+
+if __name__ == "__main__":
+    success = export_shared()
+    _emit_result(event="script", status="ok" if success else "failed")
+    print("\\n" + "="*60)
+    if success:
+        print("EXPORT COMPLETED SUCCESSFULLY")
+    else:
+        print("EXPORT FAILED")
+    print("="*60)
+'''
+
+
+DELTA_EXPORT_TEMPLATE = '''"""
+Auto-generated script untuk Incremental (Delta) Export
+{generated_at}"""
+
+import powerfactory as pf
+import hashlib
+import json
+import os
+import time
+
+ELEMENT_ATTRIBUTES = {element_classes!r}
+EXPORT_DIR = {export_dir!r}
+DECIMALS = {decimals!r}
+
+STATE_FILE = os.path.join(EXPORT_DIR, "fingerprints.json")
+DELTA_LOG = os.path.join(EXPORT_DIR, "delta_log.jsonl")
+
+{result_channel}
+def normalize(value):
+    # Bulatkan angka supaya noise numerik kecil tidak dianggap perubahan
+    if isinstance(value, float):
+        return round(value, DECIMALS)
+    return value
+
+def fingerprint(values):
+    data = json.dumps(values, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+def export_delta():
+    # Get PowerFactory application
+    app = globals().get("app") or pf.GetApplication()
+    if app is None:
+        print("Error: Cannot connect to PowerFactory")
+        return False
+
+    print("Connected to PowerFactory")
+
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    state = {{"run": 0, "fingerprints": {{}}}}
+    if os.path.exists(STATE_FILE):
+        with open(STATE_FILE, "r") as f:
+            state = json.load(f)
+
+    run = state["run"] + 1
+    previous = state["fingerprints"]
+    current = {{}}
+    timestamp = time.time()
+    changed = 0
+    total = 0
+
+    with open(DELTA_LOG, "a") as log:
+        for class_name, attributes in ELEMENT_ATTRIBUTES.items():
+            for obj in app.GetCalcRelevantObjects("*." + class_name):
+                name = obj.GetAttribute("loc_name")
+                values = {{}}
+                for attribute in attributes:
+                    if attribute == "loc_name":
+                        continue
+                    try:
+                        values[attribute] = normalize(obj.GetAttribute(attribute))
+                    except Exception:
+                        values[attribute] = None
+
+                key = class_name + ":" + name
+                digest = fingerprint(values)
+                current[key] = digest
+                total += 1
+
+                if previous.get(key) != digest:
+                    row = {{"run": run, "time": timestamp, "class": class_name, "name": name, "values": values}}
+                    log.write(json.dumps(row, default=str) + "\\n")
+                    changed += 1
+
+        removed = [key for key in previous if key not in current]
+        for key in removed:
+            class_name, name = key.split(":", 1)
+            row = {{"run": run, "time": timestamp, "class": class_name, "name": name, "removed": True}}
+            log.write(json.dumps(row) + "\\n")
+
+    tmp_file = STATE_FILE + ".tmp"
+    with open(tmp_file, "w") as f:
+        json.dump({{"run": run, "fingerprints": current}}, f)
+    os.replace(tmp_file, STATE_FILE)
+
+    print(f"✓ Delta export run {{run}}: {{changed}} changed, {{len(removed)}} removed of {{total}} elements")
+    _emit_result(event="delta_export", status="ok", run=run, changed=changed, removed=len(removed), total=total)
+    return True
+
+if __name__ == "__main__":
+    success = export_delta()
+    _emit_result(event="script", status="ok" if success else "failed")
+    print("\\n" + "="*60)
+    if success:
+        print("EXPORT COMPLETED SUCCESSFULLY")
+    else:
+        print("EXPORT FAILED")
+    print("="*60)
+'''
+
+
+LOAD_FLOW_CHAIN_TEMPLATE = '''"""
+Auto-generated script untuk Chained Load Flow (warm start)
+{generated_at}"""
+
+import powerfactory as pf
+
+STEPS = {steps!r}
+WARM_START = {warm_start!r}
+
+{result_channel}
+{chain_function}
+
+if __name__ == "__main__":
+    app = globals().get("app") or pf.GetApplication()
+    results = None
+    if app is None:
+        print("Error: Cannot connect to PowerFactory")
+    else:
+        print("Connected to PowerFactory")
+        results = run_load_flow_chain(app, STEPS, warm_start=WARM_START, emit=_emit_result)
+
+    success = results is not None and all(r["error_code"] == 0 for r in results)
+    _emit_result(event="script", status="ok" if success else "failed")
+    print("\\n" + "="*60)
+    if success:
+        print("SCRIPT COMPLETED SUCCESSFULLY")
+    else:
+        print("SCRIPT FAILED")
+    print("="*60)
+'''
+
+
+TIME_SERIES_TEMPLATE = '''"""
+Auto-generated script untuk Quasi-Dynamic Time Series
+{generated_at}"""
+
+import powerfactory as pf
+
+PROFILE_PATH = {profile_path!r}
+TARGETS = {targets!r}
+OUTPUTS = {outputs!r}
+OUTPUT_DIR = {output_dir!r}
+CHUNK_SIZE = {chunk_size!r}
+
+{result_channel}
+{time_series_function}
+
+if __name__ == "__main__":
+    app = globals().get("app") or pf.GetApplication()
+    summary = None
+    if app is None:
+        print("Error: Cannot connect to PowerFactory")
+    else:
+        print("Connected to PowerFactory")
+        summary = run_time_series(app, PROFILE_PATH, TARGETS, OUTPUTS, OUTPUT_DIR,
+                                  chunk_size=CHUNK_SIZE, emit=_emit_result)
+
+    success = summary is not None
+    if success:
+        _emit_result(event="time_series", **summary)
+    _emit_result(event="script", status="ok" if success else "failed")
+    print("\\n" + "="*60)
+    if success:
+        print("SCRIPT COMPLETED SUCCESSFULLY")
+    else:
+        print("SCRIPT FAILED")
+    print("="*60)
+'''
+
+
+CONTINGENCY_TEMPLATE = '''"""
+Auto-generated script untuk N-1 Contingency Analysis
+{generated_at}"""
+
+import powerfactory as pf
+
+OUTAGES = {outages!r}
+V_MIN = {v_min!r}
+V_MAX = {v_max!r}
+MAX_LOADING = {max_loading!r}
+
+{result_channel}
+{contingency_function}
+
+if __name__ == "__main__":
+    app = globals().get("app") or pf.GetApplication()
+    results = None
+    if app is None:
+        print("Error: Cannot connect to PowerFactory")
+    else:
+        print("Connected to PowerFactory")
+        results = run_contingencies(app, OUTAGES, v_min=V_MIN, v_max=V_MAX,
+                                    max_loading=MAX_LOADING, emit=_emit_result,
+                                    index=globals().get("network_index"))
+
+    success = results is not None
+    _emit_result(event="script", status="ok" if success else "failed")
+    print("\\n" + "="*60)
+    if success:
+        print("SCRIPT COMPLETED SUCCESSFULLY")
+    else:
+        print("SCRIPT FAILED")
+    print("="*60)
+'''
+
+
+SHORT_CIRCUIT_TEMPLATE = '''"""
+Auto-generated script untuk Short-Circuit Sweep (ComShc)
+{generated_at}"""
+
+import powerfactory as pf
+
+TERMINALS = {terminals!r}
+FAULT_TYPE = {fault_type!r}
+OPTIONS = {options!r}
+
+{result_channel}
+{short_circuit_function}
+
+if __name__ == "__main__":
+    app = globals().get("app") or pf.GetApplication()
+    result = None
+    if app is None:
+        print("Error: Cannot connect to PowerFactory")
+    else:
+        print("Connected to PowerFactory")
+        result = run_short_circuit_sweep(app, TERMINALS, fault_type=FAULT_TYPE,
+                                         options=OPTIONS, emit=_emit_result)
+
+    success = result is not None
+    _emit_result(event="script", status="ok" if success else "failed")
+    print("\\n" + "="*60)
+    if success:
+        print("SCRIPT COMPLETED SUCCESSFULLY")
+    else:
+        print("SCRIPT FAILED")
+    print("="*60)
+'''
+
+
+CUSTOM_TEMPLATE = '''"""
+Auto-generated custom script
+{generated_at}"""
+
+import powerfactory as pf
+
+{script_body}
+'''
+
+
+STUDY_CASE_TEMPLATE = '''    # Activate study case
+    study_case = project.GetContents("{study_case_name}")[0]
+    if study_case:
+        study_case.Activate()
+        print(f"Activated study case: {study_case_name}")
+    else:
+        print(f"Warning: Study case '{study_case_name}' not found")
+'''
+
+
+# Registry bersama, template built-in di-parse sekali saat module di-import
+RESULT_CHANNEL_FIELDS = {'result_channel': RESULT_CHANNEL_CODE}
+
+default_registry = TemplateRegistry()
+default_registry.register('load_flow', LOAD_FLOW_TEMPLATE,
+                          fixed=RESULT_CHANNEL_FIELDS, emit_voltages=False)
+default_registry.register('batch_load_flow', BATCH_LOAD_FLOW_TEMPLATE,
+                          fixed=RESULT_CHANNEL_FIELDS)
+default_registry.register('export_results', EXPORT_RESULTS_TEMPLATE,
+                          fixed=RESULT_CHANNEL_FIELDS)
+default_registry.register('columnar_export', COLUMNAR_EXPORT_TEMPLATE,
+                          fixed=RESULT_CHANNEL_FIELDS)
+default_registry.register('shared_export', SHARED_EXPORT_TEMPLATE,
+                          fixed={**RESULT_CHANNEL_FIELDS, 'shared_arrays': SHARED_ARRAYS_CODE})
+default_registry.register('delta_export', DELTA_EXPORT_TEMPLATE,
+                          fixed=RESULT_CHANNEL_FIELDS)
+default_registry.register('load_flow_chain', LOAD_FLOW_CHAIN_TEMPLATE,
+                          fixed=RESULT_CHANNEL_FIELDS)
+default_registry.register('time_series', TIME_SERIES_TEMPLATE,
+                          fixed=RESULT_CHANNEL_FIELDS)
+default_registry.register('contingency', CONTINGENCY_TEMPLATE,
+                          fixed=RESULT_CHANNEL_FIELDS)
+default_registry.register('short_circuit', SHORT_CIRCUIT_TEMPLATE,
+                          fixed=RESULT_CHANNEL_FIELDS)
+default_registry.register('custom', CUSTOM_TEMPLATE)
+default_registry.register('study_case', STUDY_CASE_TEMPLATE)
@@ -0,0 +1,278 @@
+"""
+Module untuk tracing per fase (span) dan profiling eksekusi skrip
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+
+class _Span:
+    """Context manager satu span (dibuat oleh Tracer.span)"""
+
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start')
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer.add_span(self.name, self.start, duration, self.category, **self.args)
+        return False
+
+
+class _NullSpan:
+    """Span no-op untuk tracer yang tidak aktif"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Pencatat span per fase eksekusi
+
+    Fase yang dicatat executor dan generator: discovery path, import
+    powerfactory, GetApplication, aktivasi project/study case, compile,
+    exec, spawn subprocess, render dan tulis skrip. Durasi yang dilaporkan
+    skrip lewat result channel (ComLdf.Execute, export, ...) dicatat
+    sebagai span kategori 'script'.
+
+    Span bisa ditulis sebagai Chrome trace-event JSON (buka di
+    chrome://tracing atau Perfetto). Jika profile_dir diisi, setiap job
+    juga di-profile dengan cProfile (file .prof per job).
+
+    Contoh:
+        tracer = Tracer(profile_dir="results/profiles")
+        executor = DIgSILENTExecutor(tracer=tracer)
+        generator = DIgSILENTScriptGenerator(tracer=tracer)
+        executor.execute_with_results(generator.generate_load_flow_script())
+        tracer.print_summary()
+        tracer.write_chrome_trace("results/trace.json")
+    """
+
+    def __init__(self, enabled=True, profile_dir=None):
+        """
+        Initialize tracer
+
+        Args:
+            enabled: Jika False, span() tidak mencatat apa pun (overhead minimal)
+            profile_dir: Folder output cProfile per job (optional)
+        """
+        self.enabled = enabled
+        self.profile_dir = profile_dir
+        self.spans = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._profile_count = 0
+
+    def span(self, name, category='executor', **args):
+        """
+        Context manager untuk mencatat durasi satu fase
+
+        Args:
+            name: Nama fase, misalnya 'compile' atau 'GetApplication'
+            category: Kategori span ('executor', 'session', 'generator', ...)
+            **args: Info tambahan yang ikut di trace (misalnya script)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def add_span(self, name, start, duration, category='executor', **args):
+        """
+        Catat span yang sudah diukur
+
+        Args:
+            name: Nama fase
+            start: Waktu mulai (time.perf_counter())
+            duration: Durasi dalam detik
+            category: Kategori span
+        """
+        if not self.enabled:
+            return
+        span = {
+            'name': name,
+            'category': category,
+            'start': start - self._origin,
+            'duration': duration,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': args,
+        }
+        with self._lock:
+            self.spans.append(span)
+
+    def add_script_spans(self, payloads, received, category='script'):
+        """
+        Ubah payload result channel yang punya 'elapsed' menjadi span
+
+        Payload dikirim skrip tepat setelah fase selesai, jadi waktu
+        terima dipakai sebagai akhir span.
+
+        Args:
+            payloads: List payload dari ResultChannel
+            received: List waktu terima (time.perf_counter()) per payload
+        """
+        if not self.enabled:
+            return
+        for payload, end in zip(payloads, received):
+            elapsed = payload.get('elapsed')
+            if not isinstance(elapsed, (int, float)):
+                continue
+            args = {key: value for key, value in payload.items()
+                    if key not in ('event', 'elapsed') and isinstance(value, (str, int, float))}
+            self.add_span(payload.get('event', 'script'), end - elapsed, elapsed, category, **args)
+
+    def profile_path(self, job_name):
+        """
+        Path file cProfile untuk satu job, atau None jika profiling tidak aktif
+
+        Returns:
+            Path <profile_dir>/<NNNN>_<job_name>.prof
+        """
+        if not self.enabled or not self.profile_dir:
+            return None
+        os.makedirs(self.profile_dir, exist_ok=True)
+        with self._lock:
+            self._profile_count += 1
+            count = self._profile_count
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', os.path.basename(job_name))
+        return os.path.join(self.profile_dir, f"{count:04d}_{safe_name}.prof")
+
+    def python_command(self, python_executable, script_path):
+        """
+        Command line subprocess, dengan cProfile jika profile_dir diisi
+
+        Returns:
+            List argumen untuk subprocess
+        """
+        profile_path = self.profile_path(script_path)
+        if profile_path is None:
+            return [python_executable, script_path]
+        return [python_executable, '-m', 'cProfile', '-o', profile_path, script_path]
+
+    def profile(self, job_name):
+        """
+        Context manager cProfile untuk job in-process (no-op jika tidak aktif)
+
+        Args:
+            job_name: Nama job (biasanya path skrip)
+        """
+        profile_path = self.profile_path(job_name)
+        if profile_path is None:
+            return _NULL_SPAN
+        return _Profile(profile_path)
+
+    def summary(self):
+        """
+        Ringkasan durasi per nama span
+
+        Returns:
+            Dict {name: {'count', 'total', 'mean', 'max'}}
+        """
+        summary = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            entry = summary.setdefault(span['name'], {'count': 0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['total'] += span['duration']
+            entry['max'] = max(entry['max'], span['duration'])
+        for entry in summary.values():
+            entry['mean'] = entry['total'] / entry['count']
+        return summary
+
+    def print_summary(self):
+        """Cetak tabel durasi per fase, diurutkan dari total terbesar"""
+        summary = self.summary()
+        print(f"{'Phase':<28}{'Count':>7}{'Total (ms)':>13}{'Mean (ms)':>12}{'Max (ms)':>11}")
+        for name, entry in sorted(summary.items(), key=lambda item: -item[1]['total']):
+            print(f"{name:<28}{entry['count']:>7}{entry['total'] * 1000:>13.2f}"
+                  f"{entry['mean'] * 1000:>12.3f}{entry['max'] * 1000:>11.3f}")
+
+    def chrome_trace(self):
+        """
+        Span dalam format Chrome trace-event (complete events, 'ph': 'X')
+
+        Returns:
+            Dict {'traceEvents': [...], 'displayTimeUnit': 'ms'}
+        """
+        with self._lock:
+            spans = list(self.spans)
+        events = [
+            {
+                'name': span['name'],
+                'cat': span['category'],
+                'ph': 'X',
+                'ts': span['start'] * 1e6,
+                'dur': span['duration'] * 1e6,
+                'pid': span['pid'],
+                'tid': span['tid'],
+                'args': span['args'],
+            }
+            for span in spans
+        ]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path):
+        """
+        Tulis span ke file JSON Chrome trace-event
+
+        Returns:
+            Path file trace
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f, default=str)
+        print(f"✓ Trace written: {path} ({len(self.spans)} spans)")
+        return path
+
+    def clear(self):
+        """Hapus semua span yang tercatat"""
+        with self._lock:
+            self.spans = []
+
+
+class _Profile:
+    """Context manager cProfile yang menulis stats ke file"""
+
+    def __init__(self, path):
+        import cProfile
+        self.path = path
+        self.profiler = cProfile.Profile()
+
+    def __enter__(self):
+        self.profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.disable()
+        self.profiler.dump_stats(self.path)
+        return False
+
+
+# Tracer default (tidak aktif), dipakai jika executor/generator tidak diberi tracer
+NULL_TRACER = Tracer(enabled=False)
@@ -0,0 +1,332 @@
+"""
+Module untuk pool worker PowerFactory yang tetap hangat (preloaded)
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from digsilent_result_channel import StructuredResult
+
+
+def _current_rss_mb():
+    """RSS process saat ini dalam MB (None jika tidak bisa diukur)"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+def _worker_main(conn, module_name, sys_path, project_name, study_case):
+    """
+    Loop worker: import module API, aktifkan project, lalu layani job dari pipe
+
+    Pesan masuk:  ('script', path) | ('function', func, args, kwargs) | ('stop',)
+    Pesan keluar: ('ready', info) | ('error', message) | ('done', success, value, stdout, rss_mb)
+    """
+    import importlib
+
+    from digsilent_executor import PowerFactorySession
+    from digsilent_result_channel import ResultChannel
+
+    for path in reversed(sys_path or []):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    try:
+        module = importlib.import_module(module_name)
+        # "import powerfactory" di skrip/fungsi memakai module yang sudah di-preload
+        sys.modules['powerfactory'] = module
+        session = PowerFactorySession(project_name=project_name, study_case=study_case,
+                                      pf_module=module)
+        with contextlib.redirect_stdout(io.StringIO()):
+            session.connect()
+    except Exception as e:
+        conn.send(('error', f"{type(e).__name__}: {e}"))
+        conn.close()
+        return
+
+    conn.send(('ready', {'pid': os.getpid(), 'rss_mb': _current_rss_mb()}))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message[0] == 'stop':
+            break
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            try:
+                if message[0] == 'script':
+                    channel = ResultChannel()
+                    success = session.execute(message[1],
+                                              extra_globals={'_digsilent_emit': channel.emit})
+                    value = channel.payloads
+                else:
+                    _, func, args, kwargs = message
+                    value = session.call(func, *args, **kwargs)
+                    success = value is not None
+            except Exception as e:
+                success, value = False, None
+                print(f"✗ Worker error: {e}")
+
+        conn.send(('done', success, value, output.getvalue(), _current_rss_mb()))
+
+    session.close()
+    conn.close()
+
+
+class _Worker:
+    """Satu child process di pool"""
+
+    def __init__(self, worker_id, process, conn, info):
+        self.worker_id = worker_id
+        self.process = process
+        self.conn = conn
+        self.pid = info.get('pid')
+        self.rss_mb = info.get('rss_mb')
+        self.jobs = 0
+
+
+class WarmWorkerPool:
+    """
+    Pool child process persistent yang sudah import API dan aktifkan project
+
+    Cold subprocess membayar startup interpreter, import powerfactory,
+    startup engine dan aktivasi project untuk setiap skrip. Worker di pool
+    melakukan semua itu sekali, lalu menerima job lewat pipe. Worker
+    di-recycle setelah max_jobs job atau jika RSS melewati max_rss_mb
+    (membatasi memory leak), dan diganti jika crash atau timeout. Worker
+    yang mati tidak pernah kembali ke antrian: jika process pengganti gagal
+    start, pool mengecil satu slot (RuntimeError jika tidak ada worker lagi).
+
+    Contoh dengan fake engine:
+        with WarmWorkerPool(size=4, sys_path=["fake_powerfactory"]) as pool:
+            results = pool.map_scripts(script_paths)
+    """
+
+    def __init__(self, size=2, project_name=None, study_case=None, module_name='powerfactory',
+                 sys_path=None, max_jobs=100, max_rss_mb=None, timeout=None,
+                 start_method=None, executor=None):
+        """
+        Initialize pool (worker langsung di-start)
+
+        Args:
+            size: Jumlah worker process
+            project_name: Project yang diaktifkan di setiap worker (optional)
+            study_case: Study case yang diaktifkan di setiap worker (optional)
+            module_name: Nama module API (default 'powerfactory', bisa fake module)
+            sys_path: List path tambahan untuk import module (optional,
+                      default path PowerFactory dari executor)
+            max_jobs: Recycle worker setelah sejumlah job
+            max_rss_mb: Recycle worker jika RSS melewati batas ini (MB, optional)
+            timeout: Batas waktu per job dalam detik (optional)
+            start_method: Start method multiprocessing (optional, misalnya 'spawn')
+            executor: DIgSILENTExecutor untuk path PowerFactory (optional)
+        """
+        if sys_path is None:
+            if executor is None:
+                from digsilent_executor import DIgSILENTExecutor
+                executor = DIgSILENTExecutor()
+            sys_path = executor.pf_paths[:1]
+
+        self.size = size
+        self.project_name = project_name
+        self.study_case = study_case
+        self.module_name = module_name
+        self.sys_path = [os.path.abspath(path) for path in sys_path]
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self.timeout = timeout
+        self.recycled = 0
+        self.jobs_done = 0
+        self._context = multiprocessing.get_context(start_method)
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        for worker_id in range(size):
+            self._idle.put(self._start_worker(worker_id))
+        print(f"✓ Warm pool ready: {size} workers ({module_name})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _start_worker(self, worker_id):
+        """Start satu worker dan tunggu sampai API ter-import dan project aktif"""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.module_name, self.sys_path, self.project_name, self.study_case),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+
+        try:
+            message = parent_conn.recv()
+        except EOFError:
+            message = ('error', f"worker exited with code {process.exitcode}")
+        if message[0] != 'ready':
+            process.join(5)
+            raise ConnectionError(f"Worker {worker_id} failed to start: {message[1]}")
+        return _Worker(worker_id, process, parent_conn, message[1])
+
+    def _stop_worker(self, worker, force=False):
+        if not force:
+            try:
+                worker.conn.send(('stop',))
+            except (OSError, BrokenPipeError):
+                force = True
+        worker.process.join(None if not force else 0)
+        if worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join()
+        worker.conn.close()
+
+    def _recycle(self, worker, force=False):
+        """
+        Ganti worker dengan process baru di slot yang sama
+
+        Returns:
+            Worker baru, atau None jika process baru gagal start (pool
+            mengecil satu slot)
+        """
+        self._stop_worker(worker, force=force)
+        with self._lock:
+            self.recycled += 1
+        try:
+            return self._start_worker(worker.worker_id)
+        except (ConnectionError, OSError) as e:
+            with self._lock:
+                self.size -= 1
+                remaining = self.size
+            print(f"⚠ Worker {worker.worker_id} could not be restarted, pool shrinks to "
+                  f"{remaining} workers: {e}")
+            if remaining == 0:
+                self._idle.put(None)    # bangunkan job yang menunggu worker
+            return None
+
+    def _checkout(self):
+        worker = self._idle.get()
+        if worker is None:
+            self._idle.put(None)
+            raise RuntimeError("Worker pool has no live workers")
+        return worker
+
+    def _submit(self, message):
+        """Kirim job ke worker idle, return (success, value, stdout, timed_out)"""
+        if self._closed:
+            raise RuntimeError("Worker pool is closed")
+
+        worker = self._checkout()
+        answered = False
+        try:
+            try:
+                worker.conn.send(message)
+                if self.timeout is not None and not worker.conn.poll(self.timeout):
+                    return False, None, '', True
+                _, success, value, stdout, rss_mb = worker.conn.recv()
+            except (EOFError, OSError) as e:
+                return False, None, f"✗ Worker crashed: {e}\n", False
+            answered = True
+
+            worker.jobs += 1
+            worker.rss_mb = rss_mb
+            with self._lock:
+                self.jobs_done += 1
+
+            if worker.jobs >= self.max_jobs or (
+                    self.max_rss_mb is not None and rss_mb is not None and rss_mb > self.max_rss_mb):
+                worker = self._recycle(worker)
+            return success, value, stdout, False
+        finally:
+            # Hanya worker yang menjawab dan masih hidup yang kembali ke antrian;
+            # timeout, crash atau error di tengah protokol -> process baru
+            if worker is not None and not (answered and worker.process.is_alive()):
+                worker = self._recycle(worker, force=True)
+            if worker is not None:
+                self._idle.put(worker)
+
+    def run_script(self, script_path):
+        """
+        Jalankan skrip di worker yang hangat
+
+        Args:
+            script_path: Path skrip
+
+        Returns:
+            StructuredResult (payload result channel + stdout skrip)
+        """
+        if not os.path.exists(script_path):
+            print(f"✗ Script not found: {script_path}")
+            return StructuredResult(script_path, [])
+
+        success, payloads, stdout, timed_out = self._submit(('script', os.path.abspath(script_path)))
+        return StructuredResult(script_path, payloads or [], returncode=0 if success else 1,
+                                timed_out=timed_out, stdout=stdout)
+
+    def call(self, func, *args, **kwargs):
+        """
+        Panggil fungsi skrip func(app, ...) di worker (func dan return value
+        harus picklable, misalnya fungsi dari digsilent_functions yang
+        mengembalikan dict/list angka, bukan objek PowerFactory)
+
+        Returns:
+            Return value func, atau None jika gagal
+        """
+        success, value, stdout, timed_out = self._submit(('function', func, args, kwargs))
+        return value if success else None
+
+    def map_scripts(self, script_paths):
+        """
+        Jalankan banyak skrip di semua worker
+
+        Returns:
+            List StructuredResult dengan urutan sama seperti script_paths
+        """
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, self.size)) as pool:
+            results = list(pool.map(self.run_script, script_paths))
+        succeeded = sum(1 for result in results if result.success)
+        mark = "✓" if succeeded == len(results) else "✗"
+        print(f"{mark} {succeeded}/{len(results)} scripts succeeded in "
+              f"{time.perf_counter() - start_time:.2f} seconds ({self.size} warm workers)")
+        return results
+
+    def stats(self):
+        """Jumlah job, recycle dan info per worker idle"""
+        with self._lock:
+            workers = [{'worker_id': w.worker_id, 'pid': w.pid, 'jobs': w.jobs, 'rss_mb': w.rss_mb}
+                       for w in list(self._idle.queue) if w is not None]
+            return {'jobs': self.jobs_done, 'recycled': self.recycled, 'size': self.size,
+                    'workers': workers}
+
+    def close(self):
+        """Stop semua worker"""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in range(self.size):
+            worker = self._idle.get()
+            if worker is not None:
+                self._stop_worker(worker)
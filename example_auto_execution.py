@@ -87,7 +87,7 @@ def example_3_custom_script():
     custom_code = """
 def get_network_info():
     # Get PowerFactory application
-    app = pf.GetApplication()
+    app = globals().get("app") or pf.GetApplication()
     if app is None:
         print("Error: Cannot connect to PowerFactory")
         return False
@@ -107,37 +107,21 @@ def get_network_info():
     print("Network Elements:")
     print("="*60)
 
-    # Buses
-    terminals = app.GetCalcRelevantObjects("*.ElmTerm")
-    print(f"\\nBuses/Terminals: {len(terminals)}")
-    for i, term in enumerate(terminals[:5]):  # Show first 5
-        print(f"  {i+1}. {term.GetAttribute('loc_name')}")
-    if len(terminals) > 5:
-        print(f"  ... and {len(terminals) - 5} more")
-
-    # Lines
-    lines = app.GetCalcRelevantObjects("*.ElmLne")
-    print(f"\\nLines: {len(lines)}")
-    for i, line in enumerate(lines[:5]):  # Show first 5
-        print(f"  {i+1}. {line.GetAttribute('loc_name')}")
-    if len(lines) > 5:
-        print(f"  ... and {len(lines) - 5} more")
-
-    # Generators
-    generators = app.GetCalcRelevantObjects("*.ElmSym")
-    print(f"\\nGenerators: {len(generators)}")
-    for i, gen in enumerate(generators[:5]):  # Show first 5
-        print(f"  {i+1}. {gen.GetAttribute('loc_name')}")
-    if len(generators) > 5:
-        print(f"  ... and {len(generators) - 5} more")
-
-    # Loads
-    loads = app.GetCalcRelevantObjects("*.ElmLod")
-    print(f"\\nLoads: {len(loads)}")
-    for i, load in enumerate(loads[:5]):  # Show first 5
-        print(f"  {i+1}. {load.GetAttribute('loc_name')}")
-    if len(loads) > 5:
-        print(f"  ... and {len(loads) - 5} more")
+    # Nama elemen dari index session (satu fetch per class per session),
+    # atau satu scan per class jika skrip dijalankan tanpa session
+    index = globals().get("network_index")
+    for label, class_name in (("Buses/Terminals", "ElmTerm"), ("Lines", "ElmLne"),
+                              ("Generators", "ElmSym"), ("Loads", "ElmLod")):
+        if index is not None:
+            names = index.names(class_name)
+        else:
+            names = [obj.GetAttribute('loc_name')
+                     for obj in app.GetCalcRelevantObjects("*." + class_name)]
+        print(f"\\n{label}: {len(names)}")
+        for i, name in enumerate(names[:5]):  # Show first 5
+            print(f"  {i+1}. {name}")
+        if len(names) > 5:
+            print(f"  ... and {len(names) - 5} more")
 
     print("\\n" + "="*60)
     return True
@@ -152,11 +136,12 @@ if __name__ == "__main__":
 
     print(f"\n✓ Script generated: {script_path}")
 
-    # Step 2: Execute script
+    # Step 2: Execute script di session (skrip memakai app dan network_index session)
     executor = DIgSILENTExecutor()
-    print("\nExecuting script in PowerFactory...")
+    print("\nExecuting script in PowerFactory session...")
 
-    success = executor.execute_in_powerfactory(script_path)
+    with executor.session() as session:
+        success = session.execute(script_path)
 
     if success:
         print("\n✓ Custom script executed successfully!")
@@ -0,0 +1,258 @@
+"""
+Fake module powerfactory untuk benchmark dan testing tanpa PowerFactory
+
+Mensimulasikan subset API PowerFactory yang dipakai skrip di repo ini
+(GetApplication, GetActiveProject, GetFromStudyCase, GetCalcRelevantObjects,
+GetAttribute/SetAttribute, ComLdf/ComShc.Execute) dengan jaringan sintetis.
+Ukuran jaringan dan latency per panggilan bisa diatur lewat environment
+(berlaku juga untuk subprocess) atau configure():
+
+    FAKE_PF_BUSES              Jumlah bus (default 100)
+    FAKE_PF_ATTRIBUTE_LATENCY  Latency per GetAttribute/SetAttribute (detik)
+    FAKE_PF_EXECUTE_LATENCY    Latency per Execute() (detik)
+    FAKE_PF_SEED               Seed untuk noise hasil load flow
+
+Pemakaian:
+    PYTHONPATH=fake_powerfactory python generated_scripts/loadflow_xxx.py
+"""
+
+import os
+import random
+import time
+
+
+_config = {
+    'buses': int(os.environ.get('FAKE_PF_BUSES', 100)),
+    'attribute_latency': float(os.environ.get('FAKE_PF_ATTRIBUTE_LATENCY', 0)),
+    'execute_latency': float(os.environ.get('FAKE_PF_EXECUTE_LATENCY', 0)),
+    'seed': int(os.environ.get('FAKE_PF_SEED', 0)),
+}
+
+
+def _delay(seconds):
+    """Simulasi latency; busy-wait untuk nilai kecil karena sleep kurang presisi"""
+    if seconds <= 0:
+        return
+    if seconds >= 0.002:
+        time.sleep(seconds)
+        return
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class DataObject:
+    """Objek PowerFactory sintetis (elemen, study case, project)"""
+
+    def __init__(self, name, class_name, attributes=None):
+        self._class_name = class_name
+        self._attributes = {'loc_name': name}
+        self._attributes.update(attributes or {})
+
+    def GetAttribute(self, attribute):
+        _delay(_config['attribute_latency'])
+        try:
+            return self._attributes[attribute]
+        except KeyError:
+            raise AttributeError(f"{self._class_name} has no attribute '{attribute}'")
+
+    def SetAttribute(self, attribute, value):
+        _delay(_config['attribute_latency'])
+        self._attributes[attribute] = value
+        return 0
+
+    def GetClassName(self):
+        return self._class_name
+
+    def GetFullName(self):
+        return f"\\fake\\{self._attributes['loc_name']}.{self._class_name}"
+
+    def __getattr__(self, attribute):
+        # ldf.iopt_net = 0 style akses attribute
+        if attribute.startswith('_'):
+            raise AttributeError(attribute)
+        try:
+            return self._attributes[attribute]
+        except KeyError:
+            raise AttributeError(attribute)
+
+    def __repr__(self):
+        return f"<{self._attributes['loc_name']}.{self._class_name}>"
+
+
+class StudyCase(DataObject):
+    def __init__(self, app, name):
+        super().__init__(name, 'IntCase')
+        self._app = app
+
+    def Activate(self):
+        self._app._active_case = self
+        return 0
+
+
+class Project(DataObject):
+    def __init__(self, app, name):
+        super().__init__(name, 'IntPrj')
+        self._app = app
+
+    def GetContents(self, pattern='*'):
+        name = pattern.split('.')[0]
+        return [case for case in self._app._cases if name in ('*', case.loc_name)]
+
+
+class LoadFlowCommand(DataObject):
+    """ComLdf: hasil sintetis dari beban, pembangkitan dan elemen yang out of service"""
+
+    def __init__(self, app):
+        super().__init__('Load Flow Calculation', 'ComLdf', {'iopt_net': 0, 'iopt_noinit': 0})
+        self._app = app
+        self._random = random.Random(_config['seed'])
+
+    def Execute(self):
+        _delay(_config['execute_latency'])
+        objects = self._app._objects
+        load = sum(obj._attributes['plini'] * obj._attributes['scale0'] for obj in objects['ElmLod'])
+        generation = sum(obj._attributes['pgini'] for obj in objects['ElmSym']) or 1.0
+        stress = load / generation
+        outages = sum(obj._attributes['outserv'] for cls in ('ElmLne', 'ElmTr2')
+                      for obj in objects[cls])
+
+        terminals = objects['ElmTerm']
+        count = len(terminals) or 1
+        for i, term in enumerate(terminals):
+            attrs = term._attributes
+            drop = 0.06 * stress * (i / count) + 0.01 * outages
+            attrs['m:u'] = 1.02 - drop + self._random.uniform(-0.002, 0.002)
+            attrs['m:Ul'] = attrs['m:u'] * attrs['uknom']
+            attrs['m:phiu'] = -30.0 * stress * (i / count)
+
+        for cls in ('ElmLne', 'ElmTr2'):
+            for obj in objects[cls]:
+                attrs = obj._attributes
+                loading = 0.0 if attrs['outserv'] else 60.0 * stress * (1 + 0.1 * outages)
+                attrs['c:loading'] = loading
+                attrs['m:P:bus1'] = loading * 0.5
+                attrs['m:Q:bus1'] = loading * 0.1
+                attrs['m:I:bus1'] = loading * 0.005
+
+        for obj in objects['ElmSym']:
+            obj._attributes['m:P:bus1'] = obj._attributes['pgini']
+            obj._attributes['c:loading'] = 100.0 * stress * 0.7
+        for obj in objects['ElmLod']:
+            obj._attributes['m:P:bus1'] = obj._attributes['plini'] * obj._attributes['scale0']
+            obj._attributes['m:u1'] = terminals[0]._attributes['m:u'] if terminals else 1.0
+
+        self._attributes['c:iter'] = 2 if self._attributes.get('iopt_noinit') else 4
+        return 0
+
+
+class ShortCircuitCommand(DataObject):
+    """ComShc: arus hubung singkat sintetis di lokasi gangguan (shc_term)"""
+
+    def __init__(self, app):
+        super().__init__('Short-Circuit Calculation', 'ComShc',
+                         {'iopt_mde': 1, 'iopt_shc': '3psc', 'iopt_allbus': 0, 'shc_term': None})
+        self._app = app
+
+    def Execute(self):
+        _delay(_config['execute_latency'])
+        terminals = self._app._objects['ElmTerm']
+        targets = terminals if self._attributes.get('iopt_allbus') else [self._attributes.get('shc_term')]
+        count = len(terminals) or 1
+        for term in targets:
+            if term is None:
+                return 1
+            position = terminals.index(term) if term in terminals else 0
+            ikss = 25.0 - 15.0 * position / count
+            term._attributes['m:Ikss'] = ikss
+            term._attributes['m:ip'] = ikss * 2.55
+            term._attributes['m:Ith'] = ikss * 1.05
+        return 0
+
+
+class Application:
+    """Handle aplikasi PowerFactory sintetis"""
+
+    def __init__(self, buses):
+        self._project = Project(self, 'Fake Project')
+        self._cases = [StudyCase(self, name) for name in ('Study Case', 'Case 1', 'Case 2')]
+        self._active_case = self._cases[0]
+        self._objects = self._build_network(buses)
+        self._commands = {'ComLdf': LoadFlowCommand(self), 'ComShc': ShortCircuitCommand(self)}
+        self._by_name = {}
+        for class_name, objects in self._objects.items():
+            for obj in objects:
+                self._by_name[(obj._attributes['loc_name'], class_name)] = obj
+
+    @staticmethod
+    def _build_network(buses):
+        buses = max(2, buses)
+        return {
+            'ElmTerm': [DataObject(f'Bus {i}', 'ElmTerm', {
+                'm:u': 1.0, 'm:Ul': 20.0, 'm:phiu': 0.0, 'uknom': 20.0, 'iUsage': i % 3,
+                'outserv': 0,
+            }) for i in range(buses)],
+            'ElmLne': [DataObject(f'Line {i}', 'ElmLne', {
+                'outserv': 0, 'c:loading': 0.0, 'm:P:bus1': 0.0, 'm:Q:bus1': 0.0, 'm:I:bus1': 0.0,
+            }) for i in range(buses - 1)],
+            'ElmTr2': [DataObject(f'Trafo {i}', 'ElmTr2', {
+                'outserv': 0, 'c:loading': 0.0, 'm:P:bus1': 0.0, 'm:Q:bus1': 0.0, 'm:I:bus1': 0.0,
+            }) for i in range(max(1, buses // 10))],
+            'ElmSym': [DataObject(f'Gen {i}', 'ElmSym', {
+                'outserv': 0, 'pgini': 100.0, 'm:P:bus1': 0.0, 'm:Q:bus1': 0.0, 'c:loading': 0.0,
+            }) for i in range(max(1, buses // 20))],
+            'ElmLod': [DataObject(f'Load {i}', 'ElmLod', {
+                'outserv': 0, 'plini': 10.0, 'scale0': 1.0, 'm:P:bus1': 0.0, 'm:Q:bus1': 0.0,
+                'm:u1': 1.0,
+            }) for i in range(max(1, buses // 2))],
+        }
+
+    def GetActiveProject(self):
+        return self._project
+
+    def ActivateProject(self, name):
+        return 0
+
+    def GetActiveStudyCase(self):
+        return self._active_case
+
+    def GetFromStudyCase(self, name):
+        return self._commands.get(name.split('.')[0])
+
+    def GetCalcRelevantObjects(self, pattern='*'):
+        name, _, class_name = pattern.rpartition('.')
+        if not class_name or class_name == '*':
+            return [obj for objects in self._objects.values() for obj in objects]
+        if name in ('', '*'):
+            return list(self._objects.get(class_name, []))
+        obj = self._by_name.get((name, class_name))
+        return [obj] if obj is not None else []
+
+    def GetVersion(self):
+        return 'fake'
+
+
+_app = None
+
+
+def configure(buses=None, attribute_latency=None, execute_latency=None, seed=None):
+    """
+    Atur ukuran jaringan dan latency (in-process), jaringan dibuat ulang
+
+    Returns:
+        Handle aplikasi baru
+    """
+    global _app
+    for key, value in (('buses', buses), ('attribute_latency', attribute_latency),
+                       ('execute_latency', execute_latency), ('seed', seed)):
+        if value is not None:
+            _config[key] = value
+    _app = Application(_config['buses'])
+    return _app
+
+
+def GetApplication():
+    global _app
+    if _app is None:
+        _app = Application(_config['buses'])
+    return _app
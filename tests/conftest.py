@@ -0,0 +1,50 @@
+"""
+Fixture bersama: fake PowerFactory (fake_powerfactory/) dan cache terisolasi
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FAKE_PF_DIR = os.path.join(ROOT, 'fake_powerfactory')
+
+# Cache code object/discovery tidak ditulis ke ~/.cache (default_code_cache dibuat saat import)
+os.environ['LOCALAPPDATA'] = tempfile.mkdtemp(prefix='digsilent_test_cache_')
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def fake_pf():
+    """Fake module powerfactory yang sengaja TIDAK ada di sys.path (hanya lewat pf_module)"""
+    spec = importlib.util.spec_from_file_location('fake_pf_module',
+                                                  os.path.join(FAKE_PF_DIR, 'powerfactory.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.configure(buses=20, attribute_latency=0, execute_latency=0)
+    return module
+
+
+@pytest.fixture
+def fake_pf_env(monkeypatch):
+    """PYTHONPATH untuk subprocess supaya 'import powerfactory' memakai fake module"""
+    pythonpath = os.environ.get('PYTHONPATH')
+    monkeypatch.setenv('PYTHONPATH', FAKE_PF_DIR + (os.pathsep + pythonpath if pythonpath else ''))
+    monkeypatch.setenv('FAKE_PF_BUSES', '20')
+    return FAKE_PF_DIR
+
+
+@pytest.fixture
+def generator(tmp_path):
+    from digsilent_script_generator import DIgSILENTScriptGenerator
+    return DIgSILENTScriptGenerator(str(tmp_path / 'scripts'))
+
+
+@pytest.fixture
+def executor():
+    from digsilent_executor import DIgSILENTExecutor
+    return DIgSILENTExecutor()
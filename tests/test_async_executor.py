@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from digsilent_async_executor import AsyncDIgSILENTExecutor
+
+
+@pytest.fixture
+def sleep_scripts(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f'job_{i}.py'
+        path.write_text(f"import time\ntime.sleep({0.05 * (i + 1)})\nprint('job {i}')\n")
+        paths.append(str(path))
+    return paths
+
+
+def run(coro, timeout=30):
+    return asyncio.run(asyncio.wait_for(coro, timeout))
+
+
+def test_executor_reused_across_event_loops(executor, sleep_scripts):
+    async_executor = AsyncDIgSILENTExecutor(executor, max_concurrency=2)
+
+    first = run(async_executor.execute_many(sleep_scripts))
+    second = run(async_executor.execute_many(sleep_scripts))
+
+    assert [result.success for result in first] == [True] * 4
+    assert [result.success for result in second] == [True] * 4
+    assert second[2].stdout.strip() == 'job 2'
+
+
+def test_as_completed_yields_all_results(executor, sleep_scripts):
+    async_executor = AsyncDIgSILENTExecutor(executor, max_concurrency=2)
+
+    async def collect():
+        async with async_executor.as_completed(sleep_scripts) as jobs:
+            return [await next_done for next_done in jobs]
+
+    results = run(collect())
+    assert sorted(result.index for result in results) == [0, 1, 2, 3]
+
+
+def test_as_completed_early_break_does_not_hang(executor, sleep_scripts):
+    async_executor = AsyncDIgSILENTExecutor(executor, max_concurrency=1)
+
+    async def first_only():
+        async with async_executor.as_completed(sleep_scripts) as jobs:
+            for next_done in jobs:
+                result = await next_done
+                break
+        assert all(task.done() for task in jobs.tasks)
+        return result
+
+    # Break saat job berikutnya sedang start subprocess, berulang di loop baru
+    for _ in range(5):
+        assert run(first_only()).success
+    assert run(async_executor.execute_many(sleep_scripts[:2]))[1].success
@@ -0,0 +1,27 @@
+import json
+
+from digsilent_executor import PowerFactorySession
+
+
+def test_batch_results_from_current_run(fake_pf, generator, executor, tmp_path):
+    result_path = str(tmp_path / 'batch.json')
+    with PowerFactorySession(pf_module=fake_pf) as session:
+        results = executor.execute_batch_load_flow(["Case 1", "Case 2"], generator=generator,
+                                                   session=session, result_path=result_path)
+
+    assert [row['study_case'] for row in results] == ["Case 1", "Case 2"]
+    assert all(row['status'] == 'ok' for row in results)
+
+
+def test_failed_run_does_not_return_stale_results(generator, executor, tmp_path, monkeypatch):
+    result_path = tmp_path / 'batch.json'
+    result_path.write_text(json.dumps([{'study_case': 'old', 'status': 'ok', 'error_code': 0,
+                                        'elapsed': 0.0}]))
+    # Tanpa powerfactory di PYTHONPATH, skrip gagal di subprocess
+    monkeypatch.delenv('PYTHONPATH', raising=False)
+
+    results = executor.execute_batch_load_flow(["Case 1"], generator=generator, method='subprocess',
+                                               result_path=str(result_path))
+
+    assert results is None
+    assert not result_path.exists()
@@ -0,0 +1,29 @@
+import json
+
+from benchmark_executor import DEFAULT_BASELINE, compare_to_baseline
+
+
+def report(**medians):
+    return {
+        'config': {'buses': 100, 'iterations': 20},
+        'results': {name: {'name': name, 'median': value, 'mean': value} for name, value in medians.items()},
+    }
+
+
+def test_compare_flags_only_slowdowns_over_threshold():
+    baseline = report(fast=1.0, steady=1.0, slow=1.0)
+    current = report(fast=0.5, steady=1.2, slow=1.6)
+
+    regressions = compare_to_baseline(current, baseline, threshold=0.5)
+
+    assert [r['name'] for r in regressions] == ['slow']
+    assert regressions[0]['ratio'] == 1.6
+    assert compare_to_baseline(current, baseline, threshold=0.1)[-1]['name'] == 'steady'
+
+
+def test_committed_baseline_covers_the_benchmarks():
+    with open(DEFAULT_BASELINE) as f:
+        baseline = json.load(f)
+
+    assert {'compile_cached', 'execute_session', 'subprocess_spawn', 'bulk_read_attributes'} <= set(baseline['results'])
+    assert compare_to_baseline(baseline, baseline) == []
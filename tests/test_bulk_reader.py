@@ -0,0 +1,46 @@
+import pytest
+
+from digsilent_bulk_reader import read_attributes
+
+
+class Element:
+    """Objek minimal dengan GetAttribute yang menghitung pemanggilan"""
+
+    calls = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def GetAttribute(self, attribute):
+        Element.calls += 1
+        if self.value is KeyError:
+            raise AttributeError(attribute)
+        return self.value
+
+
+@pytest.mark.parametrize('use_numpy', [False, True])
+def test_failing_object_only_masks_its_own_row(use_numpy):
+    if use_numpy:
+        pytest.importorskip('numpy')
+    objects = [Element(None), Element(1), Element(KeyError), Element(2.5), Element(3)]
+    Element.calls = 0
+
+    cols = read_attributes(objects, ['x'], use_numpy=use_numpy, verbose=False)
+
+    # Satu GetAttribute per objek, objek yang gagal tidak membuat kolom dibaca ulang
+    assert Element.calls == len(objects)
+    assert list(cols.masks['x']) == [True, False, True, False, False]
+    values = list(cols['x'])
+    assert values[1] == 1 and values[3] == 2.5 and values[4] == 3
+    assert values[0] != values[0] and values[2] != values[2]     # NaN
+    assert cols.missing('x') == 2
+
+
+def test_column_types_promote_in_place():
+    ints = read_attributes([Element(1), Element(2)], ['x'], use_numpy=False, verbose=False)
+    assert ints['x'].typecode == 'q'
+
+    mixed = read_attributes([Element(1), Element('a'), Element(KeyError)], ['x'],
+                            use_numpy=False, verbose=False)
+    assert mixed['x'] == [1, 'a', None]
+    assert mixed.masks['x'] == [False, False, True]
@@ -0,0 +1,82 @@
+import os
+import sys
+import traceback
+
+from digsilent_code_cache import CompiledScriptCache
+
+SOURCE = '''
+def fail():
+    raise RuntimeError("boom")
+
+fail()
+'''
+
+
+def disk_files(cache_dir):
+    return [os.path.join(root, name) for root, _, names in os.walk(cache_dir) for name in names]
+
+
+def test_cached_code_uses_current_filename(tmp_path):
+    cache = CompiledScriptCache(cache_dir=str(tmp_path / 'cache'))
+    first = cache.compile(SOURCE, 'first.py')
+    second = cache.compile(SOURCE, 'second.py')
+
+    assert cache.hits == 1
+    assert first.co_filename == 'first.py'
+    assert second.co_filename == 'second.py'
+
+    try:
+        exec(second, {})
+    except RuntimeError:
+        frames = traceback.extract_tb(sys.exc_info()[2])
+    # Frame fungsi di dalam skrip juga menunjuk file kedua
+    assert [frame.filename for frame in frames[1:]] == ['second.py', 'second.py']
+
+
+def test_disk_hit_uses_current_filename(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    CompiledScriptCache(cache_dir=cache_dir).compile(SOURCE, 'old.py')
+
+    cache = CompiledScriptCache(cache_dir=cache_dir)
+    code = cache.compile(SOURCE, 'new.py')
+
+    assert cache.disk_hits == 1
+    assert code.co_filename == 'new.py'
+
+
+def test_timestamped_scripts_skip_disk(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    cache = CompiledScriptCache(cache_dir=cache_dir)
+
+    cache.compile('"""\nGenerated at: 2025-01-01 12:00:00\n"""\nx = 1\n', 'a.py')
+    assert disk_files(cache_dir) == []
+
+    cache.compile('x = 1\n', 'b.py')
+    assert len(disk_files(cache_dir)) == 1
+
+
+def test_disk_cache_is_bounded(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    cache = CompiledScriptCache(cache_dir=cache_dir, max_disk_bytes=None, prune_every=1000)
+    for i in range(20):
+        cache.compile(f'x = {i}\n', f'{i}.py')
+    assert len(disk_files(cache_dir)) == 20
+
+    size = max(os.path.getsize(path) for path in disk_files(cache_dir))
+    cache.max_disk_bytes = size * 5
+    assert cache.prune_disk() == 15
+    assert len(disk_files(cache_dir)) == 5
+
+
+def test_compile_file_decodes_like_the_interpreter(tmp_path):
+    # Encoding dari skrip (UTF-8 default atau coding cookie), bukan dari locale
+    utf8 = tmp_path / 'utf8.py'
+    utf8.write_bytes('MARK = "✓ ✗"\n'.encode('utf-8'))
+    latin = tmp_path / 'latin.py'
+    latin.write_bytes('# -*- coding: latin-1 -*-\nMARK = "é"\n'.encode('latin-1'))
+
+    cache = CompiledScriptCache(use_disk=False)
+    for path, expected in ((utf8, "✓ ✗"), (latin, "é")):
+        namespace = {}
+        exec(cache.compile_file(str(path)), namespace)
+        assert namespace['MARK'] == expected
@@ -0,0 +1,50 @@
+import pytest
+
+from digsilent_contingency import ContingencyAnalysis
+from digsilent_executor import PowerFactorySession
+from digsilent_script_generator import DIgSILENTScriptGenerator
+
+
+@pytest.fixture
+def analysis_factory(fake_pf_env, executor, tmp_path):
+    def build(**kwargs):
+        generator = DIgSILENTScriptGenerator(str(tmp_path / 'n1'), deterministic=True)
+        return ContingencyAnalysis(executor, generator, max_workers=2, v_min=0.0, v_max=10.0,
+                                   timeout=60, **kwargs)
+    return build
+
+
+def test_sharded_ranking_covers_every_outage(fake_pf, analysis_factory):
+    analysis = analysis_factory(shard_size=5, max_loading=62.0)
+    with PowerFactorySession(pf_module=fake_pf) as session:
+        outages = analysis.enumerate_outages(session)
+    assert len(outages) == 21
+
+    table, shards = analysis.run(outages + ['Missing.ElmLne'])
+
+    assert [row['rank'] for row in table] == list(range(1, 23))
+    assert sorted(row['outage'] for row in table) == sorted(outages + ['Missing.ElmLne'])
+    assert len(shards) == 5
+    assert sum(shard['completed'] for shard in shards) == 21
+    assert all(shard['success'] for shard in shards)
+
+    # Outage yang tidak ada di model tidak dijalankan dan di-rank paling bawah
+    assert table[-1]['outage'] == 'Missing.ElmLne'
+    assert table[-1]['status'] == 'not_run'
+    # Satu outage menaikkan loading cabang lain ke 66% (batas 62%)
+    for row in table[:-1]:
+        assert row['status'] == 'violations'
+        assert row['severity'] == pytest.approx(4.0)
+        assert row['worst'][0] == 'loading'
+        assert row['worst'][2] == pytest.approx(66.0)
+
+
+def test_base_case_violations_are_filtered(analysis_factory):
+    outages = ['Line 3.ElmLne', 'Trafo 0.ElmTr2']
+
+    table, _ = analysis_factory(shard_size=1, max_loading=59.0).run(outages)
+    assert [row['status'] for row in table] == ['ok', 'ok']
+
+    table, _ = analysis_factory(shard_size=1, max_loading=59.0, ignore_base_violations=False).run(outages)
+    assert [row['status'] for row in table] == ['violations', 'violations']
+    assert table[0]['severity'] == pytest.approx(7.0)
@@ -0,0 +1,42 @@
+import os
+
+from digsilent_executor import PowerFactorySession
+from digsilent_results import compact_delta_log, load_delta_state, read_delta_log
+
+ELEMENTS = {"ElmLne": ["loc_name", "c:loading", "m:P:bus1"]}
+
+
+def test_delta_export_logs_only_changes_and_compacts(fake_pf, generator, executor, tmp_path):
+    export_dir = str(tmp_path / 'delta')
+    script_path = generator.generate_delta_export_script(export_dir, ELEMENTS)
+
+    with PowerFactorySession(pf_module=fake_pf) as session:
+        def export():
+            result = executor.execute_with_results(script_path, method='powerfactory', session=session)
+            assert result.success
+            return result.events('delta_export')[0]
+
+        lines = session.app.GetCalcRelevantObjects("*.ElmLne")
+        first = export()
+        assert first['run'] == 1
+        assert first['changed'] == first['total'] == len(lines)
+
+        # Tanpa perubahan hasil: tidak ada baris baru di log
+        assert export()['changed'] == 0
+        assert len(read_delta_log(export_dir)) == len(lines)
+
+        # Load flow mengubah loading semua line yang in service
+        lines[0].SetAttribute("outserv", 1)
+        assert session.app.GetFromStudyCase("ComLdf").Execute() == 0
+        third = export()
+        assert third['run'] == 3
+        assert third['changed'] == len(lines) - 1
+
+    state = load_delta_state(export_dir)
+    assert state[('ElmLne', lines[1].GetAttribute("loc_name"))]['run'] == 3
+    assert state[('ElmLne', lines[0].GetAttribute("loc_name"))]['values']['c:loading'] == 0.0
+
+    assert compact_delta_log(export_dir) == len(lines)
+    assert read_delta_log(export_dir) == []
+    assert os.path.getsize(os.path.join(export_dir, 'delta_log.jsonl')) == 0
+    assert load_delta_state(export_dir) == state
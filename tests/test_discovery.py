@@ -0,0 +1,35 @@
+import digsilent_discovery
+from digsilent_discovery import discover_installations
+
+
+def test_cache_reused_until_install_tree_changes(tmp_path, monkeypatch):
+    root = tmp_path / 'DIgSILENT'
+    (root / 'PowerFactory 2022 SP2' / 'Python' / '3.11').mkdir(parents=True)
+    cache_path = str(tmp_path / 'cache' / 'installations.json')
+
+    scans = []
+    scan = digsilent_discovery.scan_installations
+    monkeypatch.setattr(digsilent_discovery, 'scan_installations',
+                        lambda roots=None: scans.append(roots) or scan(roots))
+
+    first = discover_installations([str(root)], cache_path=cache_path, python_version=(3, 11))
+    assert [inst['python_version'] for inst in first] == [[3, 11]]
+    assert len(scans) == 1
+
+    # Cache in-memory dan di disk dipakai tanpa scan ulang
+    assert discover_installations([str(root)], cache_path=cache_path, python_version=(3, 11)) == first
+    monkeypatch.setattr(digsilent_discovery, '_memory_cache', {})
+    assert discover_installations([str(root)], cache_path=cache_path, python_version=(3, 11)) == first
+    assert len(scans) == 1
+
+    # Versi Python baru mengubah mtime folder Python -> cache di-invalidasi
+    (root / 'PowerFactory 2022 SP2' / 'Python' / '3.12').mkdir()
+    updated = discover_installations([str(root)], cache_path=cache_path, python_version=(3, 12))
+    assert len(scans) == 2
+    assert [inst['python_version'] for inst in updated] == [[3, 12], [3, 11]]
+
+    # Instalasi baru di root juga terdeteksi
+    (root / 'PowerFactory 2024' / 'Python' / '3.11').mkdir(parents=True)
+    latest = discover_installations([str(root)], cache_path=cache_path, python_version=(3, 11))
+    assert len(scans) == 3
+    assert [(inst['version'], inst['service_pack']) for inst in latest][:2] == [(2024, 0), (2022, 2)]
@@ -0,0 +1,33 @@
+import os
+
+from digsilent_executor import PowerFactorySession
+from digsilent_functions import run_batch_load_flow
+
+
+def python_files(directory):
+    return [os.path.join(root, name) for root, _, names in os.walk(directory)
+            for name in names if name.endswith('.py')]
+
+
+def test_execute_function_writes_only_the_audit_script(fake_pf, fake_pf_env, generator, executor):
+    with PowerFactorySession(pf_module=fake_pf) as session:
+        rows = executor.execute_function(run_batch_load_flow, ['Case 1', 'Missing'], session=session)
+        assert python_files(generator.output_dir) == []
+
+        audited = executor.execute_function(run_batch_load_flow, ['Case 1', 'Missing'], session=session,
+                                            audit_generator=generator)
+
+    assert [row['status'] for row in rows] == ['ok', 'not_found']
+    assert [row['status'] for row in audited] == ['ok', 'not_found']
+
+    scripts = python_files(generator.output_dir)
+    assert len(scripts) == 1
+    with open(scripts[0]) as f:
+        source = f.read()
+    assert "run_batch_load_flow(app, ['Case 1', 'Missing'])" in source
+
+    # Skrip audit bisa dijalankan ulang mandiri (subprocess, fake module)
+    result = executor.execute_with_results(scripts[0])
+    assert result.returncode == 0
+    assert "'status': 'ok'" in result.stdout
+    assert "'status': 'not_found'" in result.stdout
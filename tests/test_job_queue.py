@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from digsilent_job_queue import DeduplicatingJobQueue
+
+
+def test_fingerprint_is_required(executor):
+    with pytest.raises(ValueError):
+        DeduplicatingJobQueue(executor)
+
+
+def test_fingerprint_change_forces_reexecution(fake_pf_env, generator, executor):
+    model = {'version': 1}
+    script = generator.generate_load_flow_script()
+
+    with DeduplicatingJobQueue(executor, fingerprint=lambda: model['version']) as queue:
+        assert queue.run(script).success
+        assert queue.run(script).success
+        assert queue.stats()['executed'] == 1 and queue.stats()['hits'] == 1
+
+        model['version'] = 2
+        assert queue.run(script).success
+        assert queue.stats()['executed'] == 2
+
+
+def test_concurrent_submissions_merge_into_one_run(fake_pf_env, generator, executor, monkeypatch):
+    monkeypatch.setenv('FAKE_PF_EXECUTE_LATENCY', '0.5')
+    # Skrip identik kecuali header timestamp -> key job sama
+    scripts = [generator.generate_load_flow_script() for _ in range(4)]
+
+    with DeduplicatingJobQueue(executor, fingerprint='model-v1') as queue:
+        futures = [queue.submit(script) for script in scripts]
+        results = [future.result() for future in futures]
+
+        assert len({id(future) for future in futures}) == 1
+        assert all(result.success for result in results)
+        stats = queue.stats()
+        assert stats['executed'] == 1
+        assert stats['merged'] == 3
+        assert stats['in_flight'] == 0
+
+
+def test_lru_and_age_eviction(fake_pf_env, generator, executor, monkeypatch):
+    import digsilent_job_queue
+
+    first = generator.generate_load_flow_script(study_case='Case 1')
+    second = generator.generate_load_flow_script(study_case='Case 2')
+
+    with DeduplicatingJobQueue(executor, fingerprint='model-v1', max_entries=1, max_age=60) as queue:
+        queue.run(first)
+        queue.run(second)
+        assert queue.stats()['evictions'] == 1
+        assert queue.stats()['entries'] == 1
+
+        queue.run(second)
+        assert queue.stats()['hits'] == 1
+        queue.run(first)
+        assert queue.stats()['executed'] == 3
+
+        # Entry yang lebih tua dari max_age dijalankan ulang
+        now = time.time()
+        monkeypatch.setattr(digsilent_job_queue.time, 'time', lambda: now + 120)
+        queue.run(first)
+        stats = queue.stats()
+        assert stats['executed'] == 4
+        assert stats['evictions'] == 3
@@ -0,0 +1,19 @@
+from digsilent_functions import run_load_flow_chain
+
+STEPS = [[["Load 0.ElmLod", "scale0", 0.9 + 0.05 * i]] for i in range(3)]
+
+
+def test_cold_steps_are_cold_even_if_study_case_is_warm(fake_pf):
+    app = fake_pf.GetApplication()
+    ldf = app.GetFromStudyCase("ComLdf")
+    ldf.SetAttribute("iopt_noinit", 1)
+
+    cold = run_load_flow_chain(app, STEPS, warm_start=False)
+    warm = run_load_flow_chain(app, STEPS, warm_start=True)
+
+    # Fake ComLdf: 4 iterasi dengan inisialisasi, 2 tanpa
+    assert [row['iterations'] for row in cold] == [4, 4, 4]
+    assert [row['iterations'] for row in warm] == [4, 2, 2]
+    assert [row['warm'] for row in warm] == [False, True, True]
+    assert ldf.GetAttribute("iopt_noinit") == 1
+    assert app.GetCalcRelevantObjects("Load 0.ElmLod")[0].GetAttribute("scale0") == 1.0
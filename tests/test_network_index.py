@@ -0,0 +1,50 @@
+from digsilent_executor import PowerFactorySession
+from digsilent_functions import run_contingencies
+from digsilent_sweep import ParameterSweep
+
+
+def test_sweep_outage_invalidates_session_index(fake_pf):
+    with PowerFactorySession(pf_module=fake_pf) as session:
+        index = session.network_index()
+        index.objects("ElmLne")
+        generation = index.generation
+
+        ParameterSweep(session, {("Line 2.ElmLne", "outserv"): [1]},
+                       outputs=[("Line 0.ElmLne", "c:loading")]).run()
+
+        assert index.generation > generation
+        assert index.stats()['classes'] == 0
+
+
+def test_contingencies_through_index_match_plain_run(fake_pf):
+    outages = ["Line 1.ElmLne", "Trafo 0.ElmTr2", "Missing.ElmLne"]
+    with PowerFactorySession(pf_module=fake_pf) as session:
+        plain = session.call(run_contingencies, outages)
+        index = session.network_index()
+        indexed = session.call(run_contingencies, outages, index=index)
+
+        assert index.generation == 4    # set + restore per outage
+        line = index.lookup("Line 1.ElmLne")
+        assert line.GetAttribute("outserv") == 0
+
+    # m:u fake module berisi noise acak, bandingkan loading dan pelanggaran saja
+    def summary(rows):
+        return [(row['outage'], row['error_code'], row['max_loading'], row['violations'])
+                for row in rows]
+
+    assert summary(indexed) == summary(plain)
+    assert [row['outage'] for row in indexed] == outages[:2]
+
+
+def test_export_script_reads_names_from_session_index(fake_pf, generator, tmp_path):
+    script_path = generator.generate_export_results_script(export_path=str(tmp_path / 'out.csv'))
+
+    with PowerFactorySession(pf_module=fake_pf) as session:
+        assert session.execute(script_path)
+        assert session.execute(script_path)
+        assert session.network_index().fetches == 1
+
+    with open(tmp_path / 'out.csv') as f:
+        rows = f.read().splitlines()
+    assert rows[1].startswith('Bus 0,')
+    assert len(rows) == 21
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from digsilent_result_channel import ResultChannel
+
+
+def test_subprocess_payloads_arrive_through_inherited_pipe(fake_pf_env, generator, executor):
+    script_path = generator.generate_load_flow_script(emit_voltages=True)
+
+    result = executor.execute_with_results(script_path, method='subprocess', timeout=60)
+
+    assert result.success
+    load_flow = result.events('load_flow')[0]
+    assert load_flow['error_code'] == 0
+    assert load_flow['iterations'] == 4
+    assert len(load_flow['bus_names']) == len(load_flow['bus_voltages']) == 20
+    # Payload tidak lewat stdout
+    assert '"event"' not in result.stdout
+    assert 'bus_voltages' not in result.stdout
+
+
+def test_script_without_channel_runs_standalone(fake_pf_env, generator):
+    script_path = generator.generate_load_flow_script(emit_voltages=True)
+
+    result = subprocess.run([sys.executable, script_path], capture_output=True, text=True, timeout=60)
+
+    assert result.returncode == 0
+    assert 'Load Flow calculation successful' in result.stdout
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="DIGSILENT_RESULT_FD hanya di POSIX")
+def test_channel_keeps_malformed_lines_separate(tmp_path):
+    script = tmp_path / 'writer.py'
+    script.write_text(
+        "import os\n"
+        "fd = int(os.environ['DIGSILENT_RESULT_FD'])\n"
+        "os.write(fd, b'{\"event\": \"script\", \"status\": \"ok\"}\\nnot json\\n')\n"
+        "print('{\"event\": \"fake\"}')\n"
+    )
+
+    with ResultChannel() as channel:
+        subprocess.run([sys.executable, str(script)], env=channel.child_env(), capture_output=True,
+                       timeout=60, **channel.popen_kwargs())
+
+    assert channel.payloads == [{'event': 'script', 'status': 'ok'}]
+    assert channel.errors == [b'not json']
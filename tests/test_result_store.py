@@ -0,0 +1,45 @@
+import csv
+
+from digsilent_executor import PowerFactorySession
+from digsilent_result_store import ResultStore
+
+
+def read_csv(path):
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_import_csv_and_history(fake_pf, generator, executor, tmp_path):
+    csv_path = str(tmp_path / 'results.csv')
+    export_script = generator.generate_export_results_script(csv_path)
+    load_flow_script = generator.generate_load_flow_script(emit_voltages=True)
+    store = ResultStore(str(tmp_path / 'results.db'))
+
+    with PowerFactorySession(pf_module=fake_pf) as session:
+        run_ids = []
+        exported = []
+        for study_case in ('Case 1', 'Case 2', 'Case 1'):
+            assert session.execute(load_flow_script)
+            assert session.execute(export_script)
+            exported.append(read_csv(csv_path))
+            run_ids.append(store.import_csv(csv_path, study_case=study_case))
+
+        result = executor.execute_with_results(load_flow_script, method='powerfactory', session=session)
+        voltage_run = store.import_result(result, study_case='Case 2', label='structured')
+
+    bus = exported[0][0]['Name']
+    history = store.history(f"{bus}.ElmTerm", 'm:u')
+    assert [row[0] for row in history] == [voltage_run] + run_ids[::-1]
+    assert [row[2] for row in history[1:]] == [float(rows[0]['Voltage (kV)']) for rows in exported[::-1]]
+    assert history[0][2] == result.events('load_flow')[0]['bus_voltages'][0]
+
+    assert [row[0] for row in store.history(bus, 'm:u', class_name='ElmTerm', study_case='Case 1')] == \
+        [run_ids[2], run_ids[0]]
+    assert len(store.history(f"{bus}.ElmTerm", 'm:u', last=2)) == 2
+    assert store.history(f"{bus}.ElmTerm", 'missing') == []
+    assert store.history("Missing.ElmTerm", 'm:u') == []
+
+    values = store.run_values(run_ids[0], attribute='iUsage')
+    assert len(values) == len(exported[0])
+    assert [run['label'] for run in store.runs(study_case='Case 2')] == ['structured', None]
+    store.close()
@@ -0,0 +1,47 @@
+import pytest
+
+from digsilent_results import load_columnar_results
+
+np = pytest.importorskip('numpy')
+
+
+def test_npz_mmap_reads_columns_without_loading(tmp_path):
+    path = str(tmp_path / 'results.npz')
+    np.savez(path, **{
+        'ElmTerm.m:u': np.linspace(0.95, 1.05, 11),
+        'ElmTerm.loc_name': np.array([f'Bus {i}' for i in range(11)]),
+        'ElmLne.c:loading': np.zeros(0),
+    })
+
+    tables = load_columnar_results(path, mmap=True)
+
+    assert isinstance(tables['ElmTerm']['m:u'], np.memmap)
+    assert tables['ElmTerm']['m:u'][10] == pytest.approx(1.05)
+    assert tables['ElmTerm']['loc_name'][3] == 'Bus 3'
+    assert tables['ElmLne']['c:loading'].shape == (0,)
+
+    eager = load_columnar_results(path, mmap=False)
+    assert np.array_equal(eager['ElmTerm']['m:u'], tables['ElmTerm']['m:u'])
+
+
+def test_npz_mmap_falls_back_for_compressed_members(tmp_path):
+    path = str(tmp_path / 'results.npz')
+    np.savez_compressed(path, **{'ElmTerm.m:u': np.arange(4.0)})
+
+    tables = load_columnar_results(path, mmap=True)
+
+    assert list(tables['ElmTerm']['m:u']) == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_arrow_mmap_and_plain_read(tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    export_dir = tmp_path / 'arrow'
+    export_dir.mkdir()
+    table = pa.table({'loc_name': ['a', 'b'], 'm:u': [1.0, 0.98]})
+    with pa.OSFile(str(export_dir / 'ElmTerm.arrow'), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    for mmap in (True, False):
+        tables = load_columnar_results(str(export_dir), mmap=mmap)
+        assert list(tables['ElmTerm']['m:u']) == [1.0, 0.98]
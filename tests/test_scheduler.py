@@ -0,0 +1,49 @@
+from digsilent_scheduler import ParallelScriptScheduler
+
+
+def write_script(tmp_path, name, body):
+    path = tmp_path / name
+    path.write_text(body)
+    return str(path)
+
+
+def test_structured_run_keeps_input_order(fake_pf_env, generator, executor):
+    scripts = [generator.generate_load_flow_script(emit_voltages=True) for _ in range(4)]
+    scheduler = ParallelScriptScheduler(executor=executor, max_workers=2, structured=True,
+                                        worker_env=lambda worker_id: {'PYTHONPATH': fake_pf_env})
+
+    results = scheduler.run(scripts)
+
+    assert [job.script_path for job in results] == scripts
+    assert all(job.success and job.attempts == 1 for job in results)
+    assert {job.worker_id for job in results} <= {0, 1}
+    assert all(job.events('load_flow')[0]['error_code'] == 0 for job in results)
+    assert len(results[0].events('load_flow')[0]['bus_voltages']) == 20
+
+
+def test_retry_after_failure(tmp_path, executor):
+    marker = tmp_path / 'attempted'
+    script = write_script(tmp_path, 'flaky.py', f"""
+import os, sys
+if not os.path.exists({str(marker)!r}):
+    open({str(marker)!r}, 'w').close()
+    sys.exit(1)
+print('worker', os.environ['DIGSILENT_WORKER_ID'])
+""")
+    scheduler = ParallelScriptScheduler(executor=executor, max_workers=1, retries=1)
+
+    job = scheduler.run([script])[0]
+
+    assert job.success and job.attempts == 2
+    assert job.stdout.strip() == 'worker 0'
+
+
+def test_timeout_and_missing_script(tmp_path, executor):
+    script = write_script(tmp_path, 'slow.py', "import time\ntime.sleep(30)\n")
+    scheduler = ParallelScriptScheduler(executor=executor, max_workers=2, timeout=0.5, retries=1)
+
+    slow, missing = scheduler.run([script, str(tmp_path / 'missing.py')])
+
+    assert slow.timed_out and not slow.success and slow.attempts == 2
+    assert not missing.success and missing.attempts == 0
+    assert 'Script not found' in missing.stderr
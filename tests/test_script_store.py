@@ -0,0 +1,58 @@
+import json
+import os
+
+from digsilent_script_generator import DIgSILENTScriptGenerator
+from digsilent_script_store import ScriptStore, shared_store
+
+
+def test_generators_share_one_store_per_folder(tmp_path):
+    root = str(tmp_path / 'scripts')
+    first = DIgSILENTScriptGenerator(root)
+    second = DIgSILENTScriptGenerator(os.path.join(root, '.'))
+
+    assert first.store is second.store is shared_store(root)
+    assert first.store.has_retention
+
+
+def test_content_addressed_reuse_touches_entry(tmp_path):
+    store = ScriptStore(str(tmp_path), max_scripts=2, max_age=None, prune_every=1)
+    path, reused = store.write('study', 'print(1)\n', content_addressed=True)
+    created = store.entries()[0]['created']
+    os.utime(path, (0, 0))
+
+    store.write('other', 'print(2)\n')
+    again, reused = store.write('study', 'print(1)\n', content_addressed=True)
+
+    assert again == path and reused
+    assert os.path.getmtime(path) > 0
+    entries = store.entries()
+    assert entries[-1]['path'] == os.path.basename(path)
+    assert entries[-1]['created'] >= created
+
+    # Skrip yang dipakai ulang jadi yang terbaru: skrip lain yang kena max_scripts
+    store.write('third', 'print(3)\n')
+    assert os.path.exists(path)
+    assert [entry['prefix'] for entry in store.entries()] == ['study', 'third']
+
+    with open(os.path.join(str(tmp_path), ScriptStore.INDEX_NAME)) as f:
+        assert json.loads(f.readlines()[-1])['prefix'] == 'third'
+
+
+def test_unrelated_files_survive_pruning(tmp_path):
+    old = 30 * 24 * 3600
+    tool = tmp_path / 'my_tool.py'
+    legacy = tmp_path / 'loadflow_20200101_120000.py'
+    for path in (tool, legacy):
+        path.write_text('print(0)\n')
+        os.utime(path, (os.path.getmtime(path) - old,) * 2)
+
+    generator = DIgSILENTScriptGenerator(store=ScriptStore(str(tmp_path), prune_every=1))
+    generator.generate_custom_script('probe', 'print(1)\n')
+    assert tool.exists() and legacy.exists()
+    assert [entry['path'] for entry in generator.store.entries()][0] == legacy.name
+
+    # Adopsi legacy hanya di-prune jika diminta; file lain tidak pernah di-index
+    store = ScriptStore(str(tmp_path), prune_adopted=True)
+    store.prune()
+    assert tool.exists() and not legacy.exists()
+    assert all(entry['path'] != tool.name for entry in store.entries())
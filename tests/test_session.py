@@ -0,0 +1,41 @@
+import sys
+
+from digsilent_executor import PowerFactorySession
+
+
+def test_generated_script_runs_in_session_with_fake_module(fake_pf, generator, executor):
+    assert 'powerfactory' not in sys.modules
+    script_path = generator.generate_load_flow_script(emit_voltages=True)
+
+    with PowerFactorySession(pf_module=fake_pf) as session:
+        calls = []
+        get_application = fake_pf.GetApplication
+        fake_pf.GetApplication = lambda: calls.append(1) or get_application()
+
+        result = executor.execute_with_results(script_path, method='powerfactory', session=session)
+
+    assert result.success
+    assert result.events('load_flow')[0]['error_code'] == 0
+    # Skrip memakai app dari session: tidak ada GetApplication() per skrip
+    assert calls == []
+    assert 'powerfactory' not in sys.modules
+
+
+def test_session_reuses_compiled_script(fake_pf, generator):
+    script_path = generator.generate_load_flow_script()
+
+    with PowerFactorySession(pf_module=fake_pf) as session:
+        assert session.execute(script_path)
+        assert session.execute(script_path)
+        assert session.execution_count == 2
+        assert session.connect_count == 1
+
+
+def test_session_call_function(fake_pf):
+    from digsilent_functions import list_outages
+
+    with PowerFactorySession(pf_module=fake_pf) as session:
+        outages = session.call(list_outages)
+
+    assert 'Line 0.ElmLne' in outages
+    assert 'Trafo 0.ElmTr2' in outages
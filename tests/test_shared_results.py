@@ -0,0 +1,41 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+ELEMENTS = {
+    "ElmTerm": ["loc_name", "m:u", "iUsage"],
+    "ElmLne": ["loc_name", "c:loading"],
+}
+
+
+def test_shared_export_retries_with_reported_capacity(fake_pf, fake_pf_env, generator, executor, capsys):
+    app = fake_pf.GetApplication()
+    n_terminals = len(app.GetCalcRelevantObjects("*.ElmTerm"))
+    lines = app.GetCalcRelevantObjects("*.ElmLne")
+    n_lines = len(lines)
+
+    result, arrays = executor.execute_shared_export(ELEMENTS, capacity=3, generator=generator, timeout=60)
+    try:
+        assert "retrying with" in capsys.readouterr().out
+        assert result.success
+        assert [p['status'] for p in result.events('shared_export')] == ['ok']
+
+        assert arrays.capacity("ElmTerm.m:u") == max(n_terminals, n_lines)
+        assert arrays.rows("ElmTerm.m:u") == n_terminals
+        assert arrays.rows("ElmLne.c:loading") == n_lines
+        assert arrays.array("ElmTerm.m:u").dtype == np.float64
+        assert np.all(arrays.array("ElmTerm.m:u") > 0)
+        assert arrays.array("ElmLne.c:loading").tolist() == [line.GetAttribute("c:loading") for line in lines]
+    finally:
+        arrays.close()
+
+
+def test_shared_export_fits_without_retry(fake_pf_env, generator, executor, capsys):
+    result, arrays = executor.execute_shared_export(ELEMENTS, capacity=100, generator=generator, timeout=60)
+    try:
+        assert "retrying" not in capsys.readouterr().out
+        assert result.success
+        assert arrays.capacity("ElmTerm.m:u") == 100
+        assert arrays.rows("ElmTerm.m:u") == 20
+    finally:
+        arrays.close()
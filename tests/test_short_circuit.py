@@ -0,0 +1,51 @@
+from digsilent_executor import PowerFactorySession
+from digsilent_functions import run_short_circuit_sweep
+from digsilent_results import load_short_circuit
+
+
+def test_missing_terminals_keep_their_rows(fake_pf):
+    app = fake_pf.GetApplication()
+    result = run_short_circuit_sweep(app, terminals=["Bus 3", "Nope", "Bus 1.ElmTerm"])
+
+    assert result["terminals"] == ["Bus 3", "Nope", "Bus 1"]
+    assert result["error_codes"] == [0, -1, 0]
+    assert result["ikss"][1] is None and result["ip"][1] is None
+    assert result["ikss"][0] < result["ikss"][2]
+
+    columns = load_short_circuit(result, use_numpy=False)
+    assert columns["ikss"][1] != columns["ikss"][1]     # NaN
+    assert list(columns["error_codes"]) == [0, -1, 0]
+
+
+def test_settings_restored_including_none_originals(fake_pf):
+    app = fake_pf.GetApplication()
+    shc = app.GetFromStudyCase("ComShc")
+    shc.SetAttribute("iopt_mde", 2)
+
+    run_short_circuit_sweep(app, terminals=["Bus 0", "Bus 5"], fault_type="spgf")
+
+    assert shc.GetAttribute("shc_term") is None
+    assert shc.GetAttribute("iopt_mde") == 2
+    assert shc.GetAttribute("iopt_shc") == "3psc"
+    assert shc.GetAttribute("iopt_allbus") == 0
+
+
+def test_options_cannot_override_sweep_mode(fake_pf):
+    app = fake_pf.GetApplication()
+    shc = app.GetFromStudyCase("ComShc")
+    seen = []
+    execute = shc.Execute
+
+    def spy():
+        seen.append((shc.GetAttribute("iopt_allbus"), shc.GetAttribute("iopt_mde"),
+                     shc.GetAttribute("iopt_asc")))
+        return execute()
+
+    shc.Execute = spy
+    options = {"iopt_allbus": 1, "iopt_mde": 3, "iopt_asc": 1}
+    with PowerFactorySession(pf_module=fake_pf) as session:
+        result = session.call(run_short_circuit_sweep, ["Bus 2", "Bus 4"], options=options)
+
+    # Mode subset tetap: satu Execute per terminal dengan iopt_allbus = 0
+    assert seen == [(0, 1, 1), (0, 1, 1)]
+    assert result["error_codes"] == [0, 0]
@@ -0,0 +1,35 @@
+import textwrap
+
+
+def test_streaming_delivers_generated_script_events(fake_pf_env, generator, executor):
+    script = generator.generate_load_flow_script()
+    seen = []
+
+    success = executor.execute_script_streaming(script,
+                                                on_line=lambda name, line, event: seen.append((name, event)))
+
+    assert success is True
+    events = [event for _, event in seen]
+    assert 'progress' in events
+    assert 'completed' in events
+    assert 'failed' not in events
+
+
+def test_lines_arrive_before_exit_and_callback_can_kill(tmp_path, executor):
+    script = tmp_path / 'runaway.py'
+    script.write_text(textwrap.dedent('''
+        import time
+        print("Progress: step 1")
+        time.sleep(30)
+        print("never reached")
+    '''))
+    lines = []
+
+    def on_line(stream_name, line, event):
+        lines.append(line)
+        return event != 'progress'
+
+    success = executor.execute_script_streaming(str(script), on_line=on_line, timeout=20)
+
+    assert success is False
+    assert lines == ["Progress: step 1"]
@@ -0,0 +1,35 @@
+from digsilent_sweep import ParameterSweep
+
+LOADING = ("Line 0.ElmLne", "c:loading")
+
+
+def test_sweep_resets_parameters_not_set_by_point(fake_pf):
+    app = fake_pf.GetApplication()
+    baseline = ParameterSweep(app, parameters={}, outputs=[LOADING]).run(points=[{}])[0]
+
+    sweep = ParameterSweep(app, parameters={}, outputs=[LOADING])
+    rows = sweep.run(points=[
+        {("Load 0.ElmLod", "scale0"): 3.0},
+        {("Load 1.ElmLod", "scale0"): 1.0},
+    ])
+
+    assert rows[0]['outputs'] != baseline['outputs']
+    # Titik kedua tidak boleh masih memakai scale0 Load 0 dari titik pertama
+    assert rows[1]['outputs'] == baseline['outputs']
+
+
+def test_sweep_restores_originals_and_reuses_cache(fake_pf, tmp_path):
+    app = fake_pf.GetApplication()
+    cache_path = str(tmp_path / 'sweep_cache.json')
+    parameters = {("Load 0.ElmLod", "scale0"): [0.5, 1.5], ("Line 3.ElmLne", "outserv"): [0, 1]}
+
+    first = ParameterSweep(app, parameters, outputs=[LOADING], cache_path=cache_path).run()
+    load = app.GetCalcRelevantObjects("Load 0.ElmLod")[0]
+    line = app.GetCalcRelevantObjects("Line 3.ElmLne")[0]
+    assert load.GetAttribute("scale0") == 1.0
+    assert line.GetAttribute("outserv") == 0
+
+    sweep = ParameterSweep(app, parameters, outputs=[LOADING], cache_path=cache_path)
+    second = sweep.run()
+    assert sweep.hits == 4 and sweep.misses == 0
+    assert [row['outputs'] for row in second] == [row['outputs'] for row in first]
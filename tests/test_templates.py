@@ -0,0 +1,16 @@
+from digsilent_templates import RESULT_CHANNEL_CODE, default_registry
+
+
+def test_result_channel_bound_once_at_registration():
+    template = default_registry.get('load_flow')
+
+    # result_channel sudah diisi partial() saat register, bukan default per render
+    assert 'result_channel' not in template.fields
+    assert 'result_channel' not in template.defaults
+    script = template.render(generated_at='now', study_case_code='')
+    assert RESULT_CHANNEL_CODE.strip().splitlines()[0] in script
+
+
+def test_shared_export_binds_shared_arrays():
+    template = default_registry.get('shared_export')
+    assert not {'result_channel', 'shared_arrays'} & set(template.fields)
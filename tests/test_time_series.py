@@ -0,0 +1,33 @@
+import os
+
+import pytest
+
+from digsilent_functions import run_time_series
+
+np = pytest.importorskip('numpy')
+
+TARGETS = [["Load 0.ElmLod", "scale0"]]
+OUTPUTS = [["Line 0.ElmLne", "c:loading"]]
+
+
+def test_regenerated_profile_does_not_resume_old_chunks(fake_pf, tmp_path):
+    app = fake_pf.GetApplication()
+    profile_path = str(tmp_path / 'profile.npy')
+    output_dir = str(tmp_path / 'out')
+
+    np.save(profile_path, np.full((6, 1), 1.0))
+    first = run_time_series(app, profile_path, TARGETS, OUTPUTS, output_dir, chunk_size=4)
+    assert first['resumed_from'] == 0
+
+    again = run_time_series(app, profile_path, TARGETS, OUTPUTS, output_dir, chunk_size=4)
+    assert again['resumed_from'] == 6
+
+    # Shape sama, isi berbeda: chunk lama tidak boleh dipakai
+    np.save(profile_path, np.full((6, 1), 5.0))
+    stat = os.stat(profile_path)
+    os.utime(profile_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    fresh = run_time_series(app, profile_path, TARGETS, OUTPUTS, output_dir, chunk_size=4)
+    assert fresh['resumed_from'] == 0
+
+    values = np.load(os.path.join(output_dir, 'values_00000.npy'))
+    assert values[0, 0] > 60.0
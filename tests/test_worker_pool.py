@@ -0,0 +1,60 @@
+import os
+import shutil
+
+import pytest
+
+from conftest import FAKE_PF_DIR
+from digsilent_worker_pool import WarmWorkerPool
+
+
+def engine_version(app):
+    # Import dengan nama asli, module worker di-preload dengan nama lain
+    import powerfactory
+    return powerfactory.GetApplication().GetVersion()
+
+
+def crash(app):
+    os._exit(3)
+
+
+@pytest.fixture
+def engine_dir(tmp_path):
+    """Fake engine dengan nama module selain 'powerfactory'"""
+    shutil.copy(os.path.join(FAKE_PF_DIR, 'powerfactory.py'), tmp_path / 'fake_engine.py')
+    return tmp_path
+
+
+def test_worker_binds_powerfactory_to_preloaded_module(engine_dir, generator):
+    script_path = generator.generate_load_flow_script()
+    with WarmWorkerPool(size=1, module_name='fake_engine', sys_path=[str(engine_dir)]) as pool:
+        assert pool.call(engine_version) == 'fake'
+        result = pool.run_script(script_path)
+    assert result.success
+    assert result.events('load_flow')[0]['error_code'] == 0
+
+
+def test_crashed_worker_is_replaced(engine_dir):
+    with WarmWorkerPool(size=1, module_name='fake_engine', sys_path=[str(engine_dir)],
+                        timeout=30) as pool:
+        pid = pool.stats()['workers'][0]['pid']
+        assert pool.call(crash) is None
+        stats = pool.stats()
+        assert stats['recycled'] == 1 and stats['size'] == 1
+        assert stats['workers'][0]['pid'] != pid
+        assert pool.call(engine_version) == 'fake'
+
+
+def test_pool_shrinks_when_replacement_cannot_start(engine_dir):
+    with WarmWorkerPool(size=2, module_name='fake_engine', sys_path=[str(engine_dir)],
+                        timeout=30) as pool:
+        os.remove(engine_dir / 'fake_engine.py')
+
+        assert pool.call(crash) is None
+        assert pool.stats()['size'] == 1
+        assert len(pool.stats()['workers']) == 1
+        assert pool.call(engine_version) == 'fake'
+
+        assert pool.call(crash) is None
+        assert pool.stats()['size'] == 0
+        with pytest.raises(RuntimeError):
+            pool.call(engine_version)